@@ -385,241 +385,244 @@ Examples:
         # Initialize MCP coordinator
         mcp = MCPCoordinator(settings)
         
-        # Set MCP mode
-        if args.mcp_mode == 'local':
-            mcp.intelligence_mode = 'LOCAL'
-        elif args.mcp_mode == 'ai' and (args.ai_key or settings.ai_config.get('openai_api_key') or settings.ai_config.get('deepseek_api_key')):
-            await mcp.initialize()
-        else:
-            await mcp.initialize()  # Auto mode
+        try:
+            # Set MCP mode
+            if args.mcp_mode == 'local':
+                mcp.intelligence_mode = 'LOCAL'
+            elif args.mcp_mode == 'ai' and (args.ai_key or settings.ai_config.get('openai_api_key') or settings.ai_config.get('deepseek_api_key')):
+                await mcp.initialize()
+            else:
+                await mcp.initialize()  # Auto mode
         
-        self.logger.info(f"MCP Intelligence Mode: {mcp.intelligence_mode}")
+            self.logger.info(f"MCP Intelligence Mode: {mcp.intelligence_mode}")
         
-        # Initialize scan engine
-        engine = DirsearchEngine(settings)
+            # Initialize scan engine
+            engine = DirsearchEngine(settings)
         
-        # Get URLs to scan
-        urls = []
-        if args.url:
-            urls.append(args.url)
-        elif args.url_list:
-            with open(args.url_list, 'r') as f:
-                urls.extend(line.strip() for line in f if line.strip())
+            # Get URLs to scan
+            urls = []
+            if args.url:
+                urls.append(args.url)
+            elif args.url_list:
+                with open(args.url_list, 'r') as f:
+                    urls.extend(line.strip() for line in f if line.strip())
         
-        if not urls:
-            self.logger.error("No target URLs specified")
-            return
+            if not urls:
+                self.logger.error("No target URLs specified")
+                return
         
-        # Process each URL
-        for url in urls:
-            if self.interrupted:
-                break
+            # Process each URL
+            for url in urls:
+                if self.interrupted:
+                    break
                 
-            self.logger.info(f"\nScanning target: {url}")
+                self.logger.info(f"\nScanning target: {url}")
             
-            try:
-                # Step 1: Target analysis
-                self.logger.info("Analyzing target...")
-                target_info = await mcp.analyze_target(url)
+                try:
+                    # Step 1: Target analysis
+                    self.logger.info("Analyzing target...")
+                    target_info = await mcp.analyze_target(url)
                 
-                # Log target information
-                self.logger.info(f"Server: {target_info.server_type}")
-                self.logger.info(f"Technologies: {', '.join(target_info.technology_stack)}")
-                if target_info.detected_cms:
-                    self.logger.info(f"CMS: {target_info.detected_cms}")
+                    # Log target information
+                    self.logger.info(f"Server: {target_info.server_type}")
+                    self.logger.info(f"Technologies: {', '.join(target_info.technology_stack)}")
+                    if target_info.detected_cms:
+                        self.logger.info(f"CMS: {target_info.detected_cms}")
                 
-                # Step 2: Generate scan plan
-                if args.smart:
-                    # Smart mode configuration
-                    self.logger.info("🧠 SMART MODE: Using intelligent discovery with rule-based optimization")
-                    params = {
-                        'threads': 20,
-                        'timeout': 15,
-                        'delay': 0,
-                        'user_agent': 'Mozilla/5.0 (compatible; Googlebot/2.1; +http://www.google.com/bot.html)',
-                        'follow_redirects': True
-                    }
-                    wordlist = 'critical-admin.txt'  # Located in wordlists root
-                    # TODO: Add support for multiple wordlists in CLI mode
-                    extensions = ['php', 'asp', 'aspx', 'jsp', 'html', 'json', 'xml', 'sql', 'zip', 'bak']
-                    args.recursive = True
-                    args.recursion_depth = 3
-                    args.include_status = '200,201,301,302,401,403,500'
+                    # Step 2: Generate scan plan
+                    if args.smart:
+                        # Smart mode configuration
+                        self.logger.info("🧠 SMART MODE: Using intelligent discovery with rule-based optimization")
+                        params = {
+                            'threads': 20,
+                            'timeout': 15,
+                            'delay': 0,
+                            'user_agent': 'Mozilla/5.0 (compatible; Googlebot/2.1; +http://www.google.com/bot.html)',
+                            'follow_redirects': True
+                        }
+                        wordlist = 'critical-admin.txt'  # Located in wordlists root
+                        # TODO: Add support for multiple wordlists in CLI mode
+                        extensions = ['php', 'asp', 'aspx', 'jsp', 'html', 'json', 'xml', 'sql', 'zip', 'bak']
+                        args.recursive = True
+                        args.recursion_depth = 3
+                        args.include_status = '200,201,301,302,401,403,500'
                     
-                elif args.monster:
-                    # Monster mode configuration
-                    self.logger.warning("👹 MONSTER MODE: Using EXTREMELY aggressive settings for maximum discovery")
-                    if not args.quiet:
-                        print("\n⚠️  WARNING: Monster mode generates MASSIVE traffic!")
-                        print("👹 Only unleash the monster with explicit permission!\n")
+                    elif args.monster:
+                        # Monster mode configuration
+                        self.logger.warning("👹 MONSTER MODE: Using EXTREMELY aggressive settings for maximum discovery")
+                        if not args.quiet:
+                            print("\n⚠️  WARNING: Monster mode generates MASSIVE traffic!")
+                            print("👹 Only unleash the monster with explicit permission!\n")
                     
-                    params = {
-                        'threads': 50,  # Maximum threads
-                        'timeout': 30,  # Extended timeout
-                        'delay': 0,     # No delay
-                        'user_agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
-                        'follow_redirects': True
-                    }
-                    wordlist = 'general/monster-all.txt'  # Full path with subdirectory
-                    extensions = [
-                        'php', 'html', 'htm', 'asp', 'aspx', 'jsp', 'jspx', 'do', 'action',
-                        'pl', 'cgi', 'py', 'rb', 'js', 'css', 'xml', 'json', 'yaml', 'yml',
-                        'txt', 'log', 'md', 'conf', 'config', 'ini', 'env', 'properties',
-                        'bak', 'backup', 'old', 'orig', 'save', 'swp', 'tmp', 'temp',
-                        'zip', 'tar', 'gz', 'rar', '7z', 'sql', 'db', 'sqlite'
-                    ]
-                    args.recursive = True
-                    args.recursion_depth = 5
-                    args.exclude_status = ''  # Don't exclude any status
-                    args.max_retries = 5
+                        params = {
+                            'threads': 50,  # Maximum threads
+                            'timeout': 30,  # Extended timeout
+                            'delay': 0,     # No delay
+                            'user_agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
+                            'follow_redirects': True
+                        }
+                        wordlist = 'general/monster-all.txt'  # Full path with subdirectory
+                        extensions = [
+                            'php', 'html', 'htm', 'asp', 'aspx', 'jsp', 'jspx', 'do', 'action',
+                            'pl', 'cgi', 'py', 'rb', 'js', 'css', 'xml', 'json', 'yaml', 'yml',
+                            'txt', 'log', 'md', 'conf', 'config', 'ini', 'env', 'properties',
+                            'bak', 'backup', 'old', 'orig', 'save', 'swp', 'tmp', 'temp',
+                            'zip', 'tar', 'gz', 'rar', '7z', 'sql', 'db', 'sqlite'
+                        ]
+                        args.recursive = True
+                        args.recursion_depth = 5
+                        args.exclude_status = ''  # Don't exclude any status
+                        args.max_retries = 5
                     
-                elif args.quick:
-                    self.logger.info("Generating optimized scan plan...")
-                    scan_plan = await mcp.generate_scan_plan(target_info)
+                    elif args.quick:
+                        self.logger.info("Generating optimized scan plan...")
+                        scan_plan = await mcp.generate_scan_plan(target_info)
                     
-                    # Get optimized parameters
-                    params = await mcp.optimize_parameters(target_info)
-                    wordlist = scan_plan[0].parameters.get('wordlist', args.wordlist)
-                    extensions = scan_plan[0].parameters.get('extensions', [])
-                else:
-                    # Use manual parameters
-                    params = {
-                        'threads': args.threads,
-                        'timeout': args.timeout,
-                        'delay': args.delay,
-                        'user_agent': args.user_agent or settings.default_scan_config.get('user_agent'),
-                        'follow_redirects': args.follow_redirects
-                    }
-                    wordlist = args.wordlist
-                    extensions = args.extensions.split(',') if args.extensions else []
+                        # Get optimized parameters
+                        params = await mcp.optimize_parameters(target_info)
+                        wordlist = scan_plan[0].parameters.get('wordlist', args.wordlist)
+                        extensions = scan_plan[0].parameters.get('extensions', [])
+                    else:
+                        # Use manual parameters
+                        params = {
+                            'threads': args.threads,
+                            'timeout': args.timeout,
+                            'delay': args.delay,
+                            'user_agent': args.user_agent or settings.default_scan_config.get('user_agent'),
+                            'follow_redirects': args.follow_redirects
+                        }
+                        wordlist = args.wordlist
+                        extensions = args.extensions.split(',') if args.extensions else []
                 
-                # Step 3: Execute scan
-                self.logger.info(f"Starting scan with {params['threads']} threads...")
+                    # Step 3: Execute scan
+                    self.logger.info(f"Starting scan with {params['threads']} threads...")
                 
-                # Parse custom headers
-                custom_headers = {}
-                if args.headers:
-                    try:
-                        custom_headers = json.loads(args.headers)
-                    except json.JSONDecodeError:
-                        self.logger.warning("Invalid headers format, ignoring")
+                    # Parse custom headers
+                    custom_headers = {}
+                    if args.headers:
+                        try:
+                            custom_headers = json.loads(args.headers)
+                        except json.JSONDecodeError:
+                            self.logger.warning("Invalid headers format, ignoring")
                 
-                scan_request = ScanRequest(
-                    base_url=url,
-                    wordlist=wordlist,
-                    extensions=extensions,
-                    threads=params['threads'],
-                    timeout=params['timeout'],
-                    delay=params.get('delay', 0),
-                    user_agent=params['user_agent'],
-                    follow_redirects=params.get('follow_redirects', False),
-                    custom_headers=custom_headers,
-                    proxy=args.proxy,
-                    max_retries=args.max_retries,
-                    exclude_status=args.exclude_status,
-                    include_status=args.include_status,
-                    recursive=not args.no_recursive,  # True by default, False if --no-recursive
-                    recursion_depth=args.recursion_depth
-                )
+                    scan_request = ScanRequest(
+                        base_url=url,
+                        wordlist=wordlist,
+                        extensions=extensions,
+                        threads=params['threads'],
+                        timeout=params['timeout'],
+                        delay=params.get('delay', 0),
+                        user_agent=params['user_agent'],
+                        follow_redirects=params.get('follow_redirects', False),
+                        custom_headers=custom_headers,
+                        proxy=args.proxy,
+                        max_retries=args.max_retries,
+                        exclude_status=args.exclude_status,
+                        include_status=args.include_status,
+                        recursive=not args.no_recursive,  # True by default, False if --no-recursive
+                        recursion_depth=args.recursion_depth
+                    )
                 
-                # Execute scan
-                self.current_engine = engine
-                try:
-                    scan_response = await engine.execute_scan(scan_request)
-                finally:
-                    self.current_engine = None
+                    # Execute scan
+                    self.current_engine = engine
+                    try:
+                        scan_response = await engine.execute_scan(scan_request)
+                    finally:
+                        self.current_engine = None
                 
-                # Log results
-                self.logger.info(f"\nScan completed:")
-                self.logger.info(f"Total requests: {scan_response.statistics['total_requests']}")
-                self.logger.info(f"Found paths: {scan_response.statistics['found_paths']}")
-                self.logger.info(f"Errors: {scan_response.statistics.get('errors', 0)}")
+                    # Log results
+                    self.logger.info(f"\nScan completed:")
+                    self.logger.info(f"Total requests: {scan_response.statistics['total_requests']}")
+                    self.logger.info(f"Found paths: {scan_response.statistics['found_paths']}")
+                    self.logger.info(f"Errors: {scan_response.statistics.get('errors', 0)}")
                 
-                # Display results (limited to 20 lines)
-                if scan_response.results and not args.quiet:
-                    self.logger.info("\nDiscovered paths:")
-                    sorted_results = sorted(scan_response.results, key=lambda x: (x['status'], x['path']))
+                    # Display results (limited to 20 lines)
+                    if scan_response.results and not args.quiet:
+                        self.logger.info("\nDiscovered paths:")
+                        sorted_results = sorted(scan_response.results, key=lambda x: (x['status'], x['path']))
                     
-                    # Group by status code for better display
-                    status_groups = {}
-                    for result in sorted_results:
-                        status = result['status']
-                        if status not in status_groups:
-                            status_groups[status] = []
-                        status_groups[status].append(result)
+                        # Group by status code for better display
+                        status_groups = {}
+                        for result in sorted_results:
+                            status = result['status']
+                            if status not in status_groups:
+                                status_groups[status] = []
+                            status_groups[status].append(result)
                     
-                    # Display up to 20 lines total
-                    lines_shown = 0
-                    max_lines = 20
+                        # Display up to 20 lines total
+                        lines_shown = 0
+                        max_lines = 20
                     
-                    for status in sorted(status_groups.keys()):
-                        if lines_shown >= max_lines:
-                            break
+                        for status in sorted(status_groups.keys()):
+                            if lines_shown >= max_lines:
+                                break
                         
-                        items = status_groups[status]
-                        self.logger.info(f"\n  [{status}] Status Code - {len(items)} found:")
-                        lines_shown += 1
-                        
-                        # Show up to remaining lines for this status
-                        items_to_show = min(len(items), max_lines - lines_shown)
-                        for i, result in enumerate(items[:items_to_show]):
-                            self.logger.info(f"    • {result['path']} - {result['size']} bytes")
+                            items = status_groups[status]
+                            self.logger.info(f"\n  [{status}] Status Code - {len(items)} found:")
                             lines_shown += 1
                         
-                        if len(items) > items_to_show:
-                            self.logger.info(f"    ... and {len(items) - items_to_show} more")
-                            lines_shown += 1
+                            # Show up to remaining lines for this status
+                            items_to_show = min(len(items), max_lines - lines_shown)
+                            for i, result in enumerate(items[:items_to_show]):
+                                self.logger.info(f"    • {result['path']} - {result['size']} bytes")
+                                lines_shown += 1
+                        
+                            if len(items) > items_to_show:
+                                self.logger.info(f"    ... and {len(items) - items_to_show} more")
+                                lines_shown += 1
                     
-                    # Show summary if results were truncated
-                    if len(sorted_results) > max_lines:
-                        self.logger.info(f"\n  (Showing {min(lines_shown, max_lines)} of {len(sorted_results)} total results)")
+                        # Show summary if results were truncated
+                        if len(sorted_results) > max_lines:
+                            self.logger.info(f"\n  (Showing {min(lines_shown, max_lines)} of {len(sorted_results)} total results)")
                 
-                # Step 4: Generate report
-                if args.report_format:
-                    self.logger.info(f"\nGenerating {args.report_format} report...")
+                    # Step 4: Generate report
+                    if args.report_format:
+                        self.logger.info(f"\nGenerating {args.report_format} report...")
                     
-                    reporter = ReportGenerator(args.output_dir)
+                        reporter = ReportGenerator(args.output_dir)
                     
-                    # Prepare scan data
-                    scan_data = {
-                        'target_url': url,
-                        'target_domain': target_info.domain if target_info.domain else urlparse(url).netloc,
-                        'start_time': scan_response.statistics.get('start_time', ''),
-                        'end_time': scan_response.statistics.get('end_time', ''),
-                        'duration': scan_response.statistics.get('duration', 0),
-                        'intelligence_mode': mcp.intelligence_mode,
-                        'target_analysis': {
-                            'server_type': target_info.server_type,
-                            'technology_stack': target_info.technology_stack,
-                            'detected_cms': target_info.detected_cms,
-                            'security_headers': target_info.security_headers
-                        },
-                        'scan_results': [{
-                            'task_id': 'cli_scan',
-                            'status': 'completed',
-                            'findings': scan_response.results,
-                            'metrics': scan_response.statistics,
-                            'timestamp': scan_response.statistics.get('end_time', '')
-                        }],
-                        'performance_metrics': {
-                            'total_requests': scan_response.statistics['total_requests'],
-                            'found_paths': scan_response.statistics['found_paths'],
-                            'errors': scan_response.statistics.get('errors', 0),
-                            'requests_per_second': scan_response.statistics.get('requests_per_second', 0)
+                        # Prepare scan data
+                        scan_data = {
+                            'target_url': url,
+                            'target_domain': target_info.domain if target_info.domain else urlparse(url).netloc,
+                            'start_time': scan_response.statistics.get('start_time', ''),
+                            'end_time': scan_response.statistics.get('end_time', ''),
+                            'duration': scan_response.statistics.get('duration', 0),
+                            'intelligence_mode': mcp.intelligence_mode,
+                            'target_analysis': {
+                                'server_type': target_info.server_type,
+                                'technology_stack': target_info.technology_stack,
+                                'detected_cms': target_info.detected_cms,
+                                'security_headers': target_info.security_headers
+                            },
+                            'scan_results': [{
+                                'task_id': 'cli_scan',
+                                'status': 'completed',
+                                'findings': scan_response.results,
+                                'metrics': scan_response.statistics,
+                                'timestamp': scan_response.statistics.get('end_time', '')
+                            }],
+                            'performance_metrics': {
+                                'total_requests': scan_response.statistics['total_requests'],
+                                'found_paths': scan_response.statistics['found_paths'],
+                                'errors': scan_response.statistics.get('errors', 0),
+                                'requests_per_second': scan_response.statistics.get('requests_per_second', 0)
+                            }
                         }
-                    }
                     
-                    report_files = reporter.generate_report(scan_data, format=args.report_format)
+                        report_files = reporter.generate_report(scan_data, format=args.report_format)
                     
-                    self.logger.info("Reports saved:")
-                    for format_type, file_path in report_files.items():
-                        self.logger.info(f"  {format_type.upper()}: {file_path}")
+                        self.logger.info("Reports saved:")
+                        for format_type, file_path in report_files.items():
+                            self.logger.info(f"  {format_type.upper()}: {file_path}")
                 
-            except Exception as e:
-                self.logger.error(f"Error scanning {url}: {e}")
-                if args.verbose:
-                    import traceback
-                    traceback.print_exc()
+                except Exception as e:
+                    self.logger.error(f"Error scanning {url}: {e}")
+                    if args.verbose:
+                        import traceback
+                        traceback.print_exc()
+        finally:
+            await mcp.close()
         
         self.logger.info("\nAll scans completed")
     
@@ -4,6 +4,27 @@ from setuptools import setup, find_packages
 with open("requirements.txt") as f:
     requirements = [line.strip() for line in f if line.strip() and not line.startswith("#")]
 
+# Optional accelerators (pip install .[fast]); every one has a pure Python fallback
+fast_requirements = [
+    "pybloom-live>=4.0.0",  # Bloom filter dedup for large deep-analysis runs
+    "pyahocorasick>=2.0.0",  # Single-pass literal matching for scanner rules
+    "orjson>=3.8.0",  # Faster JSON encoding/decoding
+    "xxhash>=3.0.0",  # Faster AI response cache keys
+    "hyperscan>=0.4.0",  # Single-pass CMS fingerprinting
+]
+
+# Optional: compile the rule-matching hot path with mypyc
+# (DIRSEARCH_MYPYC=1 pip install .); falls back to pure Python otherwise
+ext_modules = []
+if os.environ.get("DIRSEARCH_MYPYC") == "1":
+    try:
+        from mypyc.build import mypycify
+    except ImportError:
+        print("mypyc not installed, building pure Python package")
+    else:
+        os.environ.setdefault("MYPYPATH", "src")
+        ext_modules = mypycify(["--explicit-package-bases", "src/core/intelligent_scanner.py"])
+
 setup(
     name="dirsearch-mcp",
     version="1.0.0",
@@ -15,6 +36,7 @@ setup(
     url="https://github.com/dirsearch-mcp/dirsearch-mcp",
     packages=find_packages(where="src"),
     package_dir={"": "src"},
+    ext_modules=ext_modules,
     classifiers=[
         "Development Status :: 4 - Beta",
         "Intended Audience :: Information Technology",
@@ -32,6 +54,7 @@ setup(
     ],
     python_requires=">=3.8",
     install_requires=requirements,
+    extras_require={"fast": fast_requirements},
     entry_points={
         "console_scripts": [
             "dirsearch-mcp=cli.interactive_menu:main",
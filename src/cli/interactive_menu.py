@@ -132,6 +132,9 @@ class InteractiveMenu:
         except Exception as e:
             self.console.print(f"[red]Error: {e}[/red]")
             self._handle_exit()
+        finally:
+            # Release the coordinator's shared HTTP session and disk cache
+            await self.mcp_coordinator.close()
     
     async def _initialize(self):
         """Initialize MCP coordinator"""
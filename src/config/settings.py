@@ -60,6 +60,7 @@ class Settings:
             'max_concurrent_requests': 100,
             'connection_pool_size': 100,
             'request_queue_size': 1000,
+            'max_concurrent_tasks': 4,  # Scan plan tasks run at once per priority tier
             'progress_update_interval': 0.5
         }
         
@@ -69,6 +70,7 @@ class Settings:
             'confidence_threshold': 0.7,
             'enable_learning': True,
             'cache_ai_responses': True,
+            'ai_cache_ttl': 86400,  # Seconds a persisted AI response stays valid
             'ai_timeout': 30
         }
         
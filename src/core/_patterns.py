@@ -0,0 +1,74 @@
+"""
+Shared regex patterns for content crawling and endpoint extraction
+All patterns are compiled once at import time and reused by every scan
+"""
+
+import re
+
+
+_FLAGS = re.IGNORECASE | re.MULTILINE
+
+# Endpoint extraction patterns shared by crawling and deep content analysis
+ENDPOINT_PATTERNS = tuple(re.compile(p, _FLAGS) for p in (
+    # API endpoints
+    r'/api/v?\d*/[a-zA-Z0-9_\-/]+',
+    r'/v\d+/[a-zA-Z0-9_\-/]+',
+    r'/graphql[a-zA-Z0-9_\-/]*',
+    r'/rest/[a-zA-Z0-9_\-/]+',
+
+    # File paths
+    r'/[a-zA-Z0-9_\-]+\.(?:php|asp|aspx|jsp|do|action|html|htm|js|json|xml)',
+    r'/[a-zA-Z0-9_\-]+/[a-zA-Z0-9_\-]+\.(?:php|asp|aspx|jsp|do|action)',
+
+    # Directory paths
+    r'/[a-zA-Z0-9_\-]+/[a-zA-Z0-9_\-]+/?',
+    r'/[a-zA-Z0-9_\-]+/[a-zA-Z0-9_\-]+/[a-zA-Z0-9_\-]+/?',
+
+    # URLs in JavaScript
+    r'["\'](/[a-zA-Z0-9_\-/.]+)["\']',
+    r'url\s*\(\s*["\']?(/[^"\')\s]+)',
+    r'(?:href|src|action|data-url|data-src)\s*=\s*["\']([^"\']+)["\']',
+
+    # AJAX/Fetch endpoints
+    r'fetch\s*\(\s*["\']([^"\']+)["\']',
+    r'\.ajax\s*\(\s*{\s*url\s*:\s*["\']([^"\']+)["\']',
+    r'XMLHttpRequest.*?open\s*\(\s*["\'][A-Z]+["\']\s*,\s*["\']([^"\']+)["\']',
+
+    # Form actions
+    r'<form[^>]+action\s*=\s*["\']([^"\']+)["\']',
+
+    # Comments might contain endpoints
+    r'<!--.*?(/[a-zA-Z0-9_\-/.]+).*?-->',
+    r'/\*.*?(/[a-zA-Z0-9_\-/.]+).*?\*/',
+
+    # Configuration patterns
+    r'(?:baseurl|base_url|apiurl|api_url|endpoint)\s*[:=]\s*["\']([^"\']+)["\']',
+
+    # Import/Include statements
+    r'(?:import|include|require)(?:_once)?\s*\(?["\']([^"\']+)["\']',
+))
+
+# Dynamic endpoints declared in JavaScript sources
+JS_PATTERNS = tuple(re.compile(p) for p in (
+    r'["\']([a-zA-Z0-9_\-]+(?:/[a-zA-Z0-9_\-]+)+)["\']',
+    r'endpoint\s*:\s*["\']([^"\']+)["\']',
+    r'route\s*:\s*["\']([^"\']+)["\']',
+))
+
+# Hidden/debug endpoints
+DEBUG_PATTERNS = tuple(re.compile(p, re.IGNORECASE) for p in (
+    r'(?:debug|test|dev|staging)[_\-]?(?:url|endpoint|api).*?["\']([^"\']+)["\']',
+    r'/(?:debug|test|dev|admin|backup|old|temp|tmp)/[a-zA-Z0-9_\-]+',
+))
+
+# Meta tags and link headers
+META_PATTERNS = tuple(re.compile(p) for p in (
+    r'<meta[^>]+content\s*=\s*["\']([^"\']+)["\'][^>]*>',
+    r'<link[^>]+href\s*=\s*["\']([^"\']+)["\'][^>]*>',
+))
+
+# Generic URL attributes in non-HTML text
+CRAWL_URL_RE = re.compile(r'(?:href|src|action)=["\']?([^"\'>\s]+)')
+
+# Characters outside the usual path alphabet (used to drop false positives)
+SPECIAL_CHARS_RE = re.compile(r'[^a-zA-Z0-9_\-/.]')
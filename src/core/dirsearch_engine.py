@@ -2,7 +2,7 @@ import asyncio
 import threading
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Dict, List, Optional, Callable, Any, Set, Tuple
-from dataclasses import dataclass, field, asdict
+from dataclasses import dataclass, field, asdict, replace
 from urllib.parse import urljoin, urlparse, unquote
 import time
 import re
@@ -32,14 +32,35 @@ try:
 except ImportError:
     NTLMAuth = None
 try:
-    from bs4 import BeautifulSoup
+    from bs4 import BeautifulSoup, SoupStrainer
 except ImportError:
     BeautifulSoup = None
+    SoupStrainer = None
+try:
+    from pybloom_live import ScalableBloomFilter
+except ImportError:
+    ScalableBloomFilter = None
 
 from .intelligent_scanner import IntelligentScanner
+from ._patterns import (
+    ENDPOINT_PATTERNS, JS_PATTERNS, DEBUG_PATTERNS, META_PATTERNS,
+    CRAWL_URL_RE, SPECIAL_CHARS_RE
+)
 from ..utils.debug_monitor import DebugMonitor, DebugMonitorIntegration, EventType
 
 
+def _content_type(response_data: Dict[str, Any]) -> str:
+    """Get the content-type header of a response dict without allocating defaults"""
+    headers = response_data.get('headers')
+    return headers.get('content-type', '') if headers else ''
+
+
+@lru_cache(maxsize=256)
+def _netloc(url: str) -> str:
+    """Network location of a URL (cached, base URLs repeat for every crawled link)"""
+    return urlparse(url).netloc
+
+
 class DynamicContentParser:
     """Parser for detecting dynamic content in responses"""
     
@@ -162,6 +183,7 @@ class ScanResponse:
     start_time: Optional[str] = None
     end_time: Optional[str] = None
     duration: Optional[float] = None
+    total_paths: int = 0  # Size of the combined wordlist that was scanned
 
 
 @dataclass
@@ -229,6 +251,7 @@ class DirsearchEngine:
         self._deep_scanned_dirs = set()
         self._deep_analyzed_endpoints = set()
         self._recursive_scan_queue = set()
+        self._seen_paths = self._new_seen_paths_filter()
         
         # Default configuration
         self.config = settings.default_scan_config if settings else {
@@ -326,6 +349,7 @@ class DirsearchEngine:
         # Reset recursive scan tracking
         self._deep_scanned_dirs.clear()
         self._deep_analyzed_endpoints.clear()
+        self._seen_paths = self._new_seen_paths_filter()
         self._recursive_scan_queue.clear()
         
         # Store original wordlist for recursive scanning
@@ -776,7 +800,7 @@ class DirsearchEngine:
             return True
             
         # Check content type - directories often have text/html
-        content_type = response_data.get('headers', {}).get('content-type', '')
+        content_type = _content_type(response_data)
         
         # If path has no extension and returns HTML or gets 403, likely a directory
         path_parts = path.split('/')
@@ -1138,6 +1162,14 @@ class DirsearchEngine:
             self._deep_scanned_dirs.clear()
             self._deep_analyzed_endpoints.clear()
             self._recursive_scan_queue.clear()
+            self._seen_paths = self._new_seen_paths_filter()
+    
+    @staticmethod
+    def _new_seen_paths_filter():
+        """Create the dedup filter for extracted paths (Bloom filter when available)"""
+        if ScalableBloomFilter:
+            return ScalableBloomFilter(initial_capacity=100_000, error_rate=1e-6)
+        return set()
     
     def _analyze_and_expand(self, result: ScanResult):
         """Analyze discovered path and expand wordlist intelligently"""
@@ -1345,7 +1377,8 @@ class DirsearchEngine:
             statistics=statistics,
             start_time=start_time.isoformat(),
             end_time=end_time.isoformat(),
-            duration=duration
+            duration=duration,
+            total_paths=len(wordlist_paths)
         )
     
     def _load_wordlist(self, wordlist_path: str) -> List[str]:
@@ -1563,9 +1596,10 @@ class DirsearchEngine:
         # For 403 wildcards, check size matching
         if status_code == 403 and 'size' in wc_data:
             # If size matches wildcard size, it's likely a false positive
-            if response_data['size'] == wc_data['size']:
+            size = response_data['size']
+            if size == wc_data['size']:
                 if self.logger:
-                    self.logger.debug(f"Filtering 403 wildcard response: {response_data.get('path')} (size: {response_data['size']})")
+                    self.logger.debug(f"Filtering 403 wildcard response: {response_data.get('path')} (size: {size})")
                 return True
         
         # Check content similarity with parser
@@ -1588,12 +1622,55 @@ class DirsearchEngine:
         
         return False
     
+    def _crawl_html(self, content: str, response_data: Dict[str, Any], base_url: str, discovered_paths: Set[str]):
+        """Extract links from HTML tag attributes"""
+        if not BeautifulSoup:
+            return
+        try:
+            soup = BeautifulSoup(content, 'html.parser', parse_only=SoupStrainer(self._CRAWL_TAGS))
+            
+            # Extract from common attributes
+            for element in soup.find_all(self._CRAWL_TAGS):
+                for attr in ('href', 'src', 'action'):
+                    value = element.get(attr)
+                    if value:
+                        # Clean and normalize path
+                        path = self._normalize_crawled_path(value, base_url)
+                        if path:
+                            discovered_paths.add(path)
+        except Exception as e:
+            if self.logger:
+                self.logger.debug(f"HTML parsing error: {e}")
+    
+    def _crawl_text(self, content: str, response_data: Dict[str, Any], base_url: str, discovered_paths: Set[str]):
+        """Parse robots.txt rules, otherwise fall back to generic URL extraction"""
+        if response_data.get('path') != 'robots.txt':
+            self._crawl_generic(content, response_data, base_url, discovered_paths)
+            return
+        for line in content.split('\n'):
+            if line.startswith(('Allow:', 'Disallow:')):
+                path = line.split(':', 1)[1].strip()
+                if path and path != '/':
+                    discovered_paths.add(path.lstrip('/'))
+    
+    def _crawl_generic(self, content: str, response_data: Dict[str, Any], base_url: str, discovered_paths: Set[str]):
+        """Find URL attributes in arbitrary text"""
+        for match in CRAWL_URL_RE.findall(content):
+            path = self._normalize_crawled_path(match, base_url)
+            if path:
+                discovered_paths.add(path)
+    
+    _CRAWL_TAGS = ['a', 'script', 'link', 'img', 'form']
+    
+    # Crawl handler per media type (parameters stripped); anything else is crawled as generic text
+    _CRAWL_HANDLERS = {
+        'text/html': _crawl_html,
+        'application/xhtml+xml': _crawl_html,
+        'text/plain': _crawl_text,
+    }
+    
     async def _crawl_response(self, response_data: Dict[str, Any], base_url: str) -> List[str]:
         """Crawl response to find new paths"""
-        if not BeautifulSoup:
-            return []
-        
-        content_type = response_data.get('headers', {}).get('content-type', '')
         content = response_data.get('text', '')
         
         if not content:
@@ -1601,60 +1678,15 @@ class DirsearchEngine:
         
         discovered_paths = set()
         
-        # HTML crawling
-        if 'text/html' in content_type:
-            try:
-                soup = BeautifulSoup(content, 'html.parser')
-                
-                # Extract from common attributes
-                for tag in ['a', 'script', 'link', 'img', 'form']:
-                    for element in soup.find_all(tag):
-                        for attr in ['href', 'src', 'action']:
-                            value = element.get(attr)
-                            if value:
-                                # Clean and normalize path
-                                path = self._normalize_crawled_path(value, base_url)
-                                if path:
-                                    discovered_paths.add(path)
-            except Exception as e:
-                if self.logger:
-                    self.logger.debug(f"HTML parsing error: {e}")
-        
-        # robots.txt parsing
-        elif response_data.get('path') == 'robots.txt':
-            for line in content.split('\n'):
-                if line.startswith(('Allow:', 'Disallow:')):
-                    path = line.split(':', 1)[1].strip()
-                    if path and path != '/':
-                        discovered_paths.add(path.lstrip('/'))
-        
-        # General text crawling for URLs
-        else:
-            # Find URLs in text
-            url_pattern = re.compile(r'(?:href|src|action)=["\']?([^"\'>\s]+)')
-            for match in url_pattern.findall(content):
-                path = self._normalize_crawled_path(match, base_url)
-                if path:
-                    discovered_paths.add(path)
-        
-        # Advanced endpoint extraction using regex patterns
-        endpoint_patterns = [
-            # API endpoints
-            r'/api/[a-zA-Z0-9_\-/]+',
-            r'/v[0-9]+/[a-zA-Z0-9_\-/]+',
-            # PHP files
-            r'/[a-zA-Z0-9_\-]+\.php',
-            # Common paths
-            r'/[a-zA-Z]+/[a-zA-Z0-9_\-]+',
-            # JavaScript paths
-            r'["\'](/[a-zA-Z0-9_\-/.]+)["\']',
-            # URL in comments
-            r'<!--.*?(/[a-zA-Z0-9_\-/.]+).*?-->',
-        ]
+        media_type = _content_type(response_data).partition(';')[0].strip().lower()
+        if media_type not in self._CRAWL_HANDLERS and response_data.get('path') == 'robots.txt':
+            media_type = 'text/plain'
+        handler = self._CRAWL_HANDLERS.get(media_type, DirsearchEngine._crawl_generic)
+        handler(self, content, response_data, base_url, discovered_paths)
         
-        for pattern in endpoint_patterns:
-            matches = re.findall(pattern, content)
-            for match in matches:
+        # Advanced endpoint extraction using the shared pattern set
+        for pattern in ENDPOINT_PATTERNS:
+            for match in pattern.findall(content):
                 if isinstance(match, str) and match.startswith('/'):
                     path = self._normalize_crawled_path(match, base_url)
                     if path:
@@ -1673,106 +1705,37 @@ class DirsearchEngine:
                 return []
                 
             content = response['text']
-            content_type = response.get('headers', {}).get('content-type', '')
+            content_type = _content_type(response)
             
             # 1. Enhanced regex patterns for endpoint extraction
-            endpoint_patterns = [
-                # API endpoints
-                r'/api/v?\d*/[a-zA-Z0-9_\-/]+',
-                r'/v\d+/[a-zA-Z0-9_\-/]+',
-                r'/graphql[a-zA-Z0-9_\-/]*',
-                r'/rest/[a-zA-Z0-9_\-/]+',
-                
-                # File paths
-                r'/[a-zA-Z0-9_\-]+\.(?:php|asp|aspx|jsp|do|action|html|htm|js|json|xml)',
-                r'/[a-zA-Z0-9_\-]+/[a-zA-Z0-9_\-]+\.(?:php|asp|aspx|jsp|do|action)',
-                
-                # Directory paths
-                r'/[a-zA-Z0-9_\-]+/[a-zA-Z0-9_\-]+/?',
-                r'/[a-zA-Z0-9_\-]+/[a-zA-Z0-9_\-]+/[a-zA-Z0-9_\-]+/?',
-                
-                # URLs in JavaScript
-                r'["\'](/[a-zA-Z0-9_\-/.]+)["\']',
-                r'url\s*\(\s*["\']?(/[^"\')\s]+)',
-                r'(?:href|src|action|data-url|data-src)\s*=\s*["\']([^"\']+)["\']',
-                
-                # AJAX/Fetch endpoints
-                r'fetch\s*\(\s*["\']([^"\']+)["\']',
-                r'\.ajax\s*\(\s*{\s*url\s*:\s*["\']([^"\']+)["\']',
-                r'XMLHttpRequest.*?open\s*\(\s*["\'][A-Z]+["\']\s*,\s*["\']([^"\']+)["\']',
-                
-                # Form actions
-                r'<form[^>]+action\s*=\s*["\']([^"\']+)["\']',
-                
-                # Comments might contain endpoints
-                r'<!--.*?(/[a-zA-Z0-9_\-/.]+).*?-->',
-                r'/\*.*?(/[a-zA-Z0-9_\-/.]+).*?\*/',
-                
-                # Configuration patterns
-                r'(?:baseurl|base_url|apiurl|api_url|endpoint)\s*[:=]\s*["\']([^"\']+)["\']',
-                
-                # Import/Include statements
-                r'(?:import|include|require)(?:_once)?\s*\(?["\']([^"\']+)["\']',
-            ]
-            
-            # Extract using all patterns
-            for pattern in endpoint_patterns:
-                try:
-                    matches = re.findall(pattern, content, re.IGNORECASE | re.MULTILINE)
-                    for match in matches:
-                        if isinstance(match, str) and match.startswith('/'):
-                            # Clean and normalize the path
-                            clean_path = match.strip()
-                            # Remove query strings and fragments
-                            clean_path = clean_path.split('?')[0].split('#')[0]
-                            if clean_path and clean_path != '/':
-                                extracted_paths.add(clean_path.lstrip('/'))
-                except:
-                    continue
+            for pattern in ENDPOINT_PATTERNS:
+                for match in pattern.findall(content):
+                    if isinstance(match, str) and match.startswith('/'):
+                        # Clean and normalize the path
+                        clean_path = match.strip()
+                        # Remove query strings and fragments
+                        clean_path = clean_path.split('?')[0].split('#')[0]
+                        if clean_path and clean_path != '/':
+                            extracted_paths.add(clean_path.lstrip('/'))
             
             # 2. Parse JavaScript for dynamic endpoints
             if 'javascript' in content_type or '.js' in url:
-                js_patterns = [
-                    r'["\']([a-zA-Z0-9_\-]+(?:/[a-zA-Z0-9_\-]+)+)["\']',
-                    r'endpoint\s*:\s*["\']([^"\']+)["\']',
-                    r'route\s*:\s*["\']([^"\']+)["\']',
-                ]
-                for pattern in js_patterns:
-                    try:
-                        matches = re.findall(pattern, content)
-                        for match in matches:
-                            if '/' in match and not match.startswith('http'):
-                                extracted_paths.add(match.lstrip('/'))
-                    except:
-                        continue
+                for pattern in JS_PATTERNS:
+                    for match in pattern.findall(content):
+                        if '/' in match and not match.startswith('http'):
+                            extracted_paths.add(match.lstrip('/'))
             
             # 3. Look for hidden/debug endpoints
-            debug_patterns = [
-                r'(?:debug|test|dev|staging)[_\-]?(?:url|endpoint|api).*?["\']([^"\']+)["\']',
-                r'/(?:debug|test|dev|admin|backup|old|temp|tmp)/[a-zA-Z0-9_\-]+',
-            ]
-            for pattern in debug_patterns:
-                try:
-                    matches = re.findall(pattern, content, re.IGNORECASE)
-                    for match in matches:
-                        if match.startswith('/'):
-                            extracted_paths.add(match.lstrip('/'))
-                except:
-                    continue
+            for pattern in DEBUG_PATTERNS:
+                for match in pattern.findall(content):
+                    if match.startswith('/'):
+                        extracted_paths.add(match.lstrip('/'))
             
             # 4. Extract from meta tags and headers
-            meta_patterns = [
-                r'<meta[^>]+content\s*=\s*["\']([^"\']+)["\'][^>]*>',
-                r'<link[^>]+href\s*=\s*["\']([^"\']+)["\'][^>]*>',
-            ]
-            for pattern in meta_patterns:
-                try:
-                    matches = re.findall(pattern, content)
-                    for match in matches:
-                        if match.startswith('/') and not match.endswith('.css'):
-                            extracted_paths.add(match.lstrip('/'))
-                except:
-                    continue
+            for pattern in META_PATTERNS:
+                for match in pattern.findall(content):
+                    if match.startswith('/') and not match.endswith('.css'):
+                        extracted_paths.add(match.lstrip('/'))
             
         except Exception as e:
             if self.logger:
@@ -1790,7 +1753,7 @@ class DirsearchEngine:
             if len(path) > 100:
                 continue
             # Skip paths with too many special characters
-            if len(re.findall(r'[^a-zA-Z0-9_\-/.]', path)) > 5:
+            if len(SPECIAL_CHARS_RE.findall(path)) > 5:
                 continue
             
             filtered_paths.append(path)
@@ -1805,8 +1768,7 @@ class DirsearchEngine:
         # Skip external URLs
         if path.startswith(('http://', 'https://')):
             parsed = urlparse(path)
-            base_parsed = urlparse(base_url)
-            if parsed.netloc != base_parsed.netloc:
+            if parsed.netloc != _netloc(base_url):
                 return None
             path = parsed.path
         
@@ -1876,8 +1838,8 @@ class DirsearchEngine:
         if self.logger:
             self.logger.info(f"Analyzing {len(endpoints_to_analyze)} endpoints for hidden content...")
         
-        # Track all extracted paths
-        all_extracted_paths = set()
+        # Track newly extracted paths (duplicates are dropped by the seen-paths filter)
+        all_extracted_paths = []
         endpoint_analysis_results = []
         
         # Analyze each endpoint
@@ -1903,7 +1865,11 @@ class DirsearchEngine:
                     'extracted_paths': extracted_paths[:10]  # Store first 10 for display
                 })
                 
-                all_extracted_paths.update(extracted_paths)
+                for path in extracted_paths:
+                    if path in self._seen_paths:
+                        continue
+                    self._seen_paths.add(path)
+                    all_extracted_paths.append(path)
                 
                 if self.logger:
                     self.logger.info(f"Extracted {len(extracted_paths)} paths from {endpoint.path}")
@@ -1930,16 +1896,17 @@ class DirsearchEngine:
             # Group paths by their base directory
             paths_by_dir = defaultdict(list)
             for path in all_extracted_paths:
-                # Determine base directory
-                if '/' in path:
-                    base_dir = '/'.join(path.split('/')[:-1]) + '/'
-                else:
-                    base_dir = '/'
+                # Determine base directory and filename in a single scan
+                head, _, tail = path.rpartition('/')
+                base_dir = (head + '/') if head else '/'
                 
                 # Check if path was already scanned
                 full_url = urljoin(base_reference_url, path)
                 if full_url not in self._scanned_paths:
-                    paths_by_dir[base_dir].append(path.split('/')[-1])
+                    paths_by_dir[base_dir].append(tail)
+            
+            # Same overrides for every sub-scan: don't recurse, don't analyze again
+            scan_options = replace(options, recursive=False, crawl=False)
             
             # Scan the extracted paths
             for base_dir, paths in paths_by_dir.items():
@@ -1949,10 +1916,6 @@ class DirsearchEngine:
                     if self.logger:
                         self.logger.info(f"Scanning {len(paths)} extracted paths in {base_dir}")
                     
-                    scan_options = ScanOptions(**options.__dict__)
-                    scan_options.recursive = False  # Don't recurse on these
-                    scan_options.crawl = False  # Don't analyze again
-                    
                     await self._scan_paths(base_url, paths, scan_options)
         
         if self.logger:
@@ -4,13 +4,90 @@ Optimizes scan performance by intelligently expanding wordlists based on discove
 """
 
 import re
-from typing import Dict, List, Set, Tuple, Optional
+import sys
+from bisect import bisect_right
+from collections import deque
+from itertools import accumulate
+from typing import Any, Deque, Dict, List, Set, Tuple, Optional, FrozenSet, Sequence, Match, cast
 from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
 import json
 
+try:
+    import ahocorasick  # type: ignore
+except ImportError:
+    ahocorasick = None  # type: ignore
 
-@dataclass
+from src.utils.compat import DATACLASS_SLOTS
+from src.utils.fast_json import get_orjson
+
+
+# Regex metacharacters; a pattern containing any of these (unescaped) needs the regex engine
+_REGEX_META = frozenset('.^$*+?{}[]|()\\')
+
+
+def _extract_literals(pattern: str) -> Optional[Tuple[str, ...]]:
+    """
+    Extract the lowercased literal alternatives of a '/(a|b|c)' or '/a' rule pattern
+    
+    Returns None when the pattern relies on real regex features and can't be
+    matched as plain substrings.
+    """
+    if not pattern.startswith('/'):
+        return None
+    body = pattern[1:]
+    if body.startswith('(?:') and body.endswith(')'):
+        body = body[3:-1]
+    elif body.startswith('(') and body.endswith(')'):
+        body = body[1:-1]
+    elif '|' in body:
+        return None
+    
+    literals = []
+    for alternative in body.split('|'):
+        if not alternative or any(c in _REGEX_META for c in re.sub(r'\\[.\-_/]', '', alternative)):
+            return None
+        literals.append('/' + re.sub(r'\\([.\-_/])', r'\1', alternative).lower())
+    return tuple(literals)
+
+
+def _requires_leading_slash(pattern: str) -> bool:
+    """True if every match of the pattern starts with '/' (leading '/' and no top-level '|')"""
+    if not pattern.startswith('/'):
+        return False
+    depth = 0
+    in_class = False
+    escaped = False
+    for c in pattern:
+        if escaped:
+            escaped = False
+        elif c == '\\':
+            escaped = True
+        elif in_class:
+            in_class = c != ']'
+        elif c == '[':
+            in_class = True
+        elif c == '(':
+            depth += 1
+        elif c == ')':
+            depth -= 1
+        elif c == '|' and depth == 0:
+            return False
+    return True
+
+
+# Constructs that behave differently once a path sits inside the newline-joined batch:
+# string anchors, lookbehinds, inline flags, and anything able to match the '\n' separator
+_UNBATCHABLE_RE = re.compile(r'\\[AZzBsWDnx0]|\[\^|\(\?<[=!]|\(\?[aiLmsux-]')
+
+
+def _batchable(pattern: str) -> bool:
+    """True if the pattern matches a path the same way inside the newline-joined batch"""
+    return _UNBATCHABLE_RE.search(pattern) is None
+
+
+@dataclass(**DATACLASS_SLOTS)
 class EndpointRule:
     """Rule for intelligent endpoint expansion"""
     pattern: str  # Regex pattern to match discovered paths
@@ -19,22 +96,139 @@ class EndpointRule:
     extensions: List[str] = field(default_factory=list)  # Specific extensions to try
     recursive: bool = True  # Whether to scan recursively
     description: str = ""  # Rule description
+    _compiled: re.Pattern = field(init=False, repr=False, compare=False)
+    _literals: Optional[Tuple[str, ...]] = field(init=False, repr=False, compare=False)
+    _keywords_tuple: Tuple[str, ...] = field(init=False, repr=False, compare=False)
+    _keyword_set: FrozenSet[str] = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self) -> None:
+        # Keywords repeat across rules ('users', 'login', 'config', ...); interning lets every
+        # rule and every expansion set share one object per word
+        self.keywords = [sys.intern(k) for k in self.keywords]
+        self.extensions = [sys.intern(e) for e in self.extensions]
+        self._compiled = re.compile(self.pattern, re.IGNORECASE)
+        self._literals = _extract_literals(self.pattern)
+        # Deduplicated keywords: ordered tuple for slicing, frozenset for unions
+        self._keywords_tuple = tuple(dict.fromkeys(self.keywords))
+        self._keyword_set = frozenset(self._keywords_tuple)
+
+
+# (rule_name, rule) pair as returned by analyze_path
+RuleMatch = Tuple[str, EndpointRule]
+
+
+def _rule_priority(item: RuleMatch) -> int:
+    """Sort key for (rule_name, rule) pairs"""
+    return item[1].priority
 
 
 class IntelligentScanner:
     """Advanced rule-based scanner for optimized endpoint discovery"""
     
-    def __init__(self):
+    # Rule priorities run 0-100, giving bands 0-10; anything above lands in the top band
+    PRIORITY_BANDS = 11
+    
+    def __init__(self) -> None:
         self.rules = self._initialize_rules()
-        self.discovered_patterns = set()
-        self.priority_queue = []
+        self.discovered_patterns: Set[str] = set()
+        # Bucket queue: one FIFO per priority band (priority // 10), highest band served first
+        self.priority_queue: List[Deque[str]] = [deque() for _ in range(self.PRIORITY_BANDS)]
+        self._build_matchers()
+    
+    def _build_matchers(self) -> None:
+        """Build lookup structures derived from the current rule set"""
+        # Rule priorities are static, so keep one list already in descending priority
+        # order (stable, ties keep declaration order); matches then never need sorting
+        self._rules_by_priority: List[RuleMatch] = sorted(
+            self.rules.items(), key=_rule_priority, reverse=True
+        )
+        
+        # Literal rules are plain case-insensitive substring tests: matched in a single
+        # pass with an Aho-Corasick automaton when pyahocorasick is installed, otherwise
+        # with str containment checks. Only the remaining rules need the regex engine
+        self._literal_rules = [(name, rule) for name, rule in self.rules.items() if rule._literals]
+        regex_rules = [(name, rule) for name, rule in self.rules.items() if not rule._literals]
+        # Character trie of every literal without its leading '/'; walked from each '/' in
+        # the path, the '' key of a node holds the rules whose literal ends there
+        self._literal_trie: Dict[str, Any] = {}
+        for name, rule in self._literal_rules:
+            for literal in rule._literals or ():
+                node = self._literal_trie
+                for char in literal[1:]:
+                    node = node.setdefault(char, {})
+                node[''] = (*node.get('', ()), name)
+        self._automaton = None
+        if ahocorasick and self._literal_rules:
+            owners: Dict[str, List[str]] = {}
+            for rule_name, rule in self._literal_rules:
+                for literal in rule._literals or ():
+                    owners.setdefault(literal, []).append(rule_name)
+            self._automaton = ahocorasick.Automaton()
+            for literal, rule_names in owners.items():
+                self._automaton.add_word(literal, tuple(rule_names))
+            self._automaton.make_automaton()
+        self._regex_rules = regex_rules
+        
+        # One regex that reports every matching rule in a single call: each rule is an
+        # optional lookahead with its own named group, so rules that match at the same
+        # position (e.g. /graphql for 'api' and 'graphql') are all reported
+        self._group_rules = {f"r{i}": name for i, (name, _) in enumerate(regex_rules)}
+        self._combined: Optional[re.Pattern] = None
+        try:
+            self._combined = re.compile(
+                ''.join(f"(?:(?=.*?(?P<{group}>{rule.pattern})))?"
+                        for group, (_, rule) in zip(self._group_rules, regex_rules)),
+                re.IGNORECASE | re.DOTALL
+            )
+        except re.error:
+            # Patterns with inline global flags can't be combined; match them one by one
+            pass
+        
+        # Batch scanner for get_priority_paths when there is no automaton: a zero-width
+        # alternation in priority order, run once over all paths joined by newlines.
+        # Zero-width matches consume nothing, so every position reports its highest-priority
+        # rule even when rule matches overlap. MULTILINE keeps ^/$ per path; rules that
+        # could still see across the separator fall back to matching path by path
+        self._priority_scan: Optional[re.Pattern] = None
+        self._priority_groups = {
+            f"p{i}": rule.priority for i, (_, rule) in enumerate(self._rules_by_priority)
+        }
+        if self._automaton is None and all(_batchable(r.pattern) for r in self.rules.values()):
+            # Only try positions at a '/' when no rule can match elsewhere
+            guard = '(?=/)' if all(_requires_leading_slash(r.pattern) for r in self.rules.values()) else ''
+            try:
+                self._priority_scan = re.compile(
+                    guard + '(?=' + '|'.join(
+                        f"(?P<{group}>{rule.pattern})"
+                        for group, (_, rule) in zip(self._priority_groups, self._rules_by_priority)
+                    ) + ')',
+                    re.IGNORECASE | re.MULTILINE
+                )
+            except re.error:
+                pass
+        
+        # High-priority keywords (top 10 from each rule with priority >= 80)
+        self._priority_keywords: FrozenSet[str] = frozenset().union(
+            *(rule._keywords_tuple[:10] for rule in self.rules.values() if rule.priority >= 80)
+        )
+        
+        # Reverse index technology -> rule names for generate_smart_wordlist, filled on
+        # first use of each technology from the lowercased pattern sources
+        self._pattern_sources = [(name, rule.pattern.lower()) for name, rule in self.rules.items()]
+        self._tech_to_rules: Dict[str, Tuple[str, ...]] = {}
+        
+        # Per-path memoization; results depend only on the path and the rule set,
+        # so the caches are recreated whenever the matchers are rebuilt
+        self._match_rules = lru_cache(maxsize=4096)(self._match_rules_uncached)
+        self._expansion_keywords = lru_cache(maxsize=4096)(self._expansion_keywords_uncached)
+        self._smart_extensions = lru_cache(maxsize=4096)(self._smart_extensions_uncached)
         
     def _initialize_rules(self) -> Dict[str, EndpointRule]:
         """Initialize comprehensive rule set for intelligent scanning"""
         return {
             # Admin endpoints - HIGHEST PRIORITY
             'admin': EndpointRule(
-                pattern=r'/(admin|administrator|administration|manage|manager|control|cpanel)',
+                pattern=r'/(?:admin|administrator|administration|manage|manager|control|cpanel)',
                 priority=100,
                 keywords=[
                     'login', 'dashboard', 'panel', 'config', 'users', 'settings',
@@ -50,7 +244,7 @@ class IntelligentScanner:
             
             # API endpoints - HIGH PRIORITY
             'api': EndpointRule(
-                pattern=r'/(api|rest|graphql|endpoint|service|v\d+)',
+                pattern=r'/(?:api|rest|graphql|endpoint|service|v\d+)',
                 priority=90,
                 keywords=[
                     'swagger.json', 'openapi.yaml', 'openapi.json', 'api-docs',
@@ -69,7 +263,7 @@ class IntelligentScanner:
             
             # Development/Debug - HIGH PRIORITY
             'dev': EndpointRule(
-                pattern=r'/(dev|development|debug|test|testing|stage|staging|beta|alpha)',
+                pattern=r'/(?:dev|development|debug|test|testing|stage|staging|beta|alpha)',
                 priority=85,
                 keywords=[
                     'test', 'staging', 'beta', 'debug', 'dev.zip', 'backup.zip',
@@ -87,7 +281,7 @@ class IntelligentScanner:
             
             # Backup files - HIGH PRIORITY
             'backup': EndpointRule(
-                pattern=r'/(backup|bak|back|save|old|archive|dump)',
+                pattern=r'/(?:backup|bak|back|save|old|archive|dump)',
                 priority=85,
                 keywords=[
                     'db.sql', 'database.sql', 'dump.sql', 'backup.sql',
@@ -106,7 +300,7 @@ class IntelligentScanner:
             
             # Version control - HIGH PRIORITY
             'vcs': EndpointRule(
-                pattern=r'/(\\.git|\\.svn|\\.hg|CVS|\\.bzr|_darcs)',
+                pattern=r'/(?:\.git|\.svn|\.hg|CVS|\.bzr|_darcs)',
                 priority=80,
                 keywords=[
                     'HEAD', 'config', 'index', 'objects', 'refs', 'logs',
@@ -122,7 +316,7 @@ class IntelligentScanner:
             
             # Authentication endpoints
             'auth': EndpointRule(
-                pattern=r'/(login|signin|auth|authenticate|sso|oauth|saml)',
+                pattern=r'/(?:login|signin|auth|authenticate|sso|oauth|saml)',
                 priority=75,
                 keywords=[
                     'auth', 'authenticate', 'authorization', 'reset', 'forgot',
@@ -140,7 +334,7 @@ class IntelligentScanner:
             
             # CMS Detection
             'cms': EndpointRule(
-                pattern=r'/(wordpress|wp|joomla|drupal|typo3|magento|prestashop|opencart)',
+                pattern=r'/(?:wordpress|wp|joomla|drupal|typo3|magento|prestashop|opencart)',
                 priority=70,
                 keywords=[
                     'wp-admin', 'wp-login.php', 'wp-content', 'wp-includes',
@@ -157,7 +351,7 @@ class IntelligentScanner:
             
             # Configuration files
             'config': EndpointRule(
-                pattern=r'/(config|configuration|settings|setup|install)',
+                pattern=r'/(?:config|configuration|settings|setup|install)',
                 priority=75,
                 keywords=[
                     'config.php', 'configuration.php', 'settings.php',
@@ -175,7 +369,7 @@ class IntelligentScanner:
             
             # Upload directories
             'uploads': EndpointRule(
-                pattern=r'/(upload|uploads|files|media|static|assets|content|resources)',
+                pattern=r'/(?:upload|uploads|files|media|static|assets|content|resources)',
                 priority=65,
                 keywords=[
                     'test.jpg', 'test.png', 'test.txt', 'test.pdf',
@@ -193,7 +387,7 @@ class IntelligentScanner:
             
             # Monitoring/Metrics
             'monitoring': EndpointRule(
-                pattern=r'/(monitor|monitoring|metrics|status|health|stats|statistics)',
+                pattern=r'/(?:monitor|monitoring|metrics|status|health|stats|statistics)',
                 priority=60,
                 keywords=[
                     'metrics', 'prometheus', 'grafana', 'status', 'health',
@@ -226,7 +420,7 @@ class IntelligentScanner:
             
             # Package managers
             'packages': EndpointRule(
-                pattern=r'/(vendor|node_modules|bower_components|packages)',
+                pattern=r'/(?:vendor|node_modules|bower_components|packages)',
                 priority=70,
                 keywords=[
                     'composer.json', 'composer.lock', 'installed.json',
@@ -242,7 +436,7 @@ class IntelligentScanner:
             
             # Database interfaces
             'database': EndpointRule(
-                pattern=r'/(phpmyadmin|adminer|pgadmin|mongodb|redis|elasticsearch)',
+                pattern=r'/(?:phpmyadmin|adminer|pgadmin|mongodb|redis|elasticsearch)',
                 priority=85,
                 keywords=[
                     'index.php', 'login.php', 'db.php', 'sql.php',
@@ -256,7 +450,7 @@ class IntelligentScanner:
             
             # Hidden/Sensitive files
             'hidden': EndpointRule(
-                pattern=r'/\\.',
+                pattern=r'/\.',
                 priority=75,
                 keywords=[
                     '.env', '.env.local', '.env.prod', '.env.dev',
@@ -282,16 +476,43 @@ class IntelligentScanner:
         Returns:
             List of tuples (rule_name, rule) sorted by priority
         """
-        applicable_rules = []
+        return list(self._match_rules(path))
+    
+    def _match_rules_uncached(self, path: str) -> Tuple[RuleMatch, ...]:
+        """Match a path against all rules (wrapped by the per-path cache)"""
+        matched: Set[str] = set()
         
-        for rule_name, rule in self.rules.items():
-            if re.search(rule.pattern, path, re.IGNORECASE):
-                applicable_rules.append((rule_name, rule))
+        lower_path = path.lower()
+        if self._automaton is not None:
+            for _, rule_names in self._automaton.iter(lower_path):
+                matched.update(rule_names)
+        elif self._literal_trie:
+            trie = self._literal_trie
+            pos = lower_path.find('/')
+            while pos != -1:
+                node = trie
+                for char in lower_path[pos + 1:]:
+                    child = node.get(char)
+                    if child is None:
+                        break
+                    node = child
+                    if '' in node:
+                        matched.update(node[''])
+                pos = lower_path.find('/', pos + 1)
         
-        # Sort by priority (higher first)
-        applicable_rules.sort(key=lambda x: x[1].priority, reverse=True)
+        if self._combined is not None:
+            # Every group is optional, so the combined pattern always matches
+            groups = cast(Match[str], self._combined.match(path)).groupdict()
+            matched.update(
+                self._group_rules[group] for group, value in groups.items() if value is not None
+            )
+        else:
+            matched.update(
+                rule_name for rule_name, rule in self._regex_rules if rule._compiled.search(path)
+            )
         
-        return applicable_rules
+        # Already ordered by priority (higher first)
+        return tuple(item for item in self._rules_by_priority if item[0] in matched)
     
     def get_expansion_keywords(self, path: str) -> Set[str]:
         """
@@ -303,11 +524,18 @@ class IntelligentScanner:
         Returns:
             Set of keywords to add to wordlist
         """
-        keywords = set()
-        applicable_rules = self.analyze_path(path, 200)
+        return set(self._expansion_keywords(path))
+    
+    def _expansion_keywords_uncached(self, path: str) -> FrozenSet[str]:
+        """Compute expansion keywords for a path (wrapped by the per-path cache)"""
+        return self._expansion_keywords_impl(path, self._match_rules(path))
+    
+    def _expansion_keywords_impl(self, path: str, applicable_rules: Sequence[RuleMatch]) -> FrozenSet[str]:
+        """Expansion keywords for a path given its already matched rules"""
+        keywords: Set[str] = set()
         
         for rule_name, rule in applicable_rules:
-            keywords.update(rule.keywords)
+            keywords |= rule._keyword_set
             
             # Add variations based on the specific path
             if '/' in path:
@@ -320,7 +548,7 @@ class IntelligentScanner:
                     keywords.add(f"{base}/api")
                     keywords.add(f"{base}/config")
         
-        return keywords
+        return frozenset(keywords)
     
     def get_priority_paths(self, discovered_paths: List[str]) -> List[str]:
         """
@@ -332,21 +560,51 @@ class IntelligentScanner:
         Returns:
             Reordered list with high-priority paths first
         """
-        path_priorities = []
+        if self._priority_scan is None:
+            priorities = []
+            for path in discovered_paths:
+                rules = self._match_rules(path)
+                priorities.append(rules[0][1].priority if rules else 0)
+        else:
+            # One regex pass over all paths; match offsets map back to path indices
+            priorities = [0] * len(discovered_paths)
+            starts = [0, *accumulate(len(path) + 1 for path in discovered_paths)]
+            for match in self._priority_scan.finditer('\n'.join(discovered_paths)):
+                index = bisect_right(starts, match.start()) - 1
+                priority = self._priority_groups[cast(str, match.lastgroup)]
+                if priority > priorities[index]:
+                    priorities[index] = priority
         
-        for path in discovered_paths:
-            max_priority = 0
-            rules = self.analyze_path(path, 200)
-            
-            if rules:
-                max_priority = rules[0][1].priority
-            
-            path_priorities.append((path, max_priority))
+        # Sort by priority (higher first), keeping discovery order for ties
+        order = sorted(range(len(discovered_paths)), key=priorities.__getitem__, reverse=True)
         
-        # Sort by priority (higher first)
-        path_priorities.sort(key=lambda x: x[1], reverse=True)
+        return [discovered_paths[i] for i in order]
+    
+    def enqueue_path(self, path: str, priority: Optional[int] = None) -> None:
+        """
+        Queue a path for scanning in its priority band
         
-        return [path for path, _ in path_priorities]
+        Args:
+            path: The path to queue
+            priority: Explicit priority; derived from the matching rules when omitted
+        """
+        if priority is None:
+            rules = self._match_rules(path)
+            priority = rules[0][1].priority if rules else 0
+        band = min(max(priority // 10, 0), self.PRIORITY_BANDS - 1)
+        self.priority_queue[band].append(path)
+    
+    def dequeue_path(self) -> Optional[str]:
+        """
+        Pop the next path to scan (highest band first, FIFO within a band)
+        
+        Returns:
+            The next path, or None if the queue is empty
+        """
+        for bucket in reversed(self.priority_queue):
+            if bucket:
+                return bucket.popleft()
+        return None
     
     def should_deep_scan(self, path: str) -> bool:
         """
@@ -358,8 +616,10 @@ class IntelligentScanner:
         Returns:
             True if deep scan is recommended
         """
-        rules = self.analyze_path(path, 200)
-        
+        return self._should_deep_scan_impl(self._match_rules(path))
+    
+    def _should_deep_scan_impl(self, rules: Sequence[RuleMatch]) -> bool:
+        """Deep scan decision given already matched rules"""
         # High priority paths should be deep scanned
         for rule_name, rule in rules:
             if rule.priority >= 70 and rule.recursive:
@@ -377,8 +637,15 @@ class IntelligentScanner:
         Returns:
             List of extensions to try
         """
-        extensions = set()
-        rules = self.analyze_path(path, 200)
+        return list(self._smart_extensions(path))
+    
+    def _smart_extensions_uncached(self, path: str) -> Tuple[str, ...]:
+        """Compute smart extensions for a path (wrapped by the per-path cache)"""
+        return self._smart_extensions_impl(self._match_rules(path))
+    
+    def _smart_extensions_impl(self, rules: Sequence[RuleMatch]) -> Tuple[str, ...]:
+        """Smart extensions given already matched rules"""
+        extensions: Set[str] = set()
         
         for rule_name, rule in rules:
             extensions.update(rule.extensions)
@@ -387,7 +654,7 @@ class IntelligentScanner:
         if not extensions:
             extensions = {'php', 'html', 'js', 'json', 'txt'}
         
-        return list(extensions)
+        return tuple(extensions)
     
     def get_scan_strategy(self, base_url: str, discovered_paths: List[Dict]) -> Dict:
         """
@@ -400,7 +667,7 @@ class IntelligentScanner:
         Returns:
             Scan strategy with prioritized paths and keywords
         """
-        strategy = {
+        strategy: Dict[str, Any] = {
             'priority_paths': [],
             'expansion_keywords': set(),
             'deep_scan_paths': [],
@@ -408,36 +675,29 @@ class IntelligentScanner:
             'recommended_extensions': set()
         }
         
-        # Analyze all discovered paths
-        for path_info in discovered_paths:
-            path = path_info.get('path', '')
-            status = path_info.get('status', 0)
-            
-            # Get applicable rules
-            rules = self.analyze_path(path, status)
-            
+        # Match every path once, then derive each strategy field in its own pass
+        # Rediscovered paths are analyzed once, in first-seen order
+        unique_paths = dict.fromkeys(path_info.get('path', '') for path_info in discovered_paths)
+        
+        matches = []
+        for path in unique_paths:
+            rules = self._match_rules(path)
             if rules:
-                # High priority path
-                if rules[0][1].priority >= 80:
-                    strategy['priority_paths'].append(path)
-                
-                # Collect expansion keywords
-                keywords = self.get_expansion_keywords(path)
-                strategy['expansion_keywords'].update(keywords)
-                
-                # Check for deep scan
-                if self.should_deep_scan(path):
-                    strategy['deep_scan_paths'].append(path)
-                
-                # Collect extensions
-                extensions = self.get_smart_extensions(path)
-                strategy['recommended_extensions'].update(extensions)
-                
-                # Generate custom wordlist for specific path types
-                rule_name, rule = rules[0]
-                if rule_name not in strategy['custom_wordlists']:
-                    strategy['custom_wordlists'][rule_name] = []
-                strategy['custom_wordlists'][rule_name].extend(rule.keywords)
+                matches.append((path, rules))
+        
+        # High priority and deep scan paths
+        strategy['priority_paths'] = [path for path, rules in matches if rules[0][1].priority >= 80]
+        strategy['deep_scan_paths'] = [path for path, rules in matches if self._should_deep_scan_impl(rules)]
+        
+        for path, rules in matches:
+            # Collect expansion keywords and extensions
+            strategy['expansion_keywords'].update(self._expansion_keywords_impl(path, rules))
+            strategy['recommended_extensions'].update(self._smart_extensions_impl(rules))
+            
+            # Generate custom wordlist for specific path types
+            rule_name, rule = rules[0]
+            if rule_name not in strategy['custom_wordlists']:
+                strategy['custom_wordlists'][rule_name] = list(rule._keywords_tuple)
         
         # Convert sets to lists for JSON serialization
         strategy['expansion_keywords'] = list(strategy['expansion_keywords'])
@@ -455,15 +715,13 @@ class IntelligentScanner:
         Returns:
             Optimized wordlist
         """
-        wordlist = set()
+        wordlist: Set[str] = set()
         
         # Add keywords from applicable rules
         if 'technologies' in context:
             for tech in context['technologies']:
-                tech_lower = tech.lower()
-                for rule_name, rule in self.rules.items():
-                    if tech_lower in rule.pattern.lower():
-                        wordlist.update(rule.keywords)
+                for rule_name in self._rules_for_technology(tech.lower()):
+                    wordlist |= self.rules[rule_name]._keyword_set
         
         # Add keywords based on discovered paths
         if 'paths' in context:
@@ -472,16 +730,21 @@ class IntelligentScanner:
                 wordlist.update(keywords)
         
         # Add high-priority keywords
-        priority_keywords = set()
-        for rule_name, rule in self.rules.items():
-            if rule.priority >= 80:
-                priority_keywords.update(rule.keywords[:10])  # Top 10 from each
-        
-        wordlist.update(priority_keywords)
+        wordlist |= self._priority_keywords
         
         return sorted(list(wordlist))
     
-    def export_rules(self, filename: str):
+    def _rules_for_technology(self, tech_lower: str) -> Tuple[str, ...]:
+        """Names of rules whose pattern mentions the technology (reverse index lookup)"""
+        rule_names = self._tech_to_rules.get(tech_lower)
+        if rule_names is None:
+            rule_names = tuple(
+                name for name, source in self._pattern_sources if tech_lower in source
+            )
+            self._tech_to_rules[tech_lower] = rule_names
+        return rule_names
+    
+    def export_rules(self, filename: str) -> None:
         """Export rules to JSON file"""
         rules_dict = {}
         for name, rule in self.rules.items():
@@ -494,14 +757,23 @@ class IntelligentScanner:
                 'description': rule.description
             }
         
-        with open(filename, 'w') as f:
-            json.dump(rules_dict, f, indent=2)
+        orjson = get_orjson()
+        if orjson:
+            Path(filename).write_bytes(orjson.dumps(rules_dict, option=orjson.OPT_INDENT_2))
+        else:
+            with open(filename, 'w') as f:
+                json.dump(rules_dict, f, indent=2)
     
-    def import_rules(self, filename: str):
+    def import_rules(self, filename: str) -> None:
         """Import rules from JSON file"""
-        with open(filename, 'r') as f:
-            rules_dict = json.load(f)
+        orjson = get_orjson()
+        if orjson:
+            rules_dict = orjson.loads(Path(filename).read_bytes())
+        else:
+            with open(filename, 'r') as f:
+                rules_dict = json.load(f)
         
         self.rules = {}
         for name, rule_data in rules_dict.items():
-            self.rules[name] = EndpointRule(**rule_data)
\ No newline at end of file
+            self.rules[name] = EndpointRule(**rule_data)
+        self._build_matchers()
\ No newline at end of file
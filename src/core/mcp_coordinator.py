@@ -1,20 +1,200 @@
 import os
 import json
 import time
+import sqlite3
 import asyncio
 import aiohttp
-from typing import Dict, List, Any, Optional, Tuple
+from typing import Dict, List, Any, Optional, Tuple, Hashable, FrozenSet
 from dataclasses import dataclass, asdict
 from datetime import datetime
+from pathlib import Path
+import heapq
 import hashlib
-from collections import defaultdict
+from collections import defaultdict, deque, OrderedDict
 import re
-from urllib.parse import urlparse
+from functools import lru_cache
+
+try:
+    import xxhash
+except ImportError:
+    xxhash = None
+
+try:
+    import hyperscan
+except ImportError:
+    hyperscan = None
 
 from src.utils.logger import LoggerSetup
 from src.config.settings import Settings
 
 
+# CMS signatures, checked in order; each CMS is one case-insensitive alternation
+CMS_SIGNATURES = {
+    'WordPress': [r'wp-content', r'wp-includes', r'WordPress'],
+    'Joomla': [r'Joomla', r'/components/', r'/modules/'],
+    'Drupal': [r'Drupal', r'/sites/default/', r'/modules/'],
+    'Django': [r'csrfmiddlewaretoken', r'django'],
+    'Laravel': [r'laravel_session', r'Laravel'],
+    'Magento': [r'Magento', r'/skin/frontend/', r'/js/mage/']
+}
+_CMS_COMBINED = {
+    cms: re.compile('(?:' + '|'.join(patterns) + ')', re.IGNORECASE)
+    for cms, patterns in CMS_SIGNATURES.items()
+}
+_CMS_NAMES = list(CMS_SIGNATURES)
+
+
+def _build_cms_database():
+    """Compile every CMS signature into one Hyperscan database (None if unavailable)"""
+    if hyperscan is None:
+        return None
+    
+    expressions, ids = [], []
+    for index, patterns in enumerate(CMS_SIGNATURES.values()):
+        for pattern in patterns:
+            expressions.append(pattern.encode())
+            ids.append(index)
+    
+    try:
+        database = hyperscan.Database()
+        database.compile(
+            expressions=expressions,
+            ids=ids,
+            elements=len(expressions),
+            flags=[hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_SINGLEMATCH] * len(expressions)
+        )
+    except hyperscan.error:
+        return None
+    return database
+
+
+_CMS_DATABASE = _build_cms_database()
+# Title, form and CMS markers sit near the top of a page; only this much is read
+FINGERPRINT_BYTES = 65536
+# AI responses: numbered section headers (optionally behind markdown) and parameter lines
+_AI_LINE_RE = re.compile(r'^(?:[ \t#*_-]*([1-5])\.)?(.*)$', re.MULTILINE)
+_AI_SECTIONS = {
+    '1': 'additional_tech',
+    '2': 'recommended_wordlists',
+    '3': 'scan_parameters',
+    '4': 'focus_areas',
+    '5': 'considerations'
+}
+_AI_PARAM_RE = re.compile(r'threads|timeout', re.IGNORECASE)
+_DIGITS_RE = re.compile(r'\d+')
+_AI_THREADS_RE = re.compile(r'threads[:\s]+(\d+)', re.IGNORECASE)
+# Parameter recommendations: one pass picks up threads, timeout and delay
+_AI_TUNING_RE = re.compile(r'(?P<key>threads|timeout|delay)[:\s]+(?P<val>\d+)(?P<frac>\.\d*)?', re.IGNORECASE)
+_AI_WORDLIST_RE = re.compile(r'wordlist[:\s]+([^\s,]+)', re.IGNORECASE)
+_AI_PRIORITY_RE = re.compile(r'priority[:\s]+(\d+)', re.IGNORECASE)
+# WAF/CDN fronts that call for gentler scan parameters
+_WAF_RE = re.compile(r'cloudflare|akamai|incapsula', re.IGNORECASE)
+# Host part of an http(s) URL (what urlparse reports as netloc)
+_NETLOC_RE = re.compile(r'^https?://([^/?#]*)')
+# Combined JSON-mode request: target analysis and scan plan in one round-trip
+_AI_TASK_TYPES = ('directory_enumeration', 'backup_files', 'cms_specific')
+_AI_BUNDLE_QUESTION = """Analyze this target and plan the scan. Return a JSON object with:
+- "analysis": {"additional_tech": [str], "recommended_wordlists": [str],
+  "scan_parameters": {"threads": int, "timeout": int}, "focus_areas": [str], "considerations": [str]}
+- "scan_plan": [{"task_type": "directory_enumeration" | "backup_files" | "cms_specific",
+  "wordlist": str, "extensions": [str], "threads": int, "priority": int (1-100)}]"""
+_TITLE_RE = re.compile(r'<title>.*?</title>', re.IGNORECASE | re.DOTALL)
+_FORM_RE = re.compile(r'<form\b', re.IGNORECASE)
+
+
+# Technology markers matched (as substrings) against the lowercased tech stack
+_TECH_MARKERS = ('php', 'asp', '.net', 'java', 'python')
+
+
+@lru_cache(maxsize=128)
+def _tech_markers(technology_stack: Tuple[str, ...]) -> FrozenSet[str]:
+    """Markers present in a technology stack, plus 'dotnet' for ASP/.NET"""
+    tech_text = ' '.join(technology_stack).lower()
+    markers = {marker for marker in _TECH_MARKERS if marker in tech_text}
+    if 'asp' in markers or '.net' in markers:
+        markers.add('dotnet')
+    return frozenset(markers)
+
+
+# Planning helpers are pure functions of a small target profile, so repeated
+# targets of the same kind are answered from the cache
+
+
+@lru_cache(maxsize=256)
+def _wordlists_for(is_api: bool, detected_cms: Optional[str],
+                   tech_markers: FrozenSet[str]) -> Tuple[str, Tuple[str, ...]]:
+    """Primary wordlist type and additional wordlists for a target profile"""
+    additional_wordlists = []
+    primary_type = 'enhanced'  # Default to enhanced wordlist
+    
+    # API-looking URL
+    if is_api:
+        primary_type = 'api'
+        additional_wordlists.append('wordlists/hidden-files.txt')
+        
+    # CMS-specific wordlists
+    if detected_cms:
+        cms_wordlists = {
+            'WordPress': 'wordpress.txt',
+            'Joomla': 'joomla.txt',
+            'Drupal': 'drupal.txt'
+        }
+        if detected_cms in cms_wordlists:
+            additional_wordlists.append(f'wordlists/{cms_wordlists[detected_cms]}')
+    
+    # Technology-specific
+    if 'php' in tech_markers:
+        additional_wordlists.append('wordlists/php_common.txt')
+    elif 'dotnet' in tech_markers:
+        additional_wordlists.append('wordlists/aspnet_common.txt')
+    elif 'java' in tech_markers:
+        additional_wordlists.append('wordlists/java_common.txt')
+    
+    # Always include hidden files for comprehensive scanning
+    if 'wordlists/hidden-files.txt' not in additional_wordlists:
+        additional_wordlists.append('wordlists/hidden-files.txt')
+    
+    return primary_type, tuple(additional_wordlists)
+
+
+@lru_cache(maxsize=256)
+def _extensions_for(detected_cms: Optional[str], tech_markers: FrozenSet[str]) -> Tuple[str, ...]:
+    """File extensions for a target profile"""
+    extensions = []
+    
+    if 'php' in tech_markers or detected_cms in ['WordPress', 'Joomla', 'Drupal']:
+        extensions.extend(['php', 'php3', 'php4', 'php5', 'phtml'])
+    if 'dotnet' in tech_markers:
+        extensions.extend(['asp', 'aspx', 'asmx', 'ashx'])
+    if 'java' in tech_markers:
+        extensions.extend(['jsp', 'jsf', 'do', 'action'])
+    if 'python' in tech_markers:
+        extensions.extend(['py'])
+    
+    # Always include common extensions
+    extensions.extend(['html', 'htm', 'txt', 'xml', 'json'])
+    
+    return tuple(dict.fromkeys(extensions))
+
+
+@lru_cache(maxsize=256)
+def _threads_for(server: str, rate_limited: bool) -> int:
+    """Thread count for a lowercased server type"""
+    # Check if target has rate limiting
+    if rate_limited:
+        return 2
+    
+    # Adjust based on server type
+    if 'cloudflare' in server:
+        return 5
+    elif 'nginx' in server:
+        return 20
+    elif 'apache' in server:
+        return 15
+    
+    return 10
+
+
 @dataclass
 class TargetInfo:
     url: str
@@ -32,6 +212,11 @@ class TargetInfo:
             self.response_patterns = {}
         if self.security_headers is None:
             self.security_headers = {}
+    
+    @property
+    def tech_markers(self) -> FrozenSet[str]:
+        """Technology markers for the current stack (computed once per distinct stack)"""
+        return _tech_markers(tuple(self.technology_stack))
 
 
 @dataclass
@@ -53,100 +238,279 @@ class ScanResult:
     status: str
     findings: List[Dict[str, Any]]
     metrics: Dict[str, Any]
-    timestamp: str
+    timestamp: float  # Epoch seconds; see iso_timestamp
+    
+    @property
+    def iso_timestamp(self) -> str:
+        """Timestamp as a local ISO 8601 string, formatted on demand"""
+        return datetime.fromtimestamp(self.timestamp).isoformat()
+
+
+# Marks a missing or expired cache entry, so stored None values stay distinguishable
+_MISSING = object()
+
+
+class _LRUTTLCache:
+    """Bounded cache that evicts least recently used and expired entries"""
+    
+    def __init__(self, max_size: int = 512, ttl: float = 3600):
+        self.max_size = max_size
+        self.ttl = ttl
+        self._data: 'OrderedDict[Hashable, Tuple[float, Any]]' = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+    
+    def _live(self, key: Hashable) -> Any:
+        """Return the stored value if it has not expired, else _MISSING (dropping the entry)"""
+        entry = self._data.get(key)
+        if entry is None:
+            return _MISSING
+        stored_at, value = entry
+        if time.time() - stored_at >= self.ttl:
+            del self._data[key]
+            return _MISSING
+        return value
+    
+    def get(self, key: Hashable, default: Any = None) -> Optional[Any]:
+        """Return a live cached value, or default"""
+        value = self._live(key)
+        if value is _MISSING:
+            self.misses += 1
+            return default
+        self._data.move_to_end(key)
+        self.hits += 1
+        return value
+    
+    def set(self, key: Hashable, value: Any):
+        """Store a value, evicting the oldest entry when full"""
+        self._data[key] = (time.time(), value)
+        self._data.move_to_end(key)
+        if len(self._data) > self.max_size:
+            self._data.popitem(last=False)
+    
+    def pop(self, key: Hashable) -> Optional[Any]:
+        """Remove an entry, returning its value if it was still live"""
+        entry = self._data.pop(key, None)
+        if entry is not None and time.time() - entry[0] < self.ttl:
+            return entry[1]
+        return None
+    
+    def clear(self):
+        """Drop every entry"""
+        self._data.clear()
+    
+    def cache_info(self) -> Dict[str, int]:
+        """Hit/miss counters in the spirit of functools.lru_cache"""
+        return {'hits': self.hits, 'misses': self.misses, 'max_size': self.max_size, 'size': len(self._data)}
+    
+    def __getitem__(self, key: Hashable) -> Any:
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            raise KeyError(key)
+        return value
+    
+    def __setitem__(self, key: Hashable, value: Any):
+        self.set(key, value)
+    
+    def __len__(self) -> int:
+        return len(self._data)
+    
+    def __contains__(self, key: Hashable) -> bool:
+        return self._live(key) is not _MISSING
+
+
+class _DiskCache:
+    """SQLite-backed AI response cache that survives restarts"""
+    
+    def __init__(self, path: str, ttl: float = 86400):
+        self.ttl = ttl
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(path)
+        self._conn.execute(
+            'CREATE TABLE IF NOT EXISTS ai_cache (key TEXT PRIMARY KEY, response TEXT, ts REAL)'
+        )
+        self.purge_expired()
+    
+    def get(self, key: Hashable) -> Optional[str]:
+        """Return a live cached response, or None"""
+        row = self._conn.execute(
+            'SELECT response FROM ai_cache WHERE key = ? AND ts > ?',
+            (str(key), time.time() - self.ttl)
+        ).fetchone()
+        return row[0] if row else None
+    
+    def set(self, key: Hashable, value: str):
+        """Store a response, replacing any previous one"""
+        with self._conn:
+            self._conn.execute(
+                'INSERT OR REPLACE INTO ai_cache (key, response, ts) VALUES (?, ?, ?)',
+                (str(key), value, time.time())
+            )
+    
+    def purge_expired(self):
+        """Delete rows older than the TTL"""
+        with self._conn:
+            self._conn.execute('DELETE FROM ai_cache WHERE ts <= ?', (time.time() - self.ttl,))
+    
+    def close(self):
+        self._conn.close()
 
 
 class AIAgentConnector:
     """Connector for AI agents (ChatGPT/DeepSeek)"""
     
+    # Token bucket per provider: burst capacity and refill over the window (seconds)
+    RATE_LIMITS = {
+        'openai': {'max_requests': 60, 'window': 60},
+        'deepseek': {'max_requests': 100, 'window': 60}
+    }
+    
     def __init__(self, config: Settings):
         self.config = config
         self.logger = LoggerSetup.get_logger(__name__)
-        self.cache = {}
+        self.cache = _LRUTTLCache(max_size=512, ttl=3600)
+        self.disk_cache: Optional[_DiskCache] = None
         self.rate_limiter = {
-            'openai': {'requests': 0, 'reset_time': time.time()},
-            'deepseek': {'requests': 0, 'reset_time': time.time()}
+            provider: {'tokens': float(limit['max_requests']), 'last': time.monotonic()}
+            for provider, limit in self.RATE_LIMITS.items()
         }
+        self._session: Optional[aiohttp.ClientSession] = None
+    
+    def get_session(self) -> aiohttp.ClientSession:
+        """Get the shared HTTP session, creating it on first use"""
+        if self._session is None or self._session.closed:
+            # One keep-alive pool (with cached DNS) for every AI and target request
+            connector = aiohttp.TCPConnector(
+                limit=100,
+                limit_per_host=20,
+                ttl_dns_cache=300,
+                use_dns_cache=True,
+                keepalive_timeout=60,
+                enable_cleanup_closed=True
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(total=30, connect=5)
+            )
+        return self._session
+    
+    def open_disk_cache(self):
+        """Open the persistent AI response cache if enabled in settings"""
+        mcp_config = getattr(self.config, 'mcp_config', {})
+        cache_dir = getattr(self.config, 'paths', {}).get('cache')
+        if self.disk_cache or not mcp_config.get('cache_ai_responses') or not cache_dir:
+            return
+        
+        try:
+            self.disk_cache = _DiskCache(
+                str(Path(cache_dir) / 'ai_responses.sqlite3'),
+                ttl=mcp_config.get('ai_cache_ttl', 86400)
+            )
+        except (OSError, sqlite3.Error) as e:
+            self.logger.warning(f"AI response disk cache disabled: {e}")
+    
+    async def close(self):
+        """Close the shared HTTP session and the disk cache"""
+        if self._session and not self._session.closed:
+            await self._session.close()
+        self._session = None
+        if self.disk_cache:
+            self.disk_cache.close()
+            self.disk_cache = None
         
     async def detect_ai_availability(self) -> Tuple[bool, str]:
         """Check if AI agent is available"""
-        providers = []
-        
-        # Check OpenAI
-        if self.config.ai_config.get('openai_api_key'):
-            try:
-                async with aiohttp.ClientSession() as session:
-                    headers = {
-                        'Authorization': f"Bearer {self.config.ai_config['openai_api_key']}",
-                        'Content-Type': 'application/json'
-                    }
-                    async with session.get(
-                        'https://api.openai.com/v1/models',
-                        headers=headers,
-                        timeout=5
-                    ) as response:
-                        if response.status == 200:
-                            providers.append('openai')
-            except Exception as e:
-                self.logger.debug(f"OpenAI API check failed: {e}")
-        
-        # Check DeepSeek
-        if self.config.ai_config.get('deepseek_api_key'):
-            try:
-                async with aiohttp.ClientSession() as session:
-                    headers = {
-                        'Authorization': f"Bearer {self.config.ai_config['deepseek_api_key']}",
-                        'Content-Type': 'application/json'
-                    }
-                    async with session.post(
-                        'https://api.deepseek.com/v1/chat/completions',
-                        headers=headers,
-                        json={'model': 'deepseek-chat', 'messages': [{'role': 'user', 'content': 'test'}]},
-                        timeout=5
-                    ) as response:
-                        if response.status in [200, 400]:  # 400 means auth works but request invalid
-                            providers.append('deepseek')
-            except Exception as e:
-                self.logger.debug(f"DeepSeek API check failed: {e}")
+        # Probe configured providers concurrently; OpenAI is still preferred
+        results = await asyncio.gather(self._probe_openai(), self._probe_deepseek())
+        providers = [provider for provider in results if provider]
         
         if providers:
             return True, providers[0]
         return False, None
     
+    async def _probe_openai(self) -> Optional[str]:
+        """Return 'openai' if the OpenAI API accepts the configured key"""
+        if not self.config.ai_config.get('openai_api_key'):
+            return None
+        
+        try:
+            session = self.get_session()
+            headers = {
+                'Authorization': f"Bearer {self.config.ai_config['openai_api_key']}",
+                'Content-Type': 'application/json'
+            }
+            async with session.get(
+                'https://api.openai.com/v1/models',
+                headers=headers,
+                timeout=5
+            ) as response:
+                if response.status == 200:
+                    return 'openai'
+        except Exception as e:
+            self.logger.debug(f"OpenAI API check failed: {e}")
+        return None
+    
+    async def _probe_deepseek(self) -> Optional[str]:
+        """Return 'deepseek' if the DeepSeek API accepts the configured key"""
+        if not self.config.ai_config.get('deepseek_api_key'):
+            return None
+        
+        try:
+            session = self.get_session()
+            headers = {
+                'Authorization': f"Bearer {self.config.ai_config['deepseek_api_key']}",
+                'Content-Type': 'application/json'
+            }
+            async with session.post(
+                'https://api.deepseek.com/v1/chat/completions',
+                headers=headers,
+                json={'model': 'deepseek-chat', 'messages': [{'role': 'user', 'content': 'test'}]},
+                timeout=5
+            ) as response:
+                if response.status in [200, 400]:  # 400 means auth works but request invalid
+                    return 'deepseek'
+        except Exception as e:
+            self.logger.debug(f"DeepSeek API check failed: {e}")
+        return None
+    
     def _check_rate_limit(self, provider: str) -> bool:
         """Check if rate limit allows request"""
-        limits = {
-            'openai': {'max_requests': 60, 'window': 60},
-            'deepseek': {'max_requests': 100, 'window': 60}
-        }
+        limit = self.RATE_LIMITS[provider]
+        capacity = limit['max_requests']
+        rate = capacity / limit['window']
         
-        current_time = time.time()
+        # Refill tokens for the time elapsed (monotonic, so clock changes don't matter)
+        now = time.monotonic()
         limiter = self.rate_limiter[provider]
+        limiter['tokens'] = min(capacity, limiter['tokens'] + (now - limiter['last']) * rate)
+        limiter['last'] = now
         
-        # Reset counter if window passed
-        if current_time - limiter['reset_time'] > limits[provider]['window']:
-            limiter['requests'] = 0
-            limiter['reset_time'] = current_time
-        
-        # Check limit
-        if limiter['requests'] >= limits[provider]['max_requests']:
+        if limiter['tokens'] < 1:
             return False
         
-        limiter['requests'] += 1
+        limiter['tokens'] -= 1
         return True
     
-    def _get_cache_key(self, context: str, question: str) -> str:
-        """Generate cache key for AI queries"""
-        content = f"{context}:{question}"
-        return hashlib.md5(content.encode()).hexdigest()
+    def _get_cache_key(self, context: str, question: str) -> Hashable:
+        """Generate cache key for AI queries (not security sensitive)"""
+        content = f"{context}:{question}".encode()
+        if xxhash:
+            return xxhash.xxh3_64_intdigest(content)
+        return hashlib.blake2b(content, digest_size=16).hexdigest()
     
-    async def query_ai_agent(self, context: str, question: str, provider: str = None) -> Optional[str]:
-        """Query AI agent with context and question"""
+    async def query_ai_agent(self, context: str, question: str, provider: str = None,
+                             json_mode: bool = False) -> Optional[str]:
+        """Query AI agent with context and question (json_mode asks for a JSON object)"""
         # Check cache
         cache_key = self._get_cache_key(context, question)
-        if cache_key in self.cache:
+        cached = self.cache.get(cache_key)
+        if cached is None and self.disk_cache:
+            cached = self.disk_cache.get(cache_key)
+            if cached is not None:
+                self.cache.set(cache_key, cached)
+        if cached is not None:
             self.logger.debug("Returning cached AI response")
-            return self.cache[cache_key]
+            return cached
         
         # Auto-detect provider if not specified
         if not provider:
@@ -161,15 +525,17 @@ class AIAgentConnector:
         
         try:
             if provider == 'openai':
-                response = await self._query_openai(context, question)
+                response = await self._query_openai(context, question, json_mode)
             elif provider == 'deepseek':
-                response = await self._query_deepseek(context, question)
+                response = await self._query_deepseek(context, question, json_mode)
             else:
                 return None
             
             # Cache response
             if response:
-                self.cache[cache_key] = response
+                self.cache.set(cache_key, response)
+                if self.disk_cache:
+                    self.disk_cache.set(cache_key, response)
             
             return response
             
@@ -177,74 +543,86 @@ class AIAgentConnector:
             self.logger.error(f"AI query failed: {e}")
             return None
     
-    async def _query_openai(self, context: str, question: str) -> Optional[str]:
+    async def _query_openai(self, context: str, question: str, json_mode: bool = False) -> Optional[str]:
         """Query OpenAI API"""
-        async with aiohttp.ClientSession() as session:
-            headers = {
-                'Authorization': f"Bearer {self.config.ai_config['openai_api_key']}",
-                'Content-Type': 'application/json'
-            }
+        session = self.get_session()
+        headers = {
+            'Authorization': f"Bearer {self.config.ai_config['openai_api_key']}",
+            'Content-Type': 'application/json'
+        }
             
-            prompt = self._build_prompt(context, question)
+        prompt = self._build_prompt(context, question, json_mode)
             
-            payload = {
-                'model': self.config.ai_config.get('openai_model', 'gpt-3.5-turbo'),
-                'messages': [
-                    {'role': 'system', 'content': 'You are a web security expert specializing in directory enumeration and vulnerability assessment.'},
-                    {'role': 'user', 'content': prompt}
-                ],
-                'temperature': 0.3,
-                'max_tokens': 500
-            }
+        payload = {
+            'model': self.config.ai_config.get('openai_model', 'gpt-3.5-turbo'),
+            'messages': [
+                {'role': 'system', 'content': 'You are a web security expert specializing in directory enumeration and vulnerability assessment.'},
+                {'role': 'user', 'content': prompt}
+            ],
+            'temperature': 0.3,
+            'max_tokens': 1000 if json_mode else 500
+        }
+        if json_mode:
+            payload['response_format'] = {'type': 'json_object'}
             
-            async with session.post(
-                'https://api.openai.com/v1/chat/completions',
-                headers=headers,
-                json=payload,
-                timeout=30
-            ) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    return data['choices'][0]['message']['content']
-                else:
-                    self.logger.error(f"OpenAI API error: {response.status}")
-                    return None
+        async with session.post(
+            'https://api.openai.com/v1/chat/completions',
+            headers=headers,
+            json=payload,
+            timeout=30
+        ) as response:
+            if response.status == 200:
+                data = await response.json()
+                return data['choices'][0]['message']['content']
+            else:
+                self.logger.error(f"OpenAI API error: {response.status}")
+                return None
     
-    async def _query_deepseek(self, context: str, question: str) -> Optional[str]:
+    async def _query_deepseek(self, context: str, question: str, json_mode: bool = False) -> Optional[str]:
         """Query DeepSeek API"""
-        async with aiohttp.ClientSession() as session:
-            headers = {
-                'Authorization': f"Bearer {self.config.ai_config['deepseek_api_key']}",
-                'Content-Type': 'application/json'
-            }
+        session = self.get_session()
+        headers = {
+            'Authorization': f"Bearer {self.config.ai_config['deepseek_api_key']}",
+            'Content-Type': 'application/json'
+        }
             
-            prompt = self._build_prompt(context, question)
+        prompt = self._build_prompt(context, question, json_mode)
             
-            payload = {
-                'model': 'deepseek-chat',
-                'messages': [
-                    {'role': 'system', 'content': 'You are a web security expert specializing in directory enumeration and vulnerability assessment.'},
-                    {'role': 'user', 'content': prompt}
-                ],
-                'temperature': 0.3,
-                'max_tokens': 500
-            }
+        payload = {
+            'model': 'deepseek-chat',
+            'messages': [
+                {'role': 'system', 'content': 'You are a web security expert specializing in directory enumeration and vulnerability assessment.'},
+                {'role': 'user', 'content': prompt}
+            ],
+            'temperature': 0.3,
+            'max_tokens': 1000 if json_mode else 500
+        }
+        if json_mode:
+            payload['response_format'] = {'type': 'json_object'}
             
-            async with session.post(
-                'https://api.deepseek.com/v1/chat/completions',
-                headers=headers,
-                json=payload,
-                timeout=30
-            ) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    return data['choices'][0]['message']['content']
-                else:
-                    self.logger.error(f"DeepSeek API error: {response.status}")
-                    return None
+        async with session.post(
+            'https://api.deepseek.com/v1/chat/completions',
+            headers=headers,
+            json=payload,
+            timeout=30
+        ) as response:
+            if response.status == 200:
+                data = await response.json()
+                return data['choices'][0]['message']['content']
+            else:
+                self.logger.error(f"DeepSeek API error: {response.status}")
+                return None
     
-    def _build_prompt(self, context: str, question: str) -> str:
+    def _build_prompt(self, context: str, question: str, json_mode: bool = False) -> str:
         """Build structured prompt for AI agent"""
+        if json_mode:
+            return f"""Context:
+{context}
+
+Question: {question}
+
+Respond with a single JSON object and nothing else."""
+        
         return f"""Context:
 {context}
 
@@ -262,16 +640,25 @@ Keep the response under 300 words and use bullet points where appropriate."""
 class MCPCoordinator:
     """Intelligent MCP Coordinator with AI agent integration"""
     
+    LEARNING_HISTORY = 1024
+    
     def __init__(self, config: Settings):
         self.config = config
         self.logger = LoggerSetup.get_logger(__name__)
         self.ai_connector = AIAgentConnector(config)
         self.intelligence_mode = 'LOCAL'
         self.scan_history = []
-        self.learning_data = defaultdict(list)
+        # Bounded history per key; the oldest entries drop off first
+        self.learning_data = defaultdict(lambda: deque(maxlen=self.LEARNING_HISTORY))
+        # Target profiles an AI plan was already obtained for (bounded, expiring)
+        self._seen_signatures = _LRUTTLCache(max_size=256, ttl=3600)
+        # Plans that arrived with target analysis, kept until planned (bounded, expiring)
+        self._ai_plans = _LRUTTLCache(max_size=64, ttl=3600)
         
     async def initialize(self):
         """Initialize coordinator and detect AI availability"""
+        self.ai_connector.get_session()
+        self.ai_connector.open_disk_cache()
         available, provider = await self.ai_connector.detect_ai_availability()
         if available:
             self.intelligence_mode = 'AI_AGENT'
@@ -279,6 +666,11 @@ class MCPCoordinator:
         else:
             self.logger.info("Running in LOCAL mode (rule-based)")
     
+    async def close(self):
+        """Release network resources"""
+        self._ai_plans.clear()
+        await self.ai_connector.close()
+    
     async def analyze_target(self, url: str) -> TargetInfo:
         """Analyze target with intelligent detection"""
         self.logger.info(f"Analyzing target: {url}")
@@ -287,59 +679,68 @@ class MCPCoordinator:
         if not url.startswith(('http://', 'https://')):
             url = f"http://{url}"
             
-        parsed_url = urlparse(url)
         target_info = TargetInfo(
             url=url,
-            domain=parsed_url.netloc if parsed_url.netloc else url.replace('http://', '').replace('https://', '').split('/')[0]
+            domain=_NETLOC_RE.match(url).group(1) or url.replace('http://', '').replace('https://', '').split('/')[0]
         )
         
         # Basic HTTP analysis
         try:
-            # Create session with custom settings for better compatibility
+            # Shared session; certificate checks are skipped only for the target
             timeout = aiohttp.ClientTimeout(total=10, connect=5)
-            connector = aiohttp.TCPConnector(ssl=False, force_close=True)
+            session = self.ai_connector.get_session()
             
-            async with aiohttp.ClientSession(timeout=timeout, connector=connector) as session:
-                # Add headers to avoid being blocked
-                headers = {
-                    'User-Agent': 'Mozilla/5.0 (compatible; Dirsearch-MCP/1.0)',
-                    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8'
+            # Add headers to avoid being blocked
+            headers = {
+                'User-Agent': 'Mozilla/5.0 (compatible; Dirsearch-MCP/1.0)',
+                'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8'
+            }
+            
+            async with session.get(
+                url, headers=headers, allow_redirects=True, ssl=False, timeout=timeout
+            ) as response:
+                headers = dict(response.headers)
+                
+                # Server detection
+                target_info.server_type = headers.get('Server', 'Unknown')
+                
+                # Security headers
+                security_headers = {}
+                for header in ['X-Frame-Options', 'X-Content-Type-Options', 
+                             'Strict-Transport-Security', 'Content-Security-Policy']:
+                    if header in headers:
+                        security_headers[header] = headers[header]
+                target_info.security_headers = security_headers
+                
+                # Technology detection from headers
+                tech_stack = []
+                if 'X-Powered-By' in headers:
+                    tech_stack.append(headers['X-Powered-By'])
+                if 'X-AspNet-Version' in headers:
+                    tech_stack.append('ASP.NET')
+                target_info.technology_stack = tech_stack
+                
+                # Response patterns (from the head of the body only)
+                raw = await response.content.read(FINGERPRINT_BYTES)
+                try:
+                    content = raw.decode(response.charset or 'utf-8', errors='replace')
+                except LookupError:
+                    content = raw.decode('utf-8', errors='replace')
+                
+                content_length = len(content)
+                if len(raw) == FINGERPRINT_BYTES and headers.get('Content-Length', '').isdigit():
+                    content_length = int(headers['Content-Length'])
+                
+                target_info.response_patterns = {
+                    'status_code': response.status,
+                    'content_length': content_length,
+                    'has_title': bool(_TITLE_RE.search(content)),
+                    'has_forms': bool(_FORM_RE.search(content))
                 }
                 
-                async with session.get(url, headers=headers, allow_redirects=True) as response:
-                    headers = dict(response.headers)
-                    
-                    # Server detection
-                    target_info.server_type = headers.get('Server', 'Unknown')
-                    
-                    # Security headers
-                    security_headers = {}
-                    for header in ['X-Frame-Options', 'X-Content-Type-Options', 
-                                 'Strict-Transport-Security', 'Content-Security-Policy']:
-                        if header in headers:
-                            security_headers[header] = headers[header]
-                    target_info.security_headers = security_headers
-                    
-                    # Technology detection from headers
-                    tech_stack = []
-                    if 'X-Powered-By' in headers:
-                        tech_stack.append(headers['X-Powered-By'])
-                    if 'X-AspNet-Version' in headers:
-                        tech_stack.append('ASP.NET')
-                    target_info.technology_stack = tech_stack
-                    
-                    # Response patterns
-                    content = await response.text()
-                    target_info.response_patterns = {
-                        'status_code': response.status,
-                        'content_length': len(content),
-                        'has_title': bool(re.search(r'<title>.*?</title>', content)),
-                        'has_forms': bool(re.search(r'<form.*?>', content))
-                    }
-                    
-                    # CMS detection
-                    target_info.detected_cms = self._detect_cms(content, headers)
-                    
+                # CMS detection
+                target_info.detected_cms = self._detect_cms(content, headers)
+                
         except aiohttp.ClientError as e:
             self.logger.warning(f"HTTP error analyzing target {url}: {e}")
             # Continue with limited analysis
@@ -350,9 +751,15 @@ class MCPCoordinator:
             self.logger.error(f"Unexpected error analyzing target {url}: {type(e).__name__}: {e}")
             # Continue with limited analysis
         
-        # AI-enhanced analysis
+        # AI-enhanced analysis; the scan plan comes back in the same round-trip
         if self.intelligence_mode == 'AI_AGENT':
-            ai_insights = await self._get_ai_target_analysis(target_info)
+            ai_insights = None
+            bundle = await self._get_ai_target_bundle(target_info)
+            if bundle:
+                ai_insights = bundle['analysis']
+                self._ai_plans[target_info.url] = bundle['scan_plan']
+            else:
+                ai_insights = await self._get_ai_target_analysis(target_info)
             if ai_insights:
                 self._merge_ai_insights(target_info, ai_insights)
         
@@ -360,30 +767,78 @@ class MCPCoordinator:
     
     def _detect_cms(self, content: str, headers: Dict[str, str]) -> Optional[str]:
         """Detect CMS from response"""
-        cms_patterns = {
-            'WordPress': [r'wp-content', r'wp-includes', r'WordPress'],
-            'Joomla': [r'Joomla', r'/components/', r'/modules/'],
-            'Drupal': [r'Drupal', r'/sites/default/', r'/modules/'],
-            'Django': [r'csrfmiddlewaretoken', r'django'],
-            'Laravel': [r'laravel_session', r'Laravel'],
-            'Magento': [r'Magento', r'/skin/frontend/', r'/js/mage/']
-        }
+        if _CMS_DATABASE is not None:
+            # Single pass over the body; the earliest CMS in signature order wins
+            best = [len(_CMS_NAMES)]
+            
+            def on_match(cms_index, start, end, flags, context):
+                best[0] = min(best[0], cms_index)
+                return cms_index == 0  # Nothing can outrank the first CMS
+            
+            try:
+                _CMS_DATABASE.scan(content.encode('utf-8', 'ignore'), match_event_handler=on_match)
+            except hyperscan.ScanTerminated:
+                pass
+            return _CMS_NAMES[best[0]] if best[0] < len(_CMS_NAMES) else None
         
-        for cms, patterns in cms_patterns.items():
-            for pattern in patterns:
-                if re.search(pattern, content, re.IGNORECASE):
-                    return cms
+        for cms, pattern in _CMS_COMBINED.items():
+            if pattern.search(content):
+                return cms
                     
         return None
     
-    async def _get_ai_target_analysis(self, target_info: TargetInfo) -> Optional[Dict[str, Any]]:
-        """Get AI analysis of target"""
-        context = f"""Target URL: {target_info.url}
+    def _target_context(self, target_info: TargetInfo) -> str:
+        """Describe the analyzed target for AI prompts"""
+        return f"""Target URL: {target_info.url}
 Server: {target_info.server_type}
 Technologies: {', '.join(target_info.technology_stack)}
 CMS: {target_info.detected_cms or 'None detected'}
 Security Headers: {json.dumps(target_info.security_headers, indent=2)}
 Response Patterns: {json.dumps(target_info.response_patterns, indent=2)}"""
+    
+    async def _get_ai_target_bundle(self, target_info: TargetInfo) -> Optional[Dict[str, Any]]:
+        """Get AI target analysis and scan plan from a single JSON-mode request"""
+        response = await self.ai_connector.query_ai_agent(
+            self._target_context(target_info), _AI_BUNDLE_QUESTION, json_mode=True
+        )
+        if not response:
+            return None
+        
+        try:
+            data = json.loads(response)
+            analysis = data.get('analysis') or {}
+            insights = {
+                key: [str(item) for item in analysis.get(key) or []]
+                for key in ('additional_tech', 'recommended_wordlists', 'focus_areas', 'considerations')
+            }
+            insights['scan_parameters'] = {
+                name: int(value) for name, value in (analysis.get('scan_parameters') or {}).items()
+                if name in ('threads', 'timeout') and str(value).isdigit()
+            }
+            
+            tasks = []
+            for task_id, item in enumerate(data.get('scan_plan') or [], 1):
+                task_type = item.get('task_type')
+                task = ScanTask(
+                    task_id=f'ai_task_{task_id}',
+                    task_type=task_type if task_type in _AI_TASK_TYPES else 'directory_enumeration',
+                    priority=int(item.get('priority', 50)),
+                    parameters={}
+                )
+                for name in ('threads', 'wordlist', 'extensions'):
+                    if item.get(name):
+                        task.parameters[name] = item[name]
+                tasks.append(task)
+            
+            return {'analysis': insights, 'scan_plan': tasks}
+            
+        except (ValueError, TypeError, AttributeError) as e:
+            self.logger.debug(f"AI JSON response unusable, falling back to text queries: {e}")
+            return None
+    
+    async def _get_ai_target_analysis(self, target_info: TargetInfo) -> Optional[Dict[str, Any]]:
+        """Get AI analysis of target"""
+        context = self._target_context(target_info)
         
         question = """Based on this target analysis, provide:
 1. Additional technology stack components that might be present
@@ -406,32 +861,21 @@ Response Patterns: {json.dumps(target_info.response_patterns, indent=2)}"""
                     'considerations': []
                 }
                 
-                # Extract recommendations from AI response
-                lines = response.strip().split('\n')
+                # Extract recommendations in one lazy pass over the raw response
+                # (no stripped copy, no list of lines)
                 current_section = None
                 
-                for line in lines:
-                    if '1.' in line:
-                        current_section = 'additional_tech'
-                    elif '2.' in line:
-                        current_section = 'recommended_wordlists'
-                    elif '3.' in line:
-                        current_section = 'scan_parameters'
-                    elif '4.' in line:
-                        current_section = 'focus_areas'
-                    elif '5.' in line:
-                        current_section = 'considerations'
+                for match in _AI_LINE_RE.finditer(response):
+                    number, line = match.groups()
+                    if number:
+                        current_section = _AI_SECTIONS[number]
                     elif current_section and line.strip():
                         if current_section == 'scan_parameters':
                             # Parse parameters
-                            if 'threads' in line.lower():
-                                match = re.search(r'(\d+)', line)
-                                if match:
-                                    insights['scan_parameters']['threads'] = int(match.group(1))
-                            elif 'timeout' in line.lower():
-                                match = re.search(r'(\d+)', line)
-                                if match:
-                                    insights['scan_parameters']['timeout'] = int(match.group(1))
+                            param = _AI_PARAM_RE.search(line)
+                            value = _DIGITS_RE.search(line)
+                            if param and value:
+                                insights['scan_parameters'][param.group().lower()] = int(value.group())
                         else:
                             # Add to appropriate list
                             cleaned_line = line.strip(' -"*')
@@ -450,7 +894,7 @@ Response Patterns: {json.dumps(target_info.response_patterns, indent=2)}"""
         """Merge AI insights into target info"""
         if 'additional_tech' in ai_insights:
             target_info.technology_stack.extend(ai_insights['additional_tech'])
-            target_info.technology_stack = list(set(target_info.technology_stack))
+            target_info.technology_stack = list(dict.fromkeys(target_info.technology_stack))
     
     async def generate_scan_plan(self, target_info: TargetInfo) -> List[ScanTask]:
         """Generate intelligent scan plan"""
@@ -459,10 +903,13 @@ Response Patterns: {json.dumps(target_info.response_patterns, indent=2)}"""
         scan_tasks = []
         
         if self.intelligence_mode == 'AI_AGENT':
-            # Get AI recommendations
-            ai_plan = await self._get_ai_scan_plan(target_info)
+            # Reuse the plan from target analysis, else ask for one if worthwhile
+            ai_plan = self._ai_plans.pop(target_info.url)
+            if ai_plan is None and self._should_query_ai(target_info):
+                ai_plan = await self._get_ai_scan_plan(target_info)
             if ai_plan:
                 scan_tasks.extend(ai_plan)
+                self._seen_signatures[self._target_signature(target_info)] = True
         
         # Fallback or complement with local rules
         if not scan_tasks:
@@ -473,6 +920,19 @@ Response Patterns: {json.dumps(target_info.response_patterns, indent=2)}"""
         
         return scan_tasks
     
+    def _target_signature(self, target_info: TargetInfo) -> Tuple[str, Optional[str], FrozenSet[str]]:
+        """Coarse target profile: server, CMS and technology markers"""
+        return ((target_info.server_type or '').lower(), target_info.detected_cms, target_info.tech_markers)
+    
+    def _should_query_ai(self, target_info: TargetInfo) -> bool:
+        """Only spend an AI round-trip when local rules may not already cover the target"""
+        if self._seen_signatures.get(self._target_signature(target_info)) is None:
+            return True
+        
+        # Profile seen before: still ask for unusual targets
+        server = (target_info.server_type or '').lower()
+        return server in ('', 'unknown') or len(target_info.technology_stack) > 2
+    
     def _generate_local_scan_plan(self, target_info: TargetInfo) -> List[ScanTask]:
         """Generate scan plan using local rules"""
         tasks = []
@@ -531,76 +991,23 @@ Response Patterns: {json.dumps(target_info.response_patterns, indent=2)}"""
         Returns:
             Tuple of (primary_wordlist_type, additional_wordlists)
         """
-        additional_wordlists = []
-        primary_type = 'enhanced'  # Default to enhanced wordlist
-        
-        # Check if URL contains API patterns
         url_lower = target_info.url.lower()
-        if any(pattern in url_lower for pattern in ['/api', '/v1', '/v2', '/rest', '/graphql']):
-            primary_type = 'api'
-            additional_wordlists.append('wordlists/hidden-files.txt')
-            
-        # CMS-specific wordlists
-        if target_info.detected_cms:
-            cms_wordlists = {
-                'WordPress': 'wordpress.txt',
-                'Joomla': 'joomla.txt',
-                'Drupal': 'drupal.txt'
-            }
-            if target_info.detected_cms in cms_wordlists:
-                additional_wordlists.append(f'wordlists/{cms_wordlists[target_info.detected_cms]}')
-        
-        # Technology-specific
-        tech_stack = ' '.join(target_info.technology_stack).lower()
-        if 'php' in tech_stack:
-            additional_wordlists.append('wordlists/php_common.txt')
-        elif 'asp' in tech_stack or '.net' in tech_stack:
-            additional_wordlists.append('wordlists/aspnet_common.txt')
-        elif 'java' in tech_stack:
-            additional_wordlists.append('wordlists/java_common.txt')
-        
-        # Always include hidden files for comprehensive scanning
-        if 'wordlists/hidden-files.txt' not in additional_wordlists:
-            additional_wordlists.append('wordlists/hidden-files.txt')
-        
-        return primary_type, additional_wordlists
+        is_api = any(pattern in url_lower for pattern in ['/api', '/v1', '/v2', '/rest', '/graphql'])
+        primary_type, additional_wordlists = _wordlists_for(
+            is_api, target_info.detected_cms, target_info.tech_markers
+        )
+        return primary_type, list(additional_wordlists)
     
     def _select_extensions(self, target_info: TargetInfo) -> List[str]:
         """Select file extensions based on technology"""
-        extensions = []
-        
-        tech_stack = ' '.join(target_info.technology_stack).lower()
-        
-        if 'php' in tech_stack or target_info.detected_cms in ['WordPress', 'Joomla', 'Drupal']:
-            extensions.extend(['php', 'php3', 'php4', 'php5', 'phtml'])
-        if 'asp' in tech_stack or '.net' in tech_stack:
-            extensions.extend(['asp', 'aspx', 'asmx', 'ashx'])
-        if 'java' in tech_stack:
-            extensions.extend(['jsp', 'jsf', 'do', 'action'])
-        if 'python' in tech_stack:
-            extensions.extend(['py'])
-        
-        # Always include common extensions
-        extensions.extend(['html', 'htm', 'txt', 'xml', 'json'])
-        
-        return list(set(extensions))
+        return list(_extensions_for(target_info.detected_cms, target_info.tech_markers))
     
     def _calculate_threads(self, target_info: TargetInfo) -> int:
         """Calculate optimal thread count"""
-        # Check if target has rate limiting
-        if 'Retry-After' in target_info.security_headers:
-            return 2
-        
-        # Adjust based on server type
-        server = (target_info.server_type or '').lower()
-        if 'cloudflare' in server:
-            return 5
-        elif 'nginx' in server:
-            return 20
-        elif 'apache' in server:
-            return 15
-        
-        return 10
+        return _threads_for(
+            (target_info.server_type or '').lower(),
+            'Retry-After' in target_info.security_headers
+        )
     
     async def _get_ai_scan_plan(self, target_info: TargetInfo) -> List[ScanTask]:
         """Get AI-generated scan plan"""
@@ -636,17 +1043,17 @@ Response Patterns: {json.dumps(target_info.response_patterns, indent=2)}"""
                         
                         # Extract parameters from text
                         if 'threads' in section:
-                            match = re.search(r'threads[:\s]+(\d+)', section, re.IGNORECASE)
+                            match = _AI_THREADS_RE.search(section)
                             if match:
                                 task.parameters['threads'] = int(match.group(1))
                         
                         if 'wordlist' in section:
-                            match = re.search(r'wordlist[:\s]+([^\s,]+)', section, re.IGNORECASE)
+                            match = _AI_WORDLIST_RE.search(section)
                             if match:
                                 task.parameters['wordlist'] = match.group(1)
                         
                         if 'priority' in section:
-                            match = re.search(r'priority[:\s]+(\d+)', section, re.IGNORECASE)
+                            match = _AI_PRIORITY_RE.search(section)
                             if match:
                                 task.priority = int(match.group(1))
                         
@@ -661,41 +1068,69 @@ Response Patterns: {json.dumps(target_info.response_patterns, indent=2)}"""
         return []
     
     async def execute_scan_plan(self, scan_tasks: List[ScanTask]) -> List[ScanResult]:
-        """Execute scan plan with monitoring"""
-        results = []
+        """Execute scan plan with monitoring
         
-        for task in scan_tasks:
-            self.logger.info(f"Executing task: {task.task_id} (priority: {task.priority})")
-            
-            start_time = time.time()
-            
-            # Execute based on task type
-            if task.task_type == 'directory_enumeration':
-                result = await self._execute_directory_scan(task)
-            elif task.task_type == 'backup_files':
-                result = await self._execute_backup_scan(task)
-            elif task.task_type == 'cms_specific':
-                result = await self._execute_cms_scan(task)
-            else:
-                result = ScanResult(
-                    task_id=task.task_id,
-                    status='skipped',
-                    findings=[],
-                    metrics={'reason': 'Unknown task type'},
-                    timestamp=datetime.now().isoformat()
-                )
-            
-            # Add execution time
-            result.metrics['execution_time'] = time.time() - start_time
-            
-            results.append(result)
-            
-            # Learn from results
-            if self.intelligence_mode == 'AI_AGENT':
-                await self._learn_from_results(task, result)
+        Tasks of the same priority run concurrently (bounded by
+        ``performance['max_concurrent_tasks']``); higher priority tiers run first.
+        Results are returned in the order of ``scan_tasks``.
+        """
+        performance = getattr(self.config, 'performance', {})
+        semaphore = asyncio.Semaphore(max(1, int(performance.get('max_concurrent_tasks', 4))))
+        
+        tiers = defaultdict(list)
+        for index, task in enumerate(scan_tasks):
+            tiers[task.priority].append(index)
+        
+        results: List[Optional[ScanResult]] = [None] * len(scan_tasks)
+        
+        async def run(index: int):
+            async with semaphore:
+                results[index] = await self._dispatch_task(scan_tasks[index])
+        
+        for priority in sorted(tiers, reverse=True):
+            pending = [asyncio.ensure_future(run(index)) for index in tiers[priority]]
+            try:
+                await asyncio.gather(*pending)
+            except BaseException:
+                # A failed task stops the plan: cancel the rest of its tier before re-raising
+                for future in pending:
+                    future.cancel()
+                await asyncio.gather(*pending, return_exceptions=True)
+                raise
         
         return results
     
+    async def _dispatch_task(self, task: ScanTask) -> ScanResult:
+        """Execute a single scan task and learn from its result"""
+        self.logger.info(f"Executing task: {task.task_id} (priority: {task.priority})")
+        
+        start_time = time.time()
+        
+        # Execute based on task type
+        if task.task_type == 'directory_enumeration':
+            result = await self._execute_directory_scan(task)
+        elif task.task_type == 'backup_files':
+            result = await self._execute_backup_scan(task)
+        elif task.task_type == 'cms_specific':
+            result = await self._execute_cms_scan(task)
+        else:
+            result = ScanResult(
+                task_id=task.task_id,
+                status='skipped',
+                findings=[],
+                metrics={'reason': 'Unknown task type'},
+                timestamp=time.time()
+            )
+        
+        # Add execution time
+        result.metrics['execution_time'] = time.time() - start_time
+        
+        # Learn from results
+        if self.intelligence_mode == 'AI_AGENT':
+            await self._learn_from_results(task, result)
+        
+        return result
+    
     async def _execute_directory_scan(self, task: ScanTask) -> ScanResult:
         """Execute directory enumeration scan"""
         # This would integrate with DirsearchEngine
@@ -712,7 +1147,7 @@ Response Patterns: {json.dumps(target_info.response_patterns, indent=2)}"""
                 'found_paths': 2,
                 'errors': 0
             },
-            timestamp=datetime.now().isoformat()
+            timestamp=time.time()
         )
     
     async def _execute_backup_scan(self, task: ScanTask) -> ScanResult:
@@ -723,7 +1158,7 @@ Response Patterns: {json.dumps(target_info.response_patterns, indent=2)}"""
             status='completed',
             findings=[],
             metrics={'total_requests': 100},
-            timestamp=datetime.now().isoformat()
+            timestamp=time.time()
         )
     
     async def _execute_cms_scan(self, task: ScanTask) -> ScanResult:
@@ -734,7 +1169,7 @@ Response Patterns: {json.dumps(target_info.response_patterns, indent=2)}"""
             status='completed',
             findings=[],
             metrics={'total_requests': 200},
-            timestamp=datetime.now().isoformat()
+            timestamp=time.time()
         )
     
     async def _learn_from_results(self, task: ScanTask, result: ScanResult):
@@ -794,21 +1229,21 @@ Past successful scans: {len(self.learning_data.get('successful_params', []))}"""
     def _merge_ai_parameters(self, params: Dict[str, Any], ai_response: str):
         """Merge AI parameter recommendations"""
         try:
-            # Extract numeric recommendations
-            if 'threads' in ai_response:
-                match = re.search(r'threads[:\s]+(\d+)', ai_response, re.IGNORECASE)
-                if match:
-                    params['threads'] = min(int(match.group(1)), 50)  # Cap at 50
-            
-            if 'timeout' in ai_response:
-                match = re.search(r'timeout[:\s]+(\d+)', ai_response, re.IGNORECASE)
-                if match:
-                    params['timeout'] = int(match.group(1))
-            
-            if 'delay' in ai_response:
-                match = re.search(r'delay[:\s]+(\d+\.?\d*)', ai_response, re.IGNORECASE)
-                if match:
-                    params['delay'] = float(match.group(1))
+            # Extract numeric recommendations; the first mention of each wins
+            seen = set()
+            for match in _AI_TUNING_RE.finditer(ai_response):
+                key = match['key'].lower()
+                if key in seen:
+                    continue
+                seen.add(key)
+                if key == 'threads':
+                    params['threads'] = min(int(match['val']), 50)  # Cap at 50
+                elif key == 'timeout':
+                    params['timeout'] = int(match['val'])
+                else:
+                    params['delay'] = float(match['val'] + (match['frac'] or ''))
+                if len(seen) == 3:
+                    break
                     
         except Exception as e:
             self.logger.error(f"Failed to parse AI parameters: {e}")
@@ -816,8 +1251,7 @@ Past successful scans: {len(self.learning_data.get('successful_params', []))}"""
     def _apply_local_optimization(self, target_info: TargetInfo, params: Dict[str, Any]) -> Dict[str, Any]:
         """Apply local optimization rules"""
         # WAF detection adjustments
-        if any(waf in (target_info.server_type or '').lower() 
-               for waf in ['cloudflare', 'akamai', 'incapsula']):
+        if target_info.server_type and _WAF_RE.search(target_info.server_type):
             params['threads'] = min(params['threads'], 5)
             params['delay'] = max(params['delay'], 0.5)
             params['user_agent'] = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
@@ -840,17 +1274,12 @@ Past successful scans: {len(self.learning_data.get('successful_params', []))}"""
             'top_findings': []
         }
         
-        # Collect all findings
-        all_findings = []
-        for result in results:
-            for finding in result.findings:
-                all_findings.append({
-                    'task_id': result.task_id,
-                    **finding
-                })
-        
-        # Sort by importance (status code, size)
-        all_findings.sort(key=lambda x: (x.get('status', 999), -x.get('size', 0)))
-        summary['top_findings'] = all_findings[:10]
+        # Pick the most important findings (status code, size) without sorting them all
+        top = heapq.nsmallest(
+            10,
+            ((result.task_id, finding) for result in results for finding in result.findings),
+            key=lambda item: (item[1].get('status', 999), -item[1].get('size', 0))
+        )
+        summary['top_findings'] = [{'task_id': task_id, **finding} for task_id, finding in top]
         
         return summary
\ No newline at end of file
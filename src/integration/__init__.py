@@ -5,7 +5,7 @@ Provides interfaces for third-party tool integration
 
 from .interface import DirsearchMCP
 from .plugin_base import Plugin, PluginManager
-from .events import EventHook, EventType
+from .events import EventHook, EventType, run_in_executor
 from .data_formats import ScanData, TargetData, ResultData, ScanOptions
 
 __all__ = [
@@ -14,6 +14,7 @@ __all__ = [
     'PluginManager',
     'EventHook',
     'EventType',
+    'run_in_executor',
     'ScanData',
     'TargetData',
     'ResultData',
@@ -3,13 +3,52 @@ Data formats for Dirsearch MCP integration
 Provides standardized data structures for exchange
 """
 
-from dataclasses import dataclass, field, asdict
-from typing import Dict, List, Any, Optional, Union
+from dataclasses import dataclass, field, fields
+from typing import Dict, Iterable, List, Any, Optional, Union
 from datetime import datetime
+import csv
+import io
 import json
+import sys
+from xml.sax.saxutils import escape
 
+from src.utils.compat import DATACLASS_SLOTS
+from src.utils.fast_json import get_orjson
 
-@dataclass
+# Status classes used by the result filters
+_SUCCESS_STATUSES = frozenset({200, 201})
+_REDIRECT_STATUSES = frozenset({301, 302, 303, 307, 308})
+_AUTH_STATUSES = frozenset({401, 403})
+
+
+def _json_default(obj: Any) -> Any:
+    """Convert data formats while encoding, so no full to_dict() tree is built first"""
+    if isinstance(obj, ScanData):
+        return obj._json_fields()
+    if isinstance(obj, (ResultData, TargetData, ScanOptions)):
+        return obj.to_dict()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _dumps(data: Any, indent: Optional[int] = None) -> str:
+    """Encode to JSON, using orjson when available (it only indents by 2)"""
+    orjson = get_orjson()
+    if orjson and indent in (None, 2):
+        option = (orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATACLASS
+                  | (orjson.OPT_INDENT_2 if indent else 0))
+        return orjson.dumps(data, default=_json_default, option=option).decode()
+    return json.dumps(data, indent=indent, default=_json_default)
+
+
+def _loads(json_str: Union[str, bytes]) -> Any:
+    """Decode JSON, using orjson when available"""
+    orjson = get_orjson()
+    if orjson:
+        return orjson.loads(json_str)
+    return json.loads(json_str)
+
+
+@dataclass(**DATACLASS_SLOTS)
 class ScanOptions:
     """Options for directory scanning"""
     wordlist: str = "common.txt"
@@ -28,7 +67,21 @@ class ScanOptions:
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary"""
-        return asdict(self)
+        return {
+            'wordlist': self.wordlist,
+            'extensions': list(self.extensions),
+            'threads': self.threads,
+            'timeout': self.timeout,
+            'delay': self.delay,
+            'user_agent': self.user_agent,
+            'follow_redirects': self.follow_redirects,
+            'custom_headers': dict(self.custom_headers),
+            'proxy': self.proxy,
+            'max_retries': self.max_retries,
+            'exclude_status': self.exclude_status,
+            'include_status': self.include_status,
+            'use_mcp': self.use_mcp
+        }
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'ScanOptions':
@@ -37,15 +90,15 @@ class ScanOptions:
     
     def to_json(self) -> str:
         """Convert to JSON string"""
-        return json.dumps(self.to_dict())
+        return _dumps(self.to_dict())
     
     @classmethod
     def from_json(cls, json_str: str) -> 'ScanOptions':
         """Create from JSON string"""
-        return cls.from_dict(json.loads(json_str))
+        return cls.from_dict(_loads(json_str))
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class TargetData:
     """Target analysis data"""
     url: str
@@ -57,11 +110,22 @@ class TargetData:
     response_patterns: Dict[str, Any] = field(default_factory=dict)
     _internal: Any = field(default=None, repr=False)  # Internal reference
     
+    def __post_init__(self):
+        # A handful of server banners repeat across targets; share one copy of each
+        if self.server_type is not None:
+            self.server_type = sys.intern(self.server_type)
+    
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary"""
-        data = asdict(self)
-        data.pop('_internal', None)
-        return data
+        return {
+            'url': self.url,
+            'domain': self.domain,
+            'server_type': self.server_type,
+            'technology_stack': list(self.technology_stack),
+            'detected_cms': self.detected_cms,
+            'security_headers': dict(self.security_headers),
+            'response_patterns': dict(self.response_patterns)
+        }
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'TargetData':
@@ -69,7 +133,7 @@ class TargetData:
         return cls(**data)
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class ResultData:
     """Individual scan result"""
     path: str
@@ -81,32 +145,50 @@ class ResultData:
     headers: Dict[str, str] = field(default_factory=dict)
     meta: Dict[str, Any] = field(default_factory=dict)
     
+    def __post_init__(self):
+        # Content types repeat across thousands of findings; share one copy of each
+        if self.content_type is not None:
+            self.content_type = sys.intern(self.content_type)
+    
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary"""
-        return asdict(self)
+        return {
+            'path': self.path,
+            'status': self.status,
+            'size': self.size,
+            'content_type': self.content_type,
+            'redirect_location': self.redirect_location,
+            'response_time': self.response_time,
+            'headers': dict(self.headers),
+            'meta': dict(self.meta)
+        }
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'ResultData':
         """Create from dictionary"""
-        return cls(**{k: v for k, v in data.items() if k in cls.__dataclass_fields__})
+        return cls(**{name: data[name] for name in _RESULT_FIELDS if name in data})
     
     @property
     def is_success(self) -> bool:
         """Check if result is successful"""
-        return self.status in [200, 201]
+        return self.status in _SUCCESS_STATUSES
     
     @property
     def is_redirect(self) -> bool:
         """Check if result is redirect"""
-        return self.status in [301, 302, 303, 307, 308]
+        return self.status in _REDIRECT_STATUSES
     
     @property
     def is_auth_required(self) -> bool:
         """Check if authentication is required"""
-        return self.status in [401, 403]
+        return self.status in _AUTH_STATUSES
 
 
-@dataclass
+# Field names accepted by ResultData.from_dict (extra keys in the input are ignored)
+_RESULT_FIELDS = tuple(f.name for f in fields(ResultData))
+
+
+@dataclass(**DATACLASS_SLOTS)
 class ScanData:
     """Complete scan data"""
     target: str
@@ -121,13 +203,25 @@ class ScanData:
     mcp_decisions: List[Dict[str, Any]] = field(default_factory=list)
     errors: List[Dict[str, Any]] = field(default_factory=list)
     
+    def __post_init__(self):
+        if self.mcp_mode is not None:
+            self.mcp_mode = sys.intern(self.mcp_mode)
+    
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary"""
+        data = self._json_fields()
+        data['target_info'] = self.target_info.to_dict()
+        data['options'] = self.options.to_dict()
+        data['results'] = [r.to_dict() for r in self.results]
+        return data
+    
+    def _json_fields(self) -> Dict[str, Any]:
+        """Top-level fields, leaving nested data formats for _json_default to convert"""
         return {
             'target': self.target,
-            'target_info': self.target_info.to_dict(),
-            'options': self.options.to_dict(),
-            'results': [r.to_dict() for r in self.results],
+            'target_info': self.target_info,
+            'options': self.options,
+            'results': self.results,
             'statistics': self.statistics,
             'start_time': self.start_time,
             'end_time': self.end_time,
@@ -154,14 +248,18 @@ class ScanData:
             errors=data.get('errors', [])
         )
     
-    def to_json(self, indent: int = 2) -> str:
-        """Convert to JSON string"""
-        return json.dumps(self.to_dict(), indent=indent)
+    def to_json(self, indent: Optional[int] = None) -> str:
+        """Convert to JSON string (compact unless an indent is given)"""
+        return _dumps(self, indent)
+    
+    def to_json_pretty(self) -> str:
+        """Convert to indented JSON string for human readers"""
+        return self.to_json(indent=2)
     
     @classmethod
     def from_json(cls, json_str: str) -> 'ScanData':
         """Create from JSON string"""
-        return cls.from_dict(json.loads(json_str))
+        return cls.from_dict(_loads(json_str))
     
     @property
     def total_findings(self) -> int:
@@ -171,23 +269,24 @@ class ScanData:
     @property
     def successful_findings(self) -> List[ResultData]:
         """Get successful findings (2xx status)"""
-        return [r for r in self.results if r.is_success]
+        return self.get_findings_by_status(_SUCCESS_STATUSES)
     
     @property
     def auth_required_findings(self) -> List[ResultData]:
         """Get auth required findings (401/403)"""
-        return [r for r in self.results if r.is_auth_required]
+        return self.get_findings_by_status(_AUTH_STATUSES)
     
     @property
     def redirect_findings(self) -> List[ResultData]:
         """Get redirect findings (3xx)"""
-        return [r for r in self.results if r.is_redirect]
+        return self.get_findings_by_status(_REDIRECT_STATUSES)
     
-    def get_findings_by_status(self, status: Union[int, List[int]]) -> List[ResultData]:
-        """Get findings by status code(s)"""
+    def get_findings_by_status(self, status: Union[int, Iterable[int]]) -> List[ResultData]:
+        """Get findings by status code(s), in scan order"""
         if isinstance(status, int):
-            status = [status]
-        return [r for r in self.results if r.status in status]
+            return [r for r in self.results if r.status == status]
+        statuses = status if isinstance(status, (set, frozenset)) else set(status)
+        return [r for r in self.results if r.status in statuses]
     
     def get_findings_by_extension(self, extension: str) -> List[ResultData]:
         """Get findings by file extension"""
@@ -196,8 +295,14 @@ class ScanData:
     def export_to_file(self, filepath: str, format: str = 'json'):
         """Export scan data to file"""
         if format == 'json':
-            with open(filepath, 'w') as f:
-                f.write(self.to_json())
+            orjson = get_orjson()
+            if orjson:
+                with open(filepath, 'wb') as f:
+                    f.write(orjson.dumps(self, default=_json_default,
+                                         option=orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATACLASS))
+            else:
+                with open(filepath, 'w') as f:
+                    f.write(self.to_json())
         else:
             raise ValueError(f"Unsupported format: {format}")
     
@@ -205,7 +310,7 @@ class ScanData:
     def import_from_file(cls, filepath: str, format: str = 'json') -> 'ScanData':
         """Import scan data from file"""
         if format == 'json':
-            with open(filepath, 'r') as f:
+            with open(filepath, 'rb' if get_orjson() else 'r') as f:
                 return cls.from_json(f.read())
         else:
             raise ValueError(f"Unsupported format: {format}")
@@ -225,47 +330,65 @@ class ExchangeFormat:
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary"""
+        data = self._json_fields()
+        data['scan_data'] = self.scan_data.to_dict() if self.scan_data else None
+        return data
+    
+    def _json_fields(self) -> Dict[str, Any]:
+        """Top-level fields, leaving scan_data for _json_default to convert"""
         return {
             'version': self.version,
             'tool': self.tool,
             'timestamp': self.timestamp,
-            'scan_data': self.scan_data.to_dict() if self.scan_data else None,
+            'scan_data': self.scan_data,
             'metadata': self.metadata
         }
     
-    def to_json(self, indent: int = 2) -> str:
-        """Convert to JSON string"""
-        return json.dumps(self.to_dict(), indent=indent)
+    def to_json(self, indent: Optional[int] = None) -> str:
+        """Convert to JSON string (compact unless an indent is given)"""
+        return _dumps(self._json_fields(), indent)
+    
+    def to_json_pretty(self) -> str:
+        """Convert to indented JSON string for human readers"""
+        return self.to_json(indent=2)
     
     def to_xml(self) -> str:
         """Convert to XML format (for tools that prefer XML)"""
-        # Simple XML conversion
-        xml = f'<?xml version="1.0" encoding="UTF-8"?>\n'
-        xml += f'<scan version="{self.version}" tool="{self.tool}" timestamp="{self.timestamp}">\n'
+        attr = {'"': '&quot;'}
+        parts = [
+            '<?xml version="1.0" encoding="UTF-8"?>\n',
+            f'<scan version="{escape(self.version, attr)}" tool="{escape(self.tool, attr)}" '
+            f'timestamp="{escape(self.timestamp, attr)}">\n'
+        ]
         
         if self.scan_data:
-            xml += f'  <target>{self.scan_data.target}</target>\n'
-            xml += f'  <findings count="{self.scan_data.total_findings}">\n'
+            parts.append(f'  <target>{escape(self.scan_data.target)}</target>\n')
+            parts.append(f'  <findings count="{self.scan_data.total_findings}">\n')
             
             for result in self.scan_data.results:
-                xml += f'    <finding>\n'
-                xml += f'      <path>{result.path}</path>\n'
-                xml += f'      <status>{result.status}</status>\n'
-                xml += f'      <size>{result.size}</size>\n'
-                xml += f'    </finding>\n'
+                parts.append(
+                    f'    <finding>\n'
+                    f'      <path>{escape(result.path)}</path>\n'
+                    f'      <status>{result.status}</status>\n'
+                    f'      <size>{result.size}</size>\n'
+                    f'    </finding>\n'
+                )
                 
-            xml += f'  </findings>\n'
+            parts.append('  </findings>\n')
             
-        xml += '</scan>\n'
-        return xml
+        parts.append('</scan>\n')
+        return ''.join(parts)
     
     def to_csv(self) -> str:
         """Convert to CSV format"""
         if not self.scan_data:
             return ""
             
-        csv = "path,status,size,content_type,response_time\n"
-        for result in self.scan_data.results:
-            csv += f'"{result.path}",{result.status},{result.size},"{result.content_type or ""}",{result.response_time or 0}\n'
-            
-        return csv
\ No newline at end of file
+        buffer = io.StringIO()
+        writer = csv.writer(buffer, lineterminator='\n')
+        writer.writerow(['path', 'status', 'size', 'content_type', 'response_time'])
+        writer.writerows(
+            (r.path, r.status, r.size, r.content_type or '', r.response_time or 0)
+            for r in self.scan_data.results
+        )
+        return buffer.getvalue()
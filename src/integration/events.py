@@ -5,7 +5,7 @@ Provides event hooks and event types
 
 import asyncio
 from enum import Enum
-from typing import List, Callable, Any, Coroutine
+from typing import Dict, List, Set, Tuple, Callable, Any, Coroutine
 import inspect
 
 
@@ -21,6 +21,16 @@ class EventType(Enum):
     PLUGIN_UNLOADED = "plugin_unloaded"
 
 
+def run_in_executor(handler: Callable) -> Callable:
+    """
+    Mark a sync handler as blocking so EventHook runs it in the default executor
+    
+    Unmarked sync handlers are called inline on the event loop.
+    """
+    handler._run_in_executor = True
+    return handler
+
+
 class EventHook:
     """
     Event hook implementation
@@ -29,9 +39,17 @@ class EventHook:
     Example:
         hook = EventHook()
         
-        # Register sync handler
+        # Register sync handler (called inline)
         hook += lambda data: print(f"Event: {data}")
         
+        # Register blocking sync handler (run in the default executor)
+        @run_in_executor
+        def save_handler(data):
+            with open('events.log', 'a') as f:
+                f.write(f"{data}\n")
+        
+        hook += save_handler
+        
         # Register async handler
         async def async_handler(data):
             await asyncio.sleep(1)
@@ -45,7 +63,10 @@ class EventHook:
     
     def __init__(self):
         """Initialize event hook"""
-        self._handlers: List[Callable] = []
+        # (handler, is_async) pairs; the coroutine check is done once at registration
+        self._handlers: List[Tuple[Callable, bool]] = []
+        # Membership index for hashable handlers (unhashable ones fall back to the list)
+        self._handler_set: Set[Callable] = set()
         
     def __iadd__(self, handler: Callable):
         """Add a handler using += operator"""
@@ -64,8 +85,14 @@ class EventHook:
         Args:
             handler: Callable to handle the event
         """
-        if handler not in self._handlers:
-            self._handlers.append(handler)
+        try:
+            if handler in self._handler_set:
+                return
+            self._handler_set.add(handler)
+        except TypeError:
+            if any(registered == handler for registered, _ in self._handlers):
+                return
+        self._handlers.append((handler, inspect.iscoroutinefunction(handler)))
             
     def unregister(self, handler: Callable):
         """
@@ -74,12 +101,21 @@ class EventHook:
         Args:
             handler: Handler to remove
         """
-        if handler in self._handlers:
-            self._handlers.remove(handler)
+        try:
+            if handler not in self._handler_set:
+                return
+            self._handler_set.discard(handler)
+        except TypeError:
+            pass
+        for index, (registered, _) in enumerate(self._handlers):
+            if registered == handler:
+                del self._handlers[index]
+                break
             
     def clear(self):
         """Remove all handlers"""
         self._handlers.clear()
+        self._handler_set.clear()
         
     async def fire(self, data: Any = None):
         """
@@ -90,17 +126,19 @@ class EventHook:
         """
         tasks = []
         
-        for handler in self._handlers:
+        for handler, is_async in self._handlers:
             try:
-                if inspect.iscoroutinefunction(handler):
+                if is_async:
                     # Async handler
                     task = asyncio.create_task(handler(data))
                     tasks.append(task)
+                elif getattr(handler, '_run_in_executor', False):
+                    # Blocking sync handler - run in executor
+                    loop = asyncio.get_running_loop()
+                    tasks.append(loop.run_in_executor(None, handler, data))
                 else:
-                    # Sync handler - run in executor
-                    loop = asyncio.get_event_loop()
-                    task = loop.run_in_executor(None, handler, data)
-                    tasks.append(task)
+                    # Sync handler - call inline
+                    handler(data)
             except Exception as e:
                 print(f"Error in event handler: {e}")
                 
@@ -183,8 +221,10 @@ class EventEmitter:
             event_name: Name of the event
             handler: Handler function
         """
+        is_async = inspect.iscoroutinefunction(handler)
+        
         async def wrapper(data):
-            await handler(data) if inspect.iscoroutinefunction(handler) else handler(data)
+            await handler(data) if is_async else handler(data)
             self.off(event_name, wrapper)
             
         self.on(event_name, wrapper)
\ No newline at end of file
@@ -4,11 +4,11 @@ Provides a clean API for external tool integration
 """
 
 import asyncio
+import os
 from typing import Dict, List, Any, Optional, Callable, Union
-from pathlib import Path
-import json
 from datetime import datetime
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, asdict, fields
+from functools import cached_property
 
 from src.config.settings import Settings
 from src.core.dirsearch_engine import DirsearchEngine, ScanRequest, ScanResponse
@@ -21,6 +21,15 @@ from .events import EventHook, EventType
 from .data_formats import ScanData, TargetData, ResultData, ScanOptions
 
 
+# ScanOptions fields copied onto each ScanRequest (everything they share)
+_SCAN_REQUEST_FIELDS = tuple(
+    f.name for f in fields(ScanRequest) if f.name in {g.name for g in fields(ScanOptions)}
+)
+
+# Result statuses reported as FINDING_DISCOVERED events
+_FINDING_STATUSES = frozenset({200, 201, 301, 302, 401, 403})
+
+
 class DirsearchMCP:
     """
     Main integration class for Dirsearch MCP
@@ -51,10 +60,7 @@ class DirsearchMCP:
             config_file: Optional path to configuration file
         """
         self.settings = Settings(config_file)
-        self.engine = DirsearchEngine(self.settings)
-        self.mcp = MCPCoordinator(self.settings)
         self.logger = LoggerSetup.get_logger(__name__)
-        self.reporter = ReportGenerator()
         
         # Plugin system
         self.plugin_manager = PluginManager()
@@ -72,6 +78,23 @@ class DirsearchMCP:
         # Initialize
         LoggerSetup.initialize()
         
+    # Heavy components are built on first use, so light callers never pay for them
+    
+    @cached_property
+    def engine(self) -> DirsearchEngine:
+        """Scan engine"""
+        return DirsearchEngine(self.settings)
+    
+    @cached_property
+    def mcp(self) -> MCPCoordinator:
+        """MCP coordinator"""
+        return MCPCoordinator(self.settings)
+    
+    @cached_property
+    def reporter(self) -> ReportGenerator:
+        """Report generator"""
+        return ReportGenerator()
+        
     async def initialize(self):
         """Initialize MCP coordinator and plugins"""
         await self.mcp.initialize()
@@ -94,11 +117,12 @@ class DirsearchMCP:
             options = ScanOptions()
             
         # Emit scan started event
-        await self._emit_event(EventType.SCAN_STARTED, {
-            'target': target,
-            'options': asdict(options),
-            'timestamp': datetime.now().isoformat()
-        })
+        if self._has_listeners(EventType.SCAN_STARTED):
+            await self._emit_event(EventType.SCAN_STARTED, {
+                'target': target,
+                'options': asdict(options),
+                'timestamp': datetime.now().isoformat()
+            })
         
         try:
             # Analyze target
@@ -116,18 +140,7 @@ class DirsearchMCP:
             # Create scan request
             scan_request = ScanRequest(
                 base_url=target,
-                wordlist=options.wordlist,
-                extensions=options.extensions,
-                threads=options.threads,
-                timeout=options.timeout,
-                delay=options.delay,
-                user_agent=options.user_agent,
-                follow_redirects=options.follow_redirects,
-                custom_headers=options.custom_headers,
-                proxy=options.proxy,
-                max_retries=options.max_retries,
-                exclude_status=options.exclude_status,
-                include_status=options.include_status
+                **{name: getattr(options, name) for name in _SCAN_REQUEST_FIELDS}
             )
             
             # Execute scan with progress tracking
@@ -147,17 +160,18 @@ class DirsearchMCP:
             )
             
             # Emit scan completed event
-            await self._emit_event(EventType.SCAN_COMPLETED, asdict(scan_data))
+            await self._emit_event(EventType.SCAN_COMPLETED, scan_data)
             
             return scan_data
             
         except Exception as e:
             # Emit error event
-            await self._emit_event(EventType.ERROR_OCCURRED, {
-                'error': str(e),
-                'target': target,
-                'timestamp': datetime.now().isoformat()
-            })
+            if self._has_listeners(EventType.ERROR_OCCURRED):
+                await self._emit_event(EventType.ERROR_OCCURRED, {
+                    'error': str(e),
+                    'target': target,
+                    'timestamp': datetime.now().isoformat()
+                })
             raise
     
     async def analyze_target(self, url: str) -> TargetData:
@@ -186,7 +200,7 @@ class DirsearchMCP:
         target_data._internal = target_info
         
         # Emit target analyzed event
-        await self._emit_event(EventType.TARGET_ANALYZED, asdict(target_data))
+        await self._emit_event(EventType.TARGET_ANALYZED, target_data)
         
         return target_data
     
@@ -212,11 +226,11 @@ class DirsearchMCP:
             'end_time': scan_data.end_time,
             'duration': scan_data.duration,
             'intelligence_mode': scan_data.mcp_mode,
-            'target_analysis': asdict(scan_data.target_info),
+            'target_analysis': scan_data.target_info.to_dict(),
             'scan_results': [{
                 'task_id': 'api_scan',
                 'status': 'completed',
-                'findings': [asdict(r) for r in scan_data.results],
+                'findings': [r.to_dict() for r in scan_data.results],
                 'metrics': scan_data.statistics,
                 'timestamp': scan_data.end_time
             }],
@@ -317,26 +331,29 @@ class DirsearchMCP:
         Args:
             **kwargs: Configuration parameters
         """
+        scan_config = self.settings.default_scan_config
         for key, value in kwargs.items():
-            if hasattr(self.settings.default_scan_config, key):
-                self.settings.default_scan_config[key] = value
+            if key in scan_config:
+                scan_config[key] = value
     
     # Utility methods
     
     async def get_wordlists(self) -> List[Dict[str, str]]:
         """Get available wordlists"""
-        wordlists_dir = Path(self.settings.paths.get('wordlists', 'wordlists'))
-        wordlists = []
-        
-        if wordlists_dir.exists():
-            for file in wordlists_dir.glob('*.txt'):
-                wordlists.append({
-                    'name': file.name,
-                    'path': str(file),
-                    'size': file.stat().st_size
-                })
-                
-        return wordlists
+        wordlists_dir = self.settings.paths.get('wordlists', 'wordlists')
+        if isinstance(wordlists_dir, dict):
+            wordlists_dir = wordlists_dir.get('base', wordlists_dir.get('general', 'wordlists'))
+            
+        # DirEntry caches the stat from the directory scan, one syscall per file
+        try:
+            with os.scandir(wordlists_dir) as entries:
+                return [
+                    {'name': entry.name, 'path': entry.path, 'size': entry.stat().st_size}
+                    for entry in entries
+                    if entry.name.endswith('.txt') and entry.is_file(follow_symlinks=False)
+                ]
+        except FileNotFoundError:
+            return []
     
     async def validate_target(self, url: str) -> bool:
         """
@@ -362,38 +379,83 @@ class DirsearchMCP:
         original_execute = self.engine.execute_scan
         
         async def progress_wrapper(request):
-            # Start progress tracking
-            total_paths = len(self.engine._load_wordlist(request.wordlist))
-            processed = 0
+            # The engine reports every checked path; a background task turns the
+            # latest count into at most one PROGRESS_UPDATE per interval
+            progress = {'processed': 0, 'total': 0, 'sent': (0, 0)}
+            consumer = None
+            if self._has_listeners(EventType.PROGRESS_UPDATE):
+                def track(processed: int, total: int):
+                    progress['processed'] = processed
+                    progress['total'] = total
+                
+                previous_callback = self.engine._progress_callback
+                self.engine.set_progress_callback(track)
+                consumer = asyncio.create_task(self._progress_consumer(
+                    progress, self.settings.performance.get('progress_update_interval', 0.5)))
             
-            # Execute scan
-            response = await original_execute(request)
+            try:
+                # Execute scan
+                response = await original_execute(request)
+            finally:
+                if consumer:
+                    consumer.cancel()
+                    await asyncio.gather(consumer, return_exceptions=True)
+                    self.engine.set_progress_callback(previous_callback)
             
-            # Emit progress updates periodically
-            for i, result in enumerate(response.results):
-                processed += 1
-                if processed % 10 == 0:  # Update every 10 paths
-                    await self._emit_event(EventType.PROGRESS_UPDATE, {
-                        'processed': processed,
-                        'total': total_paths,
-                        'percentage': (processed / total_paths) * 100,
-                        'current_path': result.get('path', '')
-                    })
-                
-                # Emit finding event
-                if result.get('status', 0) in [200, 201, 301, 302, 401, 403]:
-                    await self._emit_event(EventType.FINDING_DISCOVERED, result)
+            # Emit the final progress (unless already reported) and every finding as one batch;
+            # a scan that never reported progress is completed with its wordlist size
+            events = []
+            if consumer and not progress['total'] and response.total_paths:
+                progress['processed'] = progress['total'] = response.total_paths
+            if consumer and (progress['processed'], progress['total']) != progress['sent']:
+                events.append(self._emit_progress(progress))
+            
+            events.extend(
+                self._emit_event(EventType.FINDING_DISCOVERED, result)
+                for result in response.results
+                if result.get('status', 0) in _FINDING_STATUSES
+            )
+            
+            if events:
+                await asyncio.gather(*events, return_exceptions=True)
             
             return response
         
         return await progress_wrapper(scan_request)
     
-    async def _emit_event(self, event_type: EventType, data: Dict[str, Any]):
-        """Emit an event to all registered handlers"""
-        if event_type in self.events:
-            await self.events[event_type].fire(data)
+    async def _progress_consumer(self, progress: Dict[str, Any], interval: float):
+        """Emit the freshest progress snapshot once per interval while a scan runs"""
+        while True:
+            await asyncio.sleep(interval)
+            if progress['total'] and (progress['processed'], progress['total']) != progress['sent']:
+                await self._emit_progress(progress)
+    
+    async def _emit_progress(self, progress: Dict[str, Any]):
+        """Emit a PROGRESS_UPDATE for the current snapshot"""
+        processed, total = progress['processed'], progress['total']
+        progress['sent'] = (processed, total)
+        await self._emit_event(EventType.PROGRESS_UPDATE, {
+            'processed': processed,
+            'total': total,
+            'percentage': (processed / total) * 100 if total else 0
+        })
+    
+    def _has_listeners(self, event_type: EventType) -> bool:
+        """Check if any handler or plugin could receive an event"""
+        hook = self.events.get(event_type)
+        return hook is not None and (hook.handler_count() > 0
+                                     or self.plugin_manager.has_listeners(event_type))
+    
+    async def _emit_event(self, event_type: EventType,
+                          data: Union[Dict[str, Any], ScanData, TargetData]):
+        """Emit an event to all registered handlers (scan/target events carry the objects)"""
+        # Only await the side that has listeners; with neither, no coroutine is created
+        hook = self.events.get(event_type)
+        if hook is not None and hook.handler_count():
+            await hook.fire(data)
             
-            # Also notify plugins
+        # Also notify plugins
+        if self.plugin_manager.has_listeners(event_type):
             await self.plugin_manager.notify_event(event_type, data)
     
     # Context manager support
@@ -405,5 +467,5 @@ class DirsearchMCP:
     
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """Async context manager exit"""
-        # Cleanup if needed
-        pass
\ No newline at end of file
+        if 'mcp' in self.__dict__:
+            await self.mcp.close()
\ No newline at end of file
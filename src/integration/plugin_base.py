@@ -7,11 +7,14 @@ import abc
 import asyncio
 import importlib.util
 import inspect
-from typing import Dict, List, Any, Optional, Type
+from typing import Dict, List, Any, Optional, Tuple, Type, Union
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 import json
 import sys
 
+from src.utils.logger import LoggerSetup
+
 from .events import EventType
 from .data_formats import ScanData, TargetData, ResultData
 
@@ -99,7 +102,8 @@ class Plugin(abc.ABC):
         
     def log(self, message: str, level: str = "info"):
         """Log a message"""
-        print(f"[{self.name}] {level.upper()}: {message}")
+        logger = LoggerSetup.get_logger(__name__)
+        getattr(logger, level.lower(), logger.info)(f"[{self.name}] {message}")
         
     def enable(self):
         """Enable the plugin"""
@@ -119,10 +123,23 @@ class PluginManager:
     Manages plugins for Dirsearch MCP
     """
     
+    # Plugin method handling each event type
+    _HANDLER_NAMES = {
+        EventType.SCAN_STARTED: 'on_scan_started',
+        EventType.SCAN_COMPLETED: 'on_scan_completed',
+        EventType.TARGET_ANALYZED: 'on_target_analyzed',
+        EventType.FINDING_DISCOVERED: 'on_finding',
+        EventType.ERROR_OCCURRED: 'on_error',
+        EventType.PROGRESS_UPDATE: 'on_progress'
+    }
+    
     def __init__(self):
         """Initialize plugin manager"""
         self.plugins: Dict[str, Plugin] = {}
         self._plugin_classes: Dict[str, Type[Plugin]] = {}
+        # Plugins overriding each event's handler, so unhandled events cost one lookup
+        self._listeners: Dict[EventType, List[Plugin]] = {}
+        self.logger = LoggerSetup.get_logger(__name__)
         
     def register_plugin(self, plugin_class: Type[Plugin], 
                        config: Optional[Dict[str, Any]] = None):
@@ -141,9 +158,23 @@ class PluginManager:
         
         # Instantiate plugin
         plugin = plugin_class(config)
+        # Bind the handlers it overrides once; inherited no-ops are never scheduled
+        plugin._bound_handlers = {
+            event_type: getattr(plugin, handler_name)
+            for event_type, handler_name in self._HANDLER_NAMES.items()
+            if getattr(plugin_class, handler_name, None) is not getattr(Plugin, handler_name)
+        }
+        
+        previous = self.plugins.get(plugin_name)
+        if previous is not None:
+            for listeners in self._listeners.values():
+                if previous in listeners:
+                    listeners.remove(previous)
+        for event_type in plugin._bound_handlers:
+            self._listeners.setdefault(event_type, []).append(plugin)
         self.plugins[plugin_name] = plugin
         
-        print(f"Registered plugin: {plugin_name} v{plugin.version}")
+        self.logger.info(f"Registered plugin: {plugin_name} v{plugin.version}")
         
     def load_plugin(self, plugin_path: str):
         """
@@ -152,9 +183,13 @@ class PluginManager:
         Args:
             plugin_path: Path to plugin file
         """
-        path = Path(plugin_path)
+        for plugin_class, config in self._import_plugin(Path(plugin_path)):
+            self.register_plugin(plugin_class, config)
+            
+    def _import_plugin(self, path: Path) -> List[Tuple[Type[Plugin], Dict[str, Any]]]:
+        """Import a plugin file and return its plugin classes with their config"""
         if not path.exists():
-            raise FileNotFoundError(f"Plugin file not found: {plugin_path}")
+            raise FileNotFoundError(f"Plugin file not found: {path}")
             
         # Load module
         spec = importlib.util.spec_from_file_location(path.stem, path)
@@ -162,22 +197,27 @@ class PluginManager:
         sys.modules[path.stem] = module
         spec.loader.exec_module(module)
         
+        # Load config if exists
+        config_path = path.with_suffix('.json')
+        config = {}
+        if config_path.exists():
+            with open(config_path, 'r') as f:
+                config = json.load(f)
+                
         # Find plugin classes
-        for name, obj in inspect.getmembers(module):
-            if inspect.isclass(obj) and issubclass(obj, Plugin) and obj != Plugin:
-                # Load config if exists
-                config_path = path.with_suffix('.json')
-                config = {}
-                if config_path.exists():
-                    with open(config_path, 'r') as f:
-                        config = json.load(f)
-                        
-                self.register_plugin(obj, config)
+        return [
+            (obj, dict(config))
+            for name, obj in inspect.getmembers(module)
+            if inspect.isclass(obj) and issubclass(obj, Plugin) and obj != Plugin
+        ]
                 
     def load_plugins_from_directory(self, directory: str):
         """
         Load all plugins from a directory
         
+        Plugin files are imported concurrently (their top-level imports may be
+        slow), then registered in directory order on the calling thread.
+        
         Args:
             directory: Directory containing plugin files
         """
@@ -185,75 +225,89 @@ class PluginManager:
         if not plugin_dir.exists():
             return
             
-        for file in plugin_dir.glob('*.py'):
-            if file.name.startswith('_'):
-                continue
+        files = [file for file in plugin_dir.glob('*.py') if not file.name.startswith('_')]
+        if not files:
+            return
+            
+        with ThreadPoolExecutor(max_workers=min(8, len(files))) as pool:
+            imported = list(pool.map(self._safe_import_plugin, files))
+            
+        for file, plugin_classes in zip(files, imported):
             try:
-                self.load_plugin(str(file))
+                for plugin_class, config in plugin_classes:
+                    self.register_plugin(plugin_class, config)
             except Exception as e:
-                print(f"Failed to load plugin {file.name}: {e}")
+                self.logger.error(f"Failed to load plugin {file.name}: {e}")
+                
+    def _safe_import_plugin(self, path: Path) -> List[Tuple[Type[Plugin], Dict[str, Any]]]:
+        """Import a plugin file, logging failures instead of raising"""
+        try:
+            return self._import_plugin(path)
+        except Exception as e:
+            self.logger.error(f"Failed to load plugin {path.name}: {e}")
+            return []
                 
     async def initialize_plugins(self):
-        """Initialize all registered plugins"""
-        for name, plugin in self.plugins.items():
-            if plugin.is_enabled() and not plugin._initialized:
-                try:
-                    await plugin.initialize()
-                    plugin._initialized = True
-                    print(f"Initialized plugin: {name}")
-                except Exception as e:
-                    print(f"Failed to initialize plugin {name}: {e}")
-                    plugin.disable()
+        """Initialize all registered plugins concurrently"""
+        await asyncio.gather(*(
+            self._initialize_plugin(name, plugin)
+            for name, plugin in self.plugins.items()
+            if plugin.is_enabled() and not plugin._initialized
+        ))
+        
+    async def _initialize_plugin(self, name: str, plugin: Plugin):
+        """Initialize one plugin, disabling it on failure"""
+        try:
+            await plugin.initialize()
+            plugin._initialized = True
+            self.logger.info(f"Initialized plugin: {name}")
+        except Exception as e:
+            self.logger.error(f"Failed to initialize plugin {name}: {e}")
+            plugin.disable()
                     
     async def cleanup_plugins(self):
-        """Cleanup all plugins"""
-        for name, plugin in self.plugins.items():
-            if plugin._initialized:
-                try:
-                    await plugin.cleanup()
-                    print(f"Cleaned up plugin: {name}")
-                except Exception as e:
-                    print(f"Failed to cleanup plugin {name}: {e}")
+        """Cleanup all plugins concurrently"""
+        await asyncio.gather(*(
+            self._cleanup_plugin(name, plugin)
+            for name, plugin in self.plugins.items()
+            if plugin._initialized
+        ))
+        
+    async def _cleanup_plugin(self, name: str, plugin: Plugin):
+        """Cleanup one plugin"""
+        try:
+            await plugin.cleanup()
+            self.logger.info(f"Cleaned up plugin: {name}")
+        except Exception as e:
+            self.logger.error(f"Failed to cleanup plugin {name}: {e}")
                     
-    async def notify_event(self, event_type: EventType, data: Dict[str, Any]):
+    async def notify_event(self, event_type: EventType,
+                           data: Union[Dict[str, Any], ScanData, TargetData]):
         """
         Notify all plugins of an event
         
         Args:
             event_type: Type of event
-            data: Event data
+            data: Event data (ScanData / TargetData for scan completed / target analyzed)
         """
-        # Map event types to handler methods
-        handlers = {
-            EventType.SCAN_STARTED: 'on_scan_started',
-            EventType.SCAN_COMPLETED: 'on_scan_completed',
-            EventType.TARGET_ANALYZED: 'on_target_analyzed',
-            EventType.FINDING_DISCOVERED: 'on_finding',
-            EventType.ERROR_OCCURRED: 'on_error',
-            EventType.PROGRESS_UPDATE: 'on_progress'
-        }
-        
-        handler_name = handlers.get(event_type)
-        if not handler_name:
+        listeners = self._listeners.get(event_type)
+        if not listeners:
             return
             
-        # Convert data to appropriate type if needed
-        if event_type == EventType.SCAN_COMPLETED and isinstance(data, dict):
-            data = ScanData.from_dict(data)
-        elif event_type == EventType.TARGET_ANALYZED and isinstance(data, dict):
-            data = TargetData.from_dict(data)
-            
-        # Notify all enabled plugins
-        tasks = []
-        for plugin in self.plugins.values():
-            if plugin.is_enabled() and plugin._initialized:
-                handler = getattr(plugin, handler_name, None)
-                if handler:
-                    tasks.append(handler(data))
+        # Notify all enabled plugins that handle this event
+        tasks = [
+            plugin._bound_handlers[event_type](data)
+            for plugin in listeners
+            if plugin.is_enabled() and plugin._initialized
+        ]
                     
         if tasks:
             await asyncio.gather(*tasks, return_exceptions=True)
             
+    def has_listeners(self, event_type: EventType) -> bool:
+        """Check if any registered plugin handles an event type"""
+        return bool(self._listeners.get(event_type))
+        
     def get_plugin(self, name: str) -> Optional[Plugin]:
         """Get a plugin by name"""
         return self.plugins.get(name)
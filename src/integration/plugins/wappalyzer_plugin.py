@@ -6,13 +6,26 @@ Detects technologies used by the target website
 import aiohttp
 import asyncio
 import json
-from typing import Dict, List, Any, Optional
+import re
+import secrets
+from typing import Dict, List, Any, Optional, Pattern, Set, Tuple
 from pathlib import Path
+from urllib.parse import urljoin
+
+try:
+    import ahocorasick  # type: ignore
+except ImportError:
+    ahocorasick = None  # type: ignore
 
 from ..plugin_base import Plugin
 from ..data_formats import TargetData
 
 
+def _as_raw(text: str) -> str:
+    """View a pattern's UTF-8 bytes as latin-1 text, to match against raw page bytes"""
+    return text.encode('utf-8').decode('latin-1')
+
+
 class WappalyzerPlugin(Plugin):
     """
     Wappalyzer plugin for technology detection
@@ -45,13 +58,25 @@ class WappalyzerPlugin(Plugin):
         self.timeout = self.get_config('timeout', 10)
         self.user_agent = self.get_config('user_agent', 
             'Mozilla/5.0 (compatible; Wappalyzer/1.0)')
+        # Pages fetched alongside the target; error pages often name the server stack
+        self.probe_paths = self.get_config('probe_paths',
+            ['/robots.txt', f'/nonexistent-{secrets.token_hex(8)}'])
         
     async def initialize(self):
         """Initialize the plugin"""
         self.log("Initializing Wappalyzer plugin...")
         
-        # Create HTTP session
+        # Create HTTP session; it is shared by every analysis, so pooled keep-alive
+        # connections and cached DNS answers are reused across targets
+        connector = aiohttp.TCPConnector(
+            limit=100,
+            limit_per_host=8,
+            ttl_dns_cache=300,
+            keepalive_timeout=30,
+            enable_cleanup_closed=True
+        )
         self.session = aiohttp.ClientSession(
+            connector=connector,
             timeout=aiohttp.ClientTimeout(total=self.timeout),
             headers={'User-Agent': self.user_agent}
         )
@@ -64,7 +89,9 @@ class WappalyzerPlugin(Plugin):
     async def cleanup(self):
         """Cleanup plugin resources"""
         if self.session:
+            # The session owns its connector, so this also closes pooled connections
             await self.session.close()
+            self.session = None
             
     async def _load_technologies_db(self):
         """Load Wappalyzer technologies database"""
@@ -109,6 +136,47 @@ class WappalyzerPlugin(Plugin):
                 'cookies': {'ASP.NET_SessionId': ''}
             }
         }
+        self._build_matchers()
+        
+    def _build_matchers(self):
+        """Index the detection patterns so a page is matched in one pass"""
+        # Pages are matched as raw bytes (see _detect_technologies), so every pattern
+        # is stored as its UTF-8 bytes viewed through latin-1, one character per byte.
+        # Script, style and HTML patterns are plain substrings unless they contain a
+        # regex escape (e.g. jquery-\\d+); literal -> technologies owning it
+        self._literal_owners: Dict[str, List[str]] = {}
+        self._regex_rules: List[Tuple[Pattern, str]] = []
+        # (technology, name="..." marker, content pattern); both must appear in the page
+        self._meta_rules: List[Tuple[str, str, str]] = []
+        self._header_rules: Dict[str, List[Tuple[str, str]]] = {}
+        self._cookie_rules: Dict[str, List[str]] = {}
+        
+        for tech_name, tech_data in self.technologies_db.items():
+            for bucket in ('scripts', 'styles', 'html'):
+                for pattern in tech_data.get(bucket, ()):
+                    if '\\' in pattern:
+                        self._regex_rules.append((re.compile(_as_raw(pattern)), tech_name))
+                    else:
+                        self._literal_owners.setdefault(_as_raw(pattern), []).append(tech_name)
+            for meta_name, pattern in tech_data.get('meta', {}).items():
+                self._meta_rules.append((tech_name, _as_raw(f'name="{meta_name}"'), _as_raw(pattern)))
+            for header, pattern in tech_data.get('headers', {}).items():
+                self._header_rules.setdefault(header, []).append((pattern, tech_name))
+            for cookie_name in tech_data.get('cookies', {}):
+                self._cookie_rules.setdefault(cookie_name, []).append(tech_name)
+                
+        # Every literal the page is searched for: one Aho-Corasick pass when
+        # pyahocorasick is installed, otherwise one containment test each
+        self._literals: Set[str] = set(self._literal_owners)
+        for _, marker, pattern in self._meta_rules:
+            self._literals.update((marker, pattern))
+        self._literals.discard('')
+        self._automaton = None
+        if ahocorasick and self._literals:
+            self._automaton = ahocorasick.Automaton()
+            for literal in self._literals:
+                self._automaton.add_word(literal, literal)
+            self._automaton.make_automaton()
         
     async def on_target_analyzed(self, target_data: TargetData):
         """
@@ -158,82 +226,84 @@ class WappalyzerPlugin(Plugin):
         detected = []
         
         try:
-            # Fetch the homepage
-            async with self.session.get(target_data.url) as response:
-                html = await response.text()
-                headers = dict(response.headers)
+            # Fetch the homepage and the probe pages concurrently
+            urls = [target_data.url] + [urljoin(target_data.url, path) for path in self.probe_paths]
+            pages = await asyncio.gather(*(self._fetch(url) for url in urls),
+                                         return_exceptions=True)
+            fetched = [page for page in pages if not isinstance(page, BaseException)]
+            if not fetched:
+                raise pages[0]
                 
-                # Check each technology
-                for tech_name, tech_data in self.technologies_db.items():
-                    if await self._check_technology(tech_name, tech_data, 
-                                                  html, headers, target_data):
+            # Match against the merged corpus; the homepage's headers win on conflicts.
+            # Bodies stay undecoded: latin-1 maps each byte to one character without
+            # charset sniffing or validation, so patterns match the raw bytes
+            body = b'\n'.join(page_body for page_body, _ in fetched)
+            headers = {}
+            for _, page_headers in reversed(fetched):
+                headers.update(page_headers)
+                
+            matched = self._match_technologies(body.decode('latin-1'), headers, target_data)
+            
+            # Report in database order, each followed by the technologies it implies
+            for tech_name, tech_data in self.technologies_db.items():
+                if tech_name in matched:
+                    if tech_name not in detected:
                         detected.append(tech_name)
-                        
-                        # Add implied technologies
-                        if 'implies' in tech_data:
-                            for implied in tech_data['implies']:
-                                if implied not in detected:
-                                    detected.append(implied)
-                                    
+                    
+                    # Add implied technologies
+                    if 'implies' in tech_data:
+                        for implied in tech_data['implies']:
+                            if implied not in detected:
+                                detected.append(implied)
+                                
         except Exception as e:
             self.log(f"Error detecting technologies: {e}", "error")
             
         return detected
         
-    async def _check_technology(self, name: str, data: Dict[str, Any], 
-                              html: str, headers: Dict[str, str],
-                              target_data: TargetData) -> bool:
+    async def _fetch(self, url: str) -> Tuple[bytes, Dict[str, str]]:
+        """Fetch a page, returning its raw body and response headers"""
+        async with self.session.get(url) as response:
+            return await response.read(), dict(response.headers)
+            
+    def _match_technologies(self, html: str, headers: Dict[str, str],
+                            target_data: TargetData) -> Set[str]:
         """
-        Check if a specific technology is present
+        Find every technology whose patterns match the page
         
         Args:
-            name: Technology name
-            data: Technology detection patterns
-            html: Page HTML
+            html: Page content (raw bytes decoded as latin-1)
             headers: Response headers
             target_data: Target data
             
         Returns:
-            True if technology is detected
+            Names of the matching technologies
         """
+        # Check scripts, styles, HTML patterns and meta tags
+        if self._automaton is not None:
+            found = {literal for _, literal in self._automaton.iter(html)}
+        else:
+            found = {literal for literal in self._literals if literal in html}
+        matched = {tech for literal in found for tech in self._literal_owners.get(literal, ())}
+        matched.update(tech for regex, tech in self._regex_rules
+                       if tech not in matched and regex.search(html))
+        matched.update(tech for tech, marker, pattern in self._meta_rules
+                       if marker in found and (not pattern or pattern in found))
+        
         # Check headers
-        if 'headers' in data:
-            for header, pattern in data['headers'].items():
-                if header in headers:
-                    if pattern in headers[header]:
-                        return True
-                        
-        # Check meta tags
-        if 'meta' in data:
-            for meta_name, pattern in data['meta'].items():
-                if f'name="{meta_name}"' in html and pattern in html:
-                    return True
-                    
-        # Check scripts
-        if 'scripts' in data:
-            for script in data['scripts']:
-                if script in html:
-                    return True
-                    
-        # Check styles
-        if 'styles' in data:
-            for style in data['styles']:
-                if style in html:
-                    return True
-                    
-        # Check HTML patterns
-        if 'html' in data:
-            for pattern in data['html']:
-                if pattern in html:
-                    return True
-                    
+        for header, rules in self._header_rules.items():
+            value = headers.get(header)
+            if value is not None:
+                matched.update(tech for pattern, tech in rules if pattern in value)
+                
         # Check cookies
-        if 'cookies' in data and hasattr(target_data, 'cookies'):
-            for cookie_name in data['cookies']:
-                if cookie_name in target_data.cookies:
-                    return True
+        cookies = getattr(target_data, 'cookies', None)
+        if cookies is not None:
+            for cookie_name, techs in self._cookie_rules.items():
+                if cookie_name in cookies:
+                    matched.update(techs)
                     
-        return False
+        return matched
         
     async def on_scan_completed(self, scan_data):
         """
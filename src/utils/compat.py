@@ -0,0 +1,9 @@
+"""
+Interpreter compatibility helpers
+"""
+
+import sys
+
+# Slotted dataclasses (no per-instance __dict__) where the interpreter supports them:
+# dataclass(slots=True) needs Python 3.10+, older interpreters keep a regular __dict__
+DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
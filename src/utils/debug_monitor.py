@@ -3,9 +3,14 @@ Real-time debug monitor for dirsearch engine scanning
 Provides live monitoring of directory scanning, request/response details, and analysis
 """
 import asyncio
+import os
+import re
+import tempfile
 import time
+from collections import deque
+from itertools import islice
 from datetime import datetime
-from typing import Dict, Any, Optional, List, Callable
+from typing import Dict, Any, Optional, List, Callable, Pattern, Deque, Iterator, BinaryIO
 from dataclasses import dataclass, field
 from enum import Enum
 import json
@@ -21,6 +26,9 @@ from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TaskPr
 from rich.syntax import Syntax
 from rich.markdown import Markdown
 
+from .compat import DATACLASS_SLOTS
+from .fast_json import get_orjson
+
 
 class EventType(Enum):
     """Types of scan events"""
@@ -39,7 +47,7 @@ class EventType(Enum):
     STATUS_CODE_CHECK = "status_code_check"
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class DebugEvent:
     """Debug event data structure"""
     timestamp: float
@@ -65,14 +73,30 @@ class DebugEvent:
             "error": self.error,
             "metadata": self.metadata
         }
+        
+    def to_json(self) -> bytes:
+        """Encode the event as one line of JSON (same keys as to_dict)"""
+        return _json_bytes(self if get_orjson() else self.to_dict())
+
+
+def _json_bytes(data: Any) -> bytes:
+    """Encode to compact JSON, using orjson when available"""
+    orjson = get_orjson()
+    if orjson:
+        return orjson.dumps(data, default=str, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, default=str).encode("utf-8")
 
 
 class DebugMonitor:
     """Real-time debug monitor for scan engine"""
     
-    def __init__(self, console: Optional[Console] = None):
+    def __init__(self, console: Optional[Console] = None, max_events: Optional[int] = 10_000):
         self.console = console or Console()
-        self.events: List[DebugEvent] = []
+        # Most recent events in a ring buffer; older ones are spooled to a temporary
+        # file as JSON lines, so memory stays bounded and exports stay complete
+        self.events: Deque[DebugEvent] = deque(maxlen=max_events)
+        self._spool: Optional[BinaryIO] = None
+        self._spooled = 0
         self.start_time: Optional[float] = None
         self.current_target: Optional[str] = None
         self.stats = {
@@ -92,6 +116,8 @@ class DebugMonitor:
             "path_pattern": None,
             "show_errors_only": False
         }
+        # Compiled form of filters["path_pattern"]; refreshed if the filter is replaced
+        self._path_pattern_re: Optional[Pattern] = None
         self.callbacks: Dict[EventType, List[Callable]] = {event_type: [] for event_type in EventType}
         self.live_display: Optional[Live] = None
         self.is_monitoring = False
@@ -130,6 +156,9 @@ class DebugMonitor:
         if not self._should_log_event(event):
             return
             
+        if len(self.events) == self.events.maxlen:
+            # The oldest event leaves the buffer; with max_events=0 every event goes straight to disk
+            self._spool_event(self.events[0] if self.events else event)
         self.events.append(event)
         self._update_stats(event)
         
@@ -158,9 +187,11 @@ class DebugMonitor:
             if self.filters["max_status_code"] and event.status_code > self.filters["max_status_code"]:
                 return False
                 
-        if self.filters["path_pattern"] and event.path:
-            import re
-            if not re.search(self.filters["path_pattern"], event.path):
+        path_pattern = self.filters["path_pattern"]
+        if path_pattern and event.path:
+            if self._path_pattern_re is None or self._path_pattern_re.pattern != path_pattern:
+                self._path_pattern_re = re.compile(path_pattern)
+            if not self._path_pattern_re.search(event.path):
                 return False
                 
         return True
@@ -240,13 +271,13 @@ class DebugMonitor:
         layout["events"].update(Panel(events_text, title="Recent Events"))
         
         # Update footer
-        footer_text = f"Events: {len(self.events)} | Filters: {self._get_active_filters()}"
+        footer_text = f"Events: {self._spooled + len(self.events)} | Filters: {self._get_active_filters()}"
         layout["footer"].update(Panel(footer_text))
         
     def _format_recent_events(self, max_events: int = 20) -> Text:
         """Format recent events for display"""
         text = Text()
-        recent_events = self.events[-max_events:]
+        recent_events = list(islice(reversed(self.events), max_events))[::-1]
         
         for event in recent_events:
             timestamp = datetime.fromtimestamp(event.timestamp).strftime("%H:%M:%S.%f")[:-3]
@@ -333,6 +364,9 @@ class DebugMonitor:
     def set_filter(self, filter_name: str, value: Any):
         """Set a filter"""
         if filter_name in self.filters:
+            if filter_name == "path_pattern":
+                # Compile up front: bad patterns fail here, not on the next event
+                self._path_pattern_re = re.compile(value) if value else None
             self.filters[filter_name] = value
             
     def register_callback(self, event_type: EventType, callback: Callable):
@@ -342,21 +376,26 @@ class DebugMonitor:
     def export_events(self, filepath: str, format: str = "json"):
         """Export events to file"""
         if format == "json":
-            data = {
+            # Streamed one event per line, so the full history is never held in memory
+            header = _json_bytes({
                 "target": self.current_target,
                 "start_time": self.start_time,
-                "stats": self.stats,
-                "events": [event.to_dict() for event in self.events]
-            }
-            with open(filepath, "w") as f:
-                json.dump(data, f, indent=2)
+                "stats": self.stats
+            })
+            with open(filepath, "wb") as f:
+                f.write(header[:-1] + b', "events": [')
+                separator = b"\n"
+                for line in self._iter_event_lines():
+                    f.write(separator + line)
+                    separator = b",\n"
+                f.write(b"\n]}\n")
         elif format == "csv":
             import csv
             with open(filepath, "w", newline="") as f:
-                writer = csv.DictWriter(f, fieldnames=["timestamp", "event_type", "url", "path", "status_code", "response_time", "error"])
+                writer = csv.DictWriter(f, fieldnames=["timestamp", "event_type", "url", "path", "status_code", "response_time", "error"],
+                                        extrasaction="ignore")
                 writer.writeheader()
-                for event in self.events:
-                    writer.writerow(event.to_dict())
+                writer.writerows(self._iter_event_dicts())
                     
     def get_summary(self) -> Dict[str, Any]:
         """Get monitoring summary"""
@@ -364,11 +403,38 @@ class DebugMonitor:
         return {
             "target": self.current_target,
             "duration": elapsed,
-            "total_events": len(self.events),
+            "total_events": self._spooled + len(self.events),
             "stats": self.stats,
             "requests_per_second": self.stats["total_requests"] / elapsed if elapsed > 0 else 0
         }
     
+    def _spool_event(self, event: DebugEvent):
+        """Write an event leaving the ring buffer to the spool file"""
+        if self._spool is None:
+            self._spool = tempfile.TemporaryFile("w+b")
+        self._spool.write(event.to_json() + b"\n")
+        self._spooled += 1
+        
+    def _iter_event_lines(self) -> Iterator[bytes]:
+        """Yield every logged event as a JSON line (without newline), oldest first"""
+        if self._spool is not None:
+            self._spool.seek(0)
+            for line in self._spool:
+                yield line.rstrip(b"\n")
+            self._spool.seek(0, os.SEEK_END)
+        for event in self.events:
+            yield event.to_json()
+            
+    def _iter_event_dicts(self) -> Iterator[Dict[str, Any]]:
+        """Yield every logged event as a dict, oldest first"""
+        if self._spool is not None:
+            self._spool.seek(0)
+            for line in self._spool:
+                yield json.loads(line)
+            self._spool.seek(0, os.SEEK_END)
+        for event in self.events:
+            yield event.to_dict()
+    
     def get_integration(self) -> 'DebugMonitorIntegration':
         """Get integration helper for dirsearch engine"""
         return DebugMonitorIntegration(self)
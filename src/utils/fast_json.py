@@ -0,0 +1,20 @@
+"""
+Optional orjson backend shared by the JSON writers
+"""
+
+from typing import Any
+
+# orjson is imported on first JSON use: None until tried, False if it is not installed
+_orjson: Any = None
+
+
+def get_orjson() -> Any:
+    """Return the orjson module, or None when it is not installed"""
+    global _orjson
+    if _orjson is None:
+        try:
+            import orjson
+            _orjson = orjson
+        except ImportError:
+            _orjson = False
+    return _orjson or None
@@ -7,6 +7,9 @@ import html
 from dataclasses import asdict
 import base64
 import io
+
+from .fast_json import get_orjson
+
 try:
     import matplotlib
     matplotlib.use('Agg')  # Use non-interactive backend
@@ -95,8 +98,14 @@ class ReportGenerator:
             }
         }
         
-        with open(file_path, 'w', encoding='utf-8') as f:
-            json.dump(report, f, indent=2, ensure_ascii=False)
+        orjson = get_orjson()
+        if orjson:
+            # orjson writes UTF-8 directly, like ensure_ascii=False
+            with open(file_path, 'wb') as f:
+                f.write(orjson.dumps(report, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+        else:
+            with open(file_path, 'w', encoding='utf-8') as f:
+                json.dump(report, f, indent=2, ensure_ascii=False)
         
         return file_path
     
@@ -0,0 +1,86 @@
+import pytest
+
+from src.core import mcp_coordinator
+from src.core.mcp_coordinator import _DiskCache, _LRUTTLCache
+
+
+class TestLRUTTLCache:
+
+    def test_evicts_least_recently_used(self):
+        cache = _LRUTTLCache(max_size=2, ttl=60)
+        cache.set('a', '1')
+        cache.set('b', '2')
+        assert cache.get('a') == '1'
+
+        cache.set('c', '3')
+
+        assert 'b' not in cache
+        assert cache.get('a') == '1'
+        assert cache.get('c') == '3'
+        assert len(cache) == 2
+
+    def test_expired_entries_are_dropped(self, monkeypatch):
+        now = [1000.0]
+        monkeypatch.setattr(mcp_coordinator.time, 'time', lambda: now[0])
+        cache = _LRUTTLCache(max_size=8, ttl=10)
+        cache['key'] = 'value'
+
+        now[0] += 5
+        assert cache['key'] == 'value'
+
+        now[0] += 10
+        assert cache.get('key') is None
+        assert 'key' not in cache
+        with pytest.raises(KeyError):
+            cache['key']
+
+    def test_membership_follows_expiry_and_none_is_a_value(self, monkeypatch):
+        now = [1000.0]
+        monkeypatch.setattr(mcp_coordinator.time, 'time', lambda: now[0])
+        cache = _LRUTTLCache(max_size=8, ttl=10)
+        cache['stale'] = 'value'
+        cache['empty'] = None
+
+        assert 'empty' in cache
+        assert cache['empty'] is None
+        assert cache.get('empty', 'default') is None
+
+        now[0] += 15
+        assert 'stale' not in cache
+        assert 'empty' not in cache
+        assert len(cache) == 0
+
+    def test_cache_info(self):
+        cache = _LRUTTLCache(max_size=4, ttl=60)
+        cache.set('a', '1')
+        cache.get('a')
+        cache.get('missing')
+
+        assert cache.cache_info() == {'hits': 1, 'misses': 1, 'max_size': 4, 'size': 1}
+
+
+class TestDiskCache:
+
+    def test_survives_reopen(self, tmp_path):
+        path = str(tmp_path / 'cache' / 'ai.sqlite3')
+        cache = _DiskCache(path, ttl=60)
+        cache.set(123, 'response')
+        cache.close()
+
+        reopened = _DiskCache(path, ttl=60)
+        assert reopened.get(123) == 'response'
+        assert reopened.get('other') is None
+        reopened.close()
+
+    def test_expired_rows_are_ignored_and_purged(self, tmp_path, monkeypatch):
+        now = [1000.0]
+        monkeypatch.setattr(mcp_coordinator.time, 'time', lambda: now[0])
+        path = str(tmp_path / 'ai.sqlite3')
+        cache = _DiskCache(path, ttl=10)
+        cache.set('key', 'value')
+
+        now[0] += 11
+        assert cache.get('key') is None
+        cache.purge_expired()
+        assert cache._conn.execute('SELECT COUNT(*) FROM ai_cache').fetchone()[0] == 0
+        cache.close()
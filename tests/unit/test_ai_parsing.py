@@ -0,0 +1,129 @@
+import json
+
+import pytest
+
+from src.core.mcp_coordinator import MCPCoordinator, TargetInfo
+
+
+AI_RESPONSE = """Based on the target analysis:
+
+1. Additional technology stack components:
+   - MySQL database
+   - PHP 7.1.33
+
+2. Recommended wordlists:
+   - wordpress.txt
+
+**3.** Optimal scan parameters:
+   - Threads: 20
+   - Timeout: 15 seconds
+
+4. Potential vulnerabilities:
+   - Exposed .git
+
+5. Special considerations:
+   - Rate limiting detected
+"""
+
+
+@pytest.mark.asyncio
+async def test_target_analysis_sections():
+    coordinator = MCPCoordinator(config=None)
+
+    async def query_ai_agent(context, question, provider=None):
+        return AI_RESPONSE
+
+    coordinator.ai_connector.query_ai_agent = query_ai_agent
+    insights = await coordinator._get_ai_target_analysis(TargetInfo(url='http://test.com', domain='test.com'))
+
+    assert insights == {
+        'additional_tech': ['MySQL database', 'PHP 7.1.33'],
+        'recommended_wordlists': ['wordpress.txt'],
+        'scan_parameters': {'threads': 20, 'timeout': 15},
+        'focus_areas': ['Exposed .git'],
+        'considerations': ['Rate limiting detected']
+    }
+
+
+@pytest.mark.asyncio
+async def test_ai_plan_skipped_for_seen_profile():
+    coordinator = MCPCoordinator(config=None)
+    coordinator.intelligence_mode = 'AI_AGENT'
+    questions = []
+
+    async def query_ai_agent(context, question, provider=None):
+        questions.append(question)
+        return "Task type: directory_enumeration"
+
+    coordinator.ai_connector.query_ai_agent = query_ai_agent
+    plans = []
+    for url in ['http://a.com', 'http://b.com']:
+        target = TargetInfo(url=url, domain=url[7:], server_type='nginx', technology_stack=['PHP/8.1'])
+        plans.append(await coordinator.generate_scan_plan(target))
+
+    assert [plan[0].task_id for plan in plans] == ['ai_task_1', 'base_scan']
+    assert len(questions) == 1
+
+
+@pytest.mark.asyncio
+async def test_analysis_and_plan_share_one_json_query():
+    coordinator = MCPCoordinator(config=None)
+    coordinator.intelligence_mode = 'AI_AGENT'
+    calls = []
+
+    async def query_ai_agent(context, question, provider=None, json_mode=False):
+        calls.append(json_mode)
+        return json.dumps({
+            'analysis': {'additional_tech': ['MySQL'], 'scan_parameters': {'threads': 15}},
+            'scan_plan': [{'task_type': 'backup_files', 'wordlist': 'backup.txt', 'priority': 95},
+                          {'task_type': 'bogus', 'threads': 5}]
+        })
+
+    coordinator.ai_connector.query_ai_agent = query_ai_agent
+    target = await coordinator.analyze_target('http://127.0.0.1:9')
+    plan = await coordinator.generate_scan_plan(target)
+    await coordinator.close()
+
+    assert calls == [True]
+    assert 'MySQL' in target.technology_stack
+    assert [(t.task_type, t.priority, t.parameters) for t in plan] == [
+        ('backup_files', 95, {'wordlist': 'backup.txt'}),
+        ('directory_enumeration', 50, {'threads': 5}),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_invalid_json_falls_back_to_text_analysis():
+    coordinator = MCPCoordinator(config=None)
+    calls = []
+
+    async def query_ai_agent(context, question, provider=None, json_mode=False):
+        calls.append(json_mode)
+        return AI_RESPONSE
+
+    coordinator.ai_connector.query_ai_agent = query_ai_agent
+    target = TargetInfo(url='http://test.com', domain='test.com')
+
+    assert await coordinator._get_ai_target_bundle(target) is None
+    insights = await coordinator._get_ai_target_analysis(target)
+    assert insights['scan_parameters'] == {'threads': 20, 'timeout': 15}
+    assert calls == [True, False]
+
+
+def test_merge_ai_parameters_ignores_case():
+    coordinator = MCPCoordinator(config=None)
+    params = {'threads': 10, 'timeout': 10, 'delay': 0}
+
+    coordinator._merge_ai_parameters(params, "Threads: 80\nTIMEOUT: 12\nDelay: 0.5")
+
+    assert params == {'threads': 50, 'timeout': 12, 'delay': 0.5}
+
+
+def test_merge_ai_parameters_keeps_first_mention():
+    coordinator = MCPCoordinator(config=None)
+    params = {'threads': 10, 'timeout': 10, 'delay': 0}
+
+    coordinator._merge_ai_parameters(
+        params, "threads: 20.5, delay: 2\nLater: threads: 5, timeout: 30, delay: 1")
+
+    assert params == {'threads': 20, 'timeout': 30, 'delay': 2.0}
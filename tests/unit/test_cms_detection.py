@@ -0,0 +1,23 @@
+import pytest
+
+from src.core import mcp_coordinator
+from src.core.mcp_coordinator import MCPCoordinator
+
+
+@pytest.fixture(params=['default', 're'])
+def coordinator(request, monkeypatch):
+    if request.param == 're':
+        monkeypatch.setattr(mcp_coordinator, '_CMS_DATABASE', None)
+    return MCPCoordinator(config=None)
+
+
+@pytest.mark.parametrize("content,expected", [
+    ('<link href="/WP-CONTENT/themes/x.css">', 'WordPress'),
+    ('<script src="/modules/x.js"></script>', 'Joomla'),
+    ('<input name="csrfmiddlewaretoken">', 'Django'),
+    ('Set-Cookie: laravel_session=abc', 'Laravel'),
+    ('<script src="/js/mage/cookies.js"></script>', 'Magento'),
+    ('<html><body>plain</body></html>', None),
+])
+def test_detect_cms(coordinator, content, expected):
+    assert coordinator._detect_cms(content, {}) == expected
@@ -0,0 +1,185 @@
+import csv
+import io
+import json
+import sys
+from dataclasses import asdict
+from xml.etree import ElementTree
+
+import pytest
+
+from src.utils import fast_json
+from src.integration.data_formats import (
+    ExchangeFormat, ResultData, ScanData, ScanOptions, TargetData
+)
+
+
+def test_to_dict_matches_asdict():
+    options = ScanOptions(extensions=['php'], custom_headers={'X-Test': '1'})
+    target = TargetData(url='http://example.com', domain='example.com',
+                        technology_stack=['PHP'], security_headers={'X-Frame-Options': 'DENY'},
+                        _internal=object())
+    result = ResultData(path='/admin', status=403, size=12,
+                        headers={'Server': 'nginx'}, meta={'depth': 1})
+
+    assert options.to_dict() == asdict(options)
+    assert result.to_dict() == asdict(result)
+    expected = asdict(target)
+    expected.pop('_internal')
+    assert target.to_dict() == expected
+
+
+def test_to_dict_copies_containers():
+    result = ResultData(path='/admin', status=200, size=1, headers={'Server': 'nginx'})
+
+    data = result.to_dict()
+    data['headers']['Server'] = 'apache'
+
+    assert result.headers == {'Server': 'nginx'}
+
+
+@pytest.fixture(params=['default', 'stdlib'])
+def json_backend(request, monkeypatch):
+    if request.param == 'stdlib':
+        monkeypatch.setattr(fast_json, '_orjson', False)
+    return request.param
+
+
+def _scan_data():
+    return ScanData(
+        target='http://example.com',
+        target_info=TargetData(url='http://example.com', domain='example.com'),
+        options=ScanOptions(),
+        results=[ResultData(path='/a', status=200, size=5)],
+        statistics={'total_requests': 1, 'status_codes': {200: 1}}
+    )
+
+
+def test_scan_data_json_round_trip(json_backend):
+    scan = _scan_data()
+
+    restored = ScanData.from_json(scan.to_json())
+
+    assert restored.results[0].to_dict() == scan.results[0].to_dict()
+    assert restored.statistics == {'total_requests': 1, 'status_codes': {'200': 1}}
+
+
+def test_scan_data_accepts_a_null_mcp_mode(json_backend):
+    data = json.loads(_scan_data().to_json())
+    data['mcp_mode'] = None
+
+    restored = ScanData.from_json(json.dumps(data))
+
+    assert restored.mcp_mode is None
+    assert json.loads(restored.to_json())['mcp_mode'] is None
+
+
+def test_scan_data_file_round_trip(json_backend, tmp_path):
+    scan = _scan_data()
+    filepath = tmp_path / 'scan.json'
+
+    scan.export_to_file(str(filepath))
+    restored = ScanData.import_from_file(str(filepath))
+
+    assert restored.to_json() == scan.to_json()
+
+
+def test_to_xml_escapes_values():
+    scan = _scan_data()
+    scan.results.append(ResultData(path='/search?q=<b>&x=1', status=200, size=3))
+
+    xml = ExchangeFormat(timestamp='2024-01-01T00:00:00', scan_data=scan).to_xml()
+
+    root = ElementTree.fromstring(xml)
+    assert root.get('timestamp') == '2024-01-01T00:00:00'
+    assert root.find('findings').get('count') == '2'
+    assert [f.findtext('path') for f in root.iter('finding')] == ['/a', '/search?q=<b>&x=1']
+
+
+def test_to_csv_quotes_awkward_paths():
+    scan = _scan_data()
+    scan.results.append(ResultData(path='/a,"b"', status=403, size=7,
+                                   content_type='text/html', response_time=0.25))
+
+    rows = list(csv.reader(io.StringIO(ExchangeFormat(scan_data=scan).to_csv())))
+
+    assert rows == [
+        ['path', 'status', 'size', 'content_type', 'response_time'],
+        ['/a', '200', '5', '', '0'],
+        ['/a,"b"', '403', '7', 'text/html', '0.25'],
+    ]
+
+
+def test_status_filters_keep_scan_order_and_follow_mutations():
+    scan = _scan_data()
+    scan.results += [ResultData(path='/b', status=201, size=1),
+                     ResultData(path='/c', status=403, size=1),
+                     ResultData(path='/d', status=200, size=1)]
+
+    assert [r.path for r in scan.successful_findings] == ['/a', '/b', '/d']
+    assert [r.path for r in scan.get_findings_by_status([403, 200])] == ['/a', '/c', '/d']
+
+    scan.results.append(ResultData(path='/e', status=302, size=1))
+    assert [r.path for r in scan.redirect_findings] == ['/e']
+
+    scan.results.sort(key=lambda r: r.path, reverse=True)
+    assert [r.path for r in scan.successful_findings] == ['/d', '/b', '/a']
+
+    scan.results[-1] = ResultData(path='/g', status=404, size=1)
+    assert [r.path for r in scan.get_findings_by_status(200)] == ['/d']
+
+    scan.results = [ResultData(path='/f', status=401, size=1)]
+    assert [r.path for r in scan.auth_required_findings] == ['/f']
+
+
+@pytest.mark.parametrize('status, success, redirect, auth', [
+    (200, True, False, False),
+    (201, True, False, False),
+    (204, False, False, False),
+    (307, False, True, False),
+    (403, False, False, True),
+])
+def test_result_status_classes(status, success, redirect, auth):
+    result = ResultData(path='/', status=status, size=0)
+
+    assert (result.is_success, result.is_redirect, result.is_auth_required) == (success, redirect, auth)
+
+
+@pytest.mark.skipif(sys.version_info < (3, 10), reason='slotted dataclasses need Python 3.10')
+def test_data_classes_have_no_instance_dict():
+    scan = _scan_data()
+
+    for obj in (scan, scan.options, scan.target_info, scan.results[0]):
+        assert not hasattr(obj, '__dict__')
+
+
+def test_result_from_dict_ignores_unknown_keys():
+    result = ResultData.from_dict({'path': '/a', 'status': 200, 'size': 5,
+                                   'url': 'http://example.com/a', 'meta': {'depth': 2}})
+
+    assert result == ResultData(path='/a', status=200, size=5, meta={'depth': 2})
+
+
+def test_repeated_content_types_share_one_string():
+    first = ResultData.from_dict({'path': '/a', 'status': 200, 'size': 1,
+                                  'content_type': ''.join(['text/', 'html'])})
+    second = ResultData.from_dict({'path': '/b', 'status': 200, 'size': 1,
+                                   'content_type': ''.join(['text/', 'html'])})
+
+    assert first.content_type is second.content_type
+
+
+def test_to_json_is_compact_unless_pretty(json_backend):
+    scan = _scan_data()
+
+    assert '\n' not in scan.to_json()
+    assert scan.to_json_pretty().startswith('{\n  "target": "http://example.com"')
+    assert json.loads(scan.to_json()) == json.loads(scan.to_json_pretty())
+
+
+def test_json_matches_to_dict(json_backend):
+    scan = _scan_data()
+    scan.target_info._internal = object()
+    exchange = ExchangeFormat(scan_data=scan, metadata={'source': 'test'})
+
+    assert json.loads(scan.to_json()) == json.loads(json.dumps(scan.to_dict()))
+    assert json.loads(exchange.to_json_pretty()) == json.loads(json.dumps(exchange.to_dict()))
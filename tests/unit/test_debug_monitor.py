@@ -0,0 +1,75 @@
+import json
+import re
+
+import pytest
+
+from src.utils import fast_json
+from src.utils.debug_monitor import DebugEvent, DebugMonitor, EventType
+
+
+def test_path_pattern_filter_is_compiled_once(monkeypatch):
+    monitor = DebugMonitor()
+    monitor.set_filter("path_pattern", r"^/admin")
+    compiled = []
+    real_compile = re.compile
+    monkeypatch.setattr(re, "compile", lambda *args: compiled.append(args) or real_compile(*args))
+
+    for path in ("/admin/login", "/images/logo.png", "/admin"):
+        monitor.log_event(EventType.REQUEST_SENT, path=path)
+
+    assert [event.path for event in monitor.events] == ["/admin/login", "/admin"]
+    assert compiled == []
+
+
+def test_path_pattern_filter_follows_direct_updates_and_rejects_bad_patterns():
+    monitor = DebugMonitor()
+    monitor.filters["path_pattern"] = r"\.php$"
+
+    monitor.log_event(EventType.REQUEST_SENT, path="/index.php")
+    monitor.log_event(EventType.REQUEST_SENT, path="/index.html")
+
+    assert [event.path for event in monitor.events] == ["/index.php"]
+    with pytest.raises(re.error):
+        monitor.set_filter("path_pattern", "(")
+
+
+def test_events_are_bounded_but_exported_in_full(tmp_path):
+    monitor = DebugMonitor(max_events=3)
+    for index in range(5):
+        monitor.log_event(EventType.REQUEST_SENT, path=f"/p{index}")
+
+    assert [event.path for event in monitor.events] == ["/p2", "/p3", "/p4"]
+    assert "/p4" in monitor._format_recent_events(max_events=2).plain
+    assert "/p2" not in monitor._format_recent_events(max_events=2).plain
+    assert monitor.get_summary()["total_events"] == 5
+
+    monitor.export_events(str(tmp_path / "events.json"))
+    monitor.export_events(str(tmp_path / "events.csv"), format="csv")
+
+    exported = json.loads((tmp_path / "events.json").read_text())["events"]
+    assert [event["path"] for event in exported] == [f"/p{index}" for index in range(5)]
+    assert len((tmp_path / "events.csv").read_text().splitlines()) == 6
+
+
+def test_zero_sized_buffer_spools_every_event(tmp_path):
+    monitor = DebugMonitor(max_events=0)
+    for index in range(2):
+        monitor.log_event(EventType.REQUEST_SENT, path=f"/p{index}")
+
+    assert list(monitor.events) == []
+    assert monitor.get_summary()["total_events"] == 2
+    monitor.export_events(str(tmp_path / "events.json"))
+    exported = json.loads((tmp_path / "events.json").read_text())["events"]
+    assert [event["path"] for event in exported] == ["/p0", "/p1"]
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_event_json_matches_to_dict(monkeypatch, use_orjson):
+    if use_orjson:
+        pytest.importorskip("orjson")
+    else:
+        monkeypatch.setattr(fast_json, "_orjson", False)
+    event = DebugEvent(timestamp=1.5, event_type=EventType.RESPONSE_RECEIVED, path="/a",
+                       status_code=200, metadata={"target": object})
+
+    assert json.loads(event.to_json()) == {**event.to_dict(), "metadata": {"target": str(object)}}
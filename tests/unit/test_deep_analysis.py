@@ -0,0 +1,30 @@
+import pytest
+
+from src.core.dirsearch_engine import DirsearchEngine, ScanOptions, ScanResult
+
+
+@pytest.mark.asyncio
+async def test_each_scan_rescans_paths_extracted_by_earlier_scans(monkeypatch):
+    engine = DirsearchEngine()
+    options = ScanOptions(detect_wildcards=False, recursive=False, crawl=True)
+    extracted_scans = []
+
+    async def scan_paths(base_url, paths, scan_options):
+        if 'index.html' in paths:
+            engine._results.append(ScanResult(url=f'{base_url}/index.html', status_code=200,
+                                              size=10, path='index.html'))
+            await engine._deep_analyze_all_endpoints(scan_options)
+        else:
+            extracted_scans.append((base_url, paths))
+
+    async def deep_content_analysis(url, scan_options):
+        return ['static/app.js']
+
+    monkeypatch.setattr(engine, '_scan_paths', scan_paths)
+    monkeypatch.setattr(engine, '_deep_content_analysis', deep_content_analysis)
+
+    await engine.scan_target('http://first.test', ['index.html'], options, display_progress=False)
+    await engine.scan_target('http://second.test', ['index.html'], options, display_progress=False)
+
+    assert extracted_scans == [('http://first.test/static/', ['app.js']),
+                               ('http://second.test/static/', ['app.js'])]
@@ -0,0 +1,102 @@
+import asyncio
+import threading
+
+import pytest
+
+from src.integration.events import EventEmitter, EventHook, run_in_executor
+
+
+@pytest.mark.asyncio
+async def test_sync_handlers_run_inline_unless_marked():
+    hook = EventHook()
+    threads = {}
+
+    def inline(data):
+        threads['inline'] = threading.get_ident()
+
+    @run_in_executor
+    def blocking(data):
+        threads['blocking'] = threading.get_ident()
+
+    async def coroutine(data):
+        await asyncio.sleep(0)
+        threads['async'] = threading.get_ident()
+
+    hook += inline
+    hook += blocking
+    hook += coroutine
+    await hook.fire({'path': '/admin'})
+
+    loop_thread = threading.get_ident()
+    assert threads['inline'] == loop_thread
+    assert threads['async'] == loop_thread
+    assert threads['blocking'] != loop_thread
+
+
+@pytest.mark.asyncio
+async def test_failing_sync_handler_does_not_stop_others():
+    hook = EventHook()
+    seen = []
+
+    def broken(data):
+        raise RuntimeError('boom')
+
+    hook += broken
+    hook += seen.append
+    await hook.fire(1)
+
+    assert seen == [1]
+
+
+@pytest.mark.asyncio
+async def test_once_handler_fires_once():
+    emitter = EventEmitter()
+    seen = []
+    emitter.once('finding', seen.append)
+
+    await emitter.emit('finding', 1)
+    await emitter.emit('finding', 2)
+
+    assert seen == [1]
+
+
+def test_register_is_idempotent_and_unregister_removes():
+    hook = EventHook()
+
+    async def handler(data):
+        pass
+
+    hook += handler
+    hook += handler
+    assert hook.handler_count() == 1
+
+    hook -= handler
+    hook -= handler
+    assert hook.handler_count() == 0
+
+
+@pytest.mark.asyncio
+async def test_unhashable_handlers_are_supported():
+    class Collector:
+        __hash__ = None
+
+        def __init__(self):
+            self.seen = []
+
+        def __eq__(self, other):
+            return isinstance(other, Collector)
+
+        def __call__(self, data):
+            self.seen.append(data)
+
+    hook = EventHook()
+    collector = Collector()
+    hook += collector
+    hook += Collector()
+    await hook.fire('x')
+
+    assert hook.handler_count() == 1
+    assert collector.seen == ['x']
+
+    hook -= Collector()
+    assert hook.handler_count() == 0
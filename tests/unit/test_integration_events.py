@@ -0,0 +1,239 @@
+import asyncio
+from dataclasses import asdict
+from types import SimpleNamespace
+
+import pytest
+
+from src.core.dirsearch_engine import ScanRequest
+from src.integration.events import EventType
+from src.integration.data_formats import ResultData, ScanData, ScanOptions, TargetData
+from src.integration.interface import DirsearchMCP
+
+
+@pytest.fixture
+def dirsearch(monkeypatch):
+    api = DirsearchMCP()
+    api.settings.performance['progress_update_interval'] = 0.01
+    results = [{'path': f'/p{i}', 'status': 200 if i % 50 == 0 else 404, 'size': 0}
+               for i in range(250)]
+
+    async def execute_scan(request):
+        for checked in range(1, 1001):
+            if api.engine._progress_callback:
+                api.engine._progress_callback(checked, 1000)
+            if checked % 100 == 0:
+                await asyncio.sleep(0.005)
+        return SimpleNamespace(results=results, statistics={}, total_paths=1000)
+
+    def load_wordlist(wordlist):
+        raise AssertionError('the wordlist should not be reloaded for progress')
+
+    monkeypatch.setattr(api.engine, 'execute_scan', execute_scan)
+    monkeypatch.setattr(api.engine, '_load_wordlist', load_wordlist)
+    return api
+
+
+@pytest.mark.asyncio
+async def test_scan_progress_is_coalesced_and_findings_all_emitted(dirsearch):
+    progress, findings = [], []
+    dirsearch.on_progress(progress.append)
+    dirsearch.on_finding(findings.append)
+
+    await dirsearch._execute_scan_with_progress(
+        ScanRequest(base_url='http://example.com', wordlist='common.txt'))
+
+    processed = [p['processed'] for p in progress]
+    assert 1 <= len(processed) < 20
+    assert processed == sorted(set(processed))
+    assert progress[-1] == {'processed': 1000, 'total': 1000, 'percentage': 100.0}
+    assert dirsearch.engine._progress_callback is None
+    assert sorted(f['path'] for f in findings) == ['/p0', '/p100', '/p150', '/p200', '/p50']
+
+@pytest.mark.asyncio
+async def test_final_progress_falls_back_to_the_scanned_path_count(dirsearch, monkeypatch):
+    async def execute_scan(request):
+        return SimpleNamespace(results=[], statistics={}, total_paths=40)
+
+    monkeypatch.setattr(dirsearch.engine, 'execute_scan', execute_scan)
+    progress = []
+    dirsearch.on_progress(progress.append)
+
+    await dirsearch._execute_scan_with_progress(
+        ScanRequest(base_url='http://example.com', wordlist='common.txt'))
+
+    assert progress == [{'processed': 40, 'total': 40, 'percentage': 100.0}]
+
+
+@pytest.mark.asyncio
+async def test_scan_events_serialize_only_what_listeners_need(dirsearch, monkeypatch):
+    serialized = []
+
+    def recording_asdict(obj):
+        serialized.append(type(obj).__name__)
+        return asdict(obj)
+
+    monkeypatch.setattr('src.integration.interface.asdict', recording_asdict)
+
+    async def analyze_target(url):
+        return TargetData(url=url, domain='example.com')
+
+    monkeypatch.setattr(dirsearch, 'analyze_target', analyze_target)
+    options = ScanOptions(use_mcp=False)
+
+    await dirsearch.scan('http://example.com', options)
+    assert serialized == []
+
+    started, completed = [], []
+    dirsearch.on_scan_started(started.append)
+    dirsearch.on_scan_completed(completed.append)
+    scan_data = await dirsearch.scan('http://example.com', options)
+
+    assert serialized == ['ScanOptions']
+    assert started[0]['target'] == 'http://example.com'
+    assert completed == [scan_data]
+    assert completed[0] is scan_data
+
+
+@pytest.mark.asyncio
+async def test_heavy_components_are_built_on_first_use():
+    api = DirsearchMCP()
+
+    api.set_ai_credentials('openai', 'key')
+    await api.__aexit__(None, None, None)
+    assert not {'engine', 'mcp', 'reporter'} & set(vars(api))
+
+    assert api.engine is api.engine
+    assert 'engine' in vars(api)
+
+
+@pytest.mark.asyncio
+async def test_get_wordlists_lists_txt_files_in_base_dir(tmp_path):
+    (tmp_path / 'common.txt').write_text('admin\nlogin\n')
+    (tmp_path / 'notes.md').write_text('skip')
+    (tmp_path / 'nested.txt').mkdir()
+    api = DirsearchMCP()
+    api.settings.paths['wordlists'] = {'base': str(tmp_path)}
+
+    assert await api.get_wordlists() == [
+        {'name': 'common.txt', 'path': str(tmp_path / 'common.txt'), 'size': 12}
+    ]
+
+    api.settings.paths['wordlists'] = str(tmp_path / 'missing')
+    assert await api.get_wordlists() == []
+
+
+@pytest.mark.asyncio
+async def test_generate_report_passes_result_dicts_to_reporter():
+    api = DirsearchMCP()
+    result = ResultData(path='/admin', status=200, size=10, headers={'Server': 'nginx'})
+    scan_data = ScanData(
+        target='http://example.com', target_info=TargetData(url='http://example.com', domain='example.com'),
+        options=ScanOptions(), results=[result], statistics={}, start_time='', end_time='',
+        duration=0.0, mcp_mode='local'
+    )
+    captured = {}
+
+    def generate_report(data, format):
+        captured.update(data)
+        return {format: 'report'}
+
+    api.reporter.generate_report = generate_report
+    assert await api.generate_report(scan_data, formats=['json']) == {'json': 'report'}
+
+    findings = captured['scan_results'][0]['findings']
+    assert findings == [asdict(result)]
+    assert findings[0]['headers'] is not result.headers
+    assert captured['target_analysis'] == scan_data.target_info.to_dict()
+
+
+@pytest.mark.asyncio
+async def test_emit_event_only_awaits_sides_with_listeners(monkeypatch):
+    api = DirsearchMCP()
+    hook = api.events[EventType.FINDING_DISCOVERED]
+    calls = []
+
+    async def fire(data):
+        calls.append('hook')
+
+    async def notify_event(event_type, data):
+        calls.append('plugins')
+
+    monkeypatch.setattr(hook, 'fire', fire)
+    monkeypatch.setattr(api.plugin_manager, 'notify_event', notify_event)
+
+    await api._emit_event(EventType.FINDING_DISCOVERED, {'path': '/a'})
+    assert calls == []
+
+    api.on_finding(lambda finding: None)
+    await api._emit_event(EventType.FINDING_DISCOVERED, {'path': '/a'})
+    assert calls == ['hook']
+
+
+def test_configure_updates_known_scan_settings_only():
+    api = DirsearchMCP()
+
+    api.configure(threads=25, timeout=3, keys='ignored', unknown=1)
+
+    scan_config = api.settings.default_scan_config
+    assert (scan_config['threads'], scan_config['timeout']) == (25, 3)
+    assert 'unknown' not in scan_config and 'keys' not in scan_config
+
+
+@pytest.mark.asyncio
+async def test_scan_request_copies_shared_scan_options(monkeypatch):
+    api = DirsearchMCP()
+    options = ScanOptions(wordlist='big.txt', extensions=['php'], threads=7, proxy='http://proxy:8080',
+                          include_status='200', use_mcp=False)
+    requests = []
+
+    async def analyze_target(url):
+        return TargetData(url=url, domain='example.com')
+
+    async def execute_scan(request):
+        requests.append(request)
+        return SimpleNamespace(results=[], statistics={}, total_paths=0)
+
+    monkeypatch.setattr(api, 'analyze_target', analyze_target)
+    monkeypatch.setattr(api, '_execute_scan_with_progress', execute_scan)
+    monkeypatch.setattr(api, 'mcp', SimpleNamespace(intelligence_mode='LOCAL'), raising=False)
+
+    await api.scan('http://example.com', options)
+
+    request = requests[0]
+    assert request.base_url == 'http://example.com'
+    assert (request.wordlist, request.extensions, request.threads) == ('big.txt', ['php'], 7)
+    assert (request.proxy, request.include_status) == ('http://proxy:8080', '200')
+    assert request.recursive == ScanRequest.__dataclass_fields__['recursive'].default
+
+
+@pytest.mark.asyncio
+async def test_scan_error_payload_is_built_only_for_listeners(monkeypatch):
+    from src.integration import interface
+
+    api = DirsearchMCP()
+    real_datetime = interface.datetime
+
+    async def analyze_target(url):
+        raise ValueError('unreachable')
+
+    class Clock:
+        calls = 0
+
+        @classmethod
+        def now(cls):
+            cls.calls += 1
+            return real_datetime.now()
+
+    monkeypatch.setattr(api, 'analyze_target', analyze_target)
+    monkeypatch.setattr(interface, 'datetime', Clock)
+
+    with pytest.raises(ValueError):
+        await api.scan('http://example.com', ScanOptions(use_mcp=False))
+    assert Clock.calls == 0
+
+    errors = []
+    api.on_error(errors.append)
+    with pytest.raises(ValueError):
+        await api.scan('http://example.com', ScanOptions(use_mcp=False))
+    assert Clock.calls == 1
+    assert errors[0]['error'] == 'unreachable' and errors[0]['timestamp']
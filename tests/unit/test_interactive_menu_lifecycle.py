@@ -0,0 +1,28 @@
+import pytest
+
+from src.cli.interactive_menu import InteractiveMenu
+
+
+@pytest.mark.asyncio
+async def test_interactive_run_closes_the_coordinator_on_exit(monkeypatch):
+    menu = InteractiveMenu()
+    closed = []
+
+    async def initialize():
+        pass
+
+    async def close():
+        closed.append(True)
+
+    def show_main_menu():
+        raise EOFError
+
+    monkeypatch.setattr(menu, '_initialize', initialize)
+    monkeypatch.setattr(menu, '_show_main_menu', show_main_menu)
+    monkeypatch.setattr(menu.mcp_coordinator, 'close', close)
+    monkeypatch.setattr(menu.console, 'clear', lambda: None)
+
+    with pytest.raises(SystemExit):
+        await menu._async_run()
+
+    assert closed == [True]
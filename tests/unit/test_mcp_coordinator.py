@@ -3,7 +3,6 @@ import asyncio
 from unittest.mock import Mock, patch, AsyncMock, MagicMock
 import json
 import time
-from datetime import datetime
 
 from src.core.mcp_coordinator import (
     MCPCoordinator, AIAgentConnector, TargetInfo, ScanTask, ScanResult
@@ -136,9 +135,10 @@ class TestAIAgentConnector:
         # 61st request should be blocked
         assert ai_connector._check_rate_limit('openai') is False
         
-        # Simulate time passing
-        ai_connector.rate_limiter['openai']['reset_time'] = time.time() - 61
+        # Simulate time passing (one token refills per second)
+        ai_connector.rate_limiter['openai']['last'] -= 1
         assert ai_connector._check_rate_limit('openai') is True
+        assert ai_connector._check_rate_limit('openai') is False
     
     def test_get_cache_key(self, ai_connector):
         """Test cache key generation"""
@@ -447,7 +447,7 @@ Priority: 80"""
             status='completed',
             findings=[{'path': f'/path{i}', 'status': 200} for i in range(10)],
             metrics={'execution_time': 5.0},
-            timestamp=datetime.now().isoformat()
+            timestamp=time.time()
         )
         
         with patch.object(mcp_coordinator.ai_connector, 'query_ai_agent', 
@@ -468,7 +468,7 @@ Priority: 80"""
                     {'path': '/backup', 'status': 403, 'size': 500}
                 ],
                 metrics={'execution_time': 2.0},
-                timestamp=datetime.now().isoformat()
+                timestamp=time.time()
             ),
             ScanResult(
                 task_id='test2',
@@ -477,7 +477,7 @@ Priority: 80"""
                     {'path': '/api', 'status': 200, 'size': 2000}
                 ],
                 metrics={'execution_time': 1.0},
-                timestamp=datetime.now().isoformat()
+                timestamp=time.time()
             )
         ]
         
@@ -0,0 +1,35 @@
+import pytest
+
+from src.core._patterns import (
+    ENDPOINT_PATTERNS, JS_PATTERNS, CRAWL_URL_RE, SPECIAL_CHARS_RE
+)
+
+
+def _extract(patterns, content):
+    found = set()
+    for pattern in patterns:
+        for match in pattern.findall(content):
+            found.add(match)
+    return found
+
+
+class TestSharedPatterns:
+
+    def test_patterns_are_precompiled_tuples(self):
+        assert isinstance(ENDPOINT_PATTERNS, tuple)
+        assert all(hasattr(p, 'findall') for p in ENDPOINT_PATTERNS)
+
+    @pytest.mark.parametrize("content,expected", [
+        ('fetch("/api/v1/users")', '/api/v1/users'),
+        ('<form method="post" action="/login.php">', '/login.php'),
+        ('<!-- old: /backup/db.sql -->', '/backup/db.sql'),
+    ])
+    def test_endpoint_extraction(self, content, expected):
+        assert expected in _extract(ENDPOINT_PATTERNS, content)
+
+    def test_js_routes(self):
+        assert 'admin/users' in _extract(JS_PATTERNS, "route: 'admin/users'")
+
+    def test_crawl_url_and_special_chars(self):
+        assert CRAWL_URL_RE.findall('<a href="/docs">') == ['/docs']
+        assert len(SPECIAL_CHARS_RE.findall('a/b?c=d&e')) == 3
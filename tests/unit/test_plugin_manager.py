@@ -0,0 +1,140 @@
+import asyncio
+import logging
+import time
+
+import pytest
+
+from src.integration.events import EventType
+from src.integration.plugin_base import Plugin, PluginManager
+
+
+def make_plugin(plugin_name, delay=0.05, fail=False):
+    class SlowPlugin(Plugin):
+        name = plugin_name
+
+        async def initialize(self):
+            await asyncio.sleep(delay)
+            if fail:
+                raise RuntimeError('init failed')
+
+        async def cleanup(self):
+            await asyncio.sleep(delay)
+
+    return SlowPlugin
+
+
+@pytest.mark.asyncio
+async def test_plugins_initialize_and_cleanup_concurrently():
+    manager = PluginManager()
+    for name in ('one', 'two', 'three'):
+        manager.register_plugin(make_plugin(name))
+    manager.register_plugin(make_plugin('broken', fail=True))
+
+    started = time.perf_counter()
+    await manager.initialize_plugins()
+    await manager.cleanup_plugins()
+    elapsed = time.perf_counter() - started
+
+    assert elapsed < 0.15
+    status = {p['name']: (p['enabled'], p['initialized']) for p in manager.list_plugins()}
+    assert status == {'one': (True, True), 'two': (True, True),
+                      'three': (True, True), 'broken': (False, False)}
+
+
+@pytest.mark.asyncio
+async def test_only_overridden_handlers_are_dispatched():
+    seen = []
+
+    class FindingPlugin(Plugin):
+        name = 'findings'
+
+        async def initialize(self):
+            pass
+
+        async def on_finding(self, finding):
+            seen.append(finding['path'])
+
+    manager = PluginManager()
+    manager.register_plugin(FindingPlugin)
+    await manager.initialize_plugins()
+
+    plugin = manager.get_plugin('findings')
+    assert set(plugin._bound_handlers) == {EventType.FINDING_DISCOVERED}
+
+    await manager.notify_event(EventType.FINDING_DISCOVERED, {'path': '/admin'})
+    await manager.notify_event(EventType.PROGRESS_UPDATE, {'processed': 1})
+    plugin.disable()
+    await manager.notify_event(EventType.FINDING_DISCOVERED, {'path': '/login'})
+
+    assert seen == ['/admin']
+
+
+def test_listener_index_follows_reregistration():
+    class FindingPlugin(Plugin):
+        name = 'watcher'
+
+        async def initialize(self):
+            pass
+
+        async def on_finding(self, finding):
+            pass
+
+    class ProgressPlugin(Plugin):
+        name = 'watcher'
+
+        async def initialize(self):
+            pass
+
+        async def on_progress(self, progress):
+            pass
+
+    manager = PluginManager()
+    assert not manager.has_listeners(EventType.FINDING_DISCOVERED)
+
+    manager.register_plugin(FindingPlugin)
+    assert manager.has_listeners(EventType.FINDING_DISCOVERED)
+    assert not manager.has_listeners(EventType.PROGRESS_UPDATE)
+
+    manager.register_plugin(ProgressPlugin)
+    assert not manager.has_listeners(EventType.FINDING_DISCOVERED)
+    assert manager.has_listeners(EventType.PROGRESS_UPDATE)
+
+
+
+def test_plugin_messages_go_through_logging(caplog):
+    manager = PluginManager()
+    manager.logger.addHandler(caplog.handler)
+    try:
+        manager.register_plugin(make_plugin('logged'))
+        manager.get_plugin('logged').log('rules loaded', level='warning')
+    finally:
+        manager.logger.removeHandler(caplog.handler)
+
+    messages = [(r.levelno, r.getMessage()) for r in caplog.records]
+    assert (logging.INFO, 'Registered plugin: logged v1.0.0') in messages
+    assert (logging.WARNING, '[logged] rules loaded') in messages
+
+
+def test_plugins_load_from_directory_concurrently(tmp_path):
+    for index in range(4):
+        (tmp_path / f'plugin_{index}.py').write_text(
+            'import time\n'
+            'from src.integration.plugin_base import Plugin\n'
+            'time.sleep(0.1)\n'
+            f'class Plugin{index}(Plugin):\n'
+            f'    name = "dir_plugin_{index}"\n'
+            '    async def initialize(self):\n'
+            '        pass\n'
+        )
+    (tmp_path / 'plugin_0.json').write_text('{"level": 3}')
+    (tmp_path / 'broken.py').write_text('raise ImportError("missing dependency")\n')
+    (tmp_path / '_private.py').write_text('raise AssertionError("should be skipped")\n')
+    manager = PluginManager()
+
+    started = time.perf_counter()
+    manager.load_plugins_from_directory(str(tmp_path))
+    elapsed = time.perf_counter() - started
+
+    assert elapsed < 0.3
+    assert {p['name'] for p in manager.list_plugins()} == {f'dir_plugin_{i}' for i in range(4)}
+    assert manager.get_plugin('dir_plugin_0').get_config('level') == 3
@@ -0,0 +1,35 @@
+import json
+
+import pytest
+
+from src.utils import fast_json
+from src.utils.reporter import ReportGenerator
+
+
+SCAN_DATA = {
+    'target_url': 'http://example.com',
+    'target_domain': 'example.com',
+    'target_analysis': {'server_type': 'nginx', 'technology_stack': ['php']},
+    'scan_results': [
+        {'path': '/admin', 'status': 200, 'size': 10},
+        {'path': '/café', 'status': 403, 'size': 0},
+    ],
+}
+
+
+@pytest.mark.parametrize('use_orjson', [True, False])
+def test_json_report_is_utf8_indented_json(tmp_path, monkeypatch, use_orjson):
+    if use_orjson:
+        pytest.importorskip('orjson')
+    else:
+        monkeypatch.setattr(fast_json, '_orjson', False)
+    generator = ReportGenerator(str(tmp_path))
+
+    path = generator._generate_json_report(SCAN_DATA, 'report')
+
+    text = path.read_text(encoding='utf-8')
+    assert '/café' in text
+    assert text.startswith('{\n  "target"')
+    report = json.loads(text)
+    assert report['target']['server_type'] == 'nginx'
+    assert report['scan_summary']['findings_count'] == 2
@@ -0,0 +1,143 @@
+import asyncio
+
+import pytest
+
+from src.core.mcp_coordinator import MCPCoordinator, ScanResult, ScanTask, TargetInfo
+
+
+@pytest.mark.asyncio
+async def test_execute_scan_plan_runs_tiers_concurrently():
+    coordinator = MCPCoordinator(config=None)
+    events = []
+    execute = coordinator._execute_directory_scan
+
+    async def tracked(task):
+        events.append(('start', task.task_id))
+        await asyncio.sleep(0.01)
+        events.append(('end', task.task_id))
+        return await execute(task)
+
+    coordinator._execute_directory_scan = tracked
+    tasks = [
+        ScanTask('low', 'directory_enumeration', 50, {}),
+        ScanTask('high_1', 'directory_enumeration', 90, {}),
+        ScanTask('high_2', 'directory_enumeration', 90, {}),
+        ScanTask('other', 'unknown', 50, {}),
+    ]
+
+    results = await coordinator.execute_scan_plan(tasks)
+
+    assert [r.task_id for r in results] == ['low', 'high_1', 'high_2', 'other']
+    assert results[3].status == 'skipped'
+    # Both high priority tasks start before either finishes, and before the low tier
+    assert events[:2] == [('start', 'high_1'), ('start', 'high_2')]
+    assert events[-2:] == [('start', 'low'), ('end', 'low')]
+
+
+@pytest.mark.asyncio
+async def test_execute_scan_plan_runs_with_a_non_positive_concurrency_limit():
+    coordinator = MCPCoordinator(config=None)
+    coordinator.config = type('Config', (), {'performance': {'max_concurrent_tasks': 0}})()
+
+    results = await asyncio.wait_for(
+        coordinator.execute_scan_plan([ScanTask('other', 'unknown', 50, {})]), timeout=1)
+
+    assert [r.status for r in results] == ['skipped']
+
+
+@pytest.mark.asyncio
+async def test_execute_scan_plan_cancels_the_tier_when_a_task_fails():
+    coordinator = MCPCoordinator(config=None)
+    cancelled = []
+
+    async def dispatch(task):
+        if task.task_id == 'broken':
+            raise RuntimeError('scan failed')
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.append(task.task_id)
+            raise
+
+    coordinator._dispatch_task = dispatch
+    tasks = [ScanTask('slow', 'directory_enumeration', 90, {}),
+             ScanTask('broken', 'directory_enumeration', 90, {}),
+             ScanTask('low', 'directory_enumeration', 10, {})]
+
+    with pytest.raises(RuntimeError):
+        await asyncio.wait_for(coordinator.execute_scan_plan(tasks), timeout=1)
+
+    assert cancelled == ['slow']
+
+
+def test_scan_summary_top_findings():
+    coordinator = MCPCoordinator(config=None)
+    results = [
+        ScanResult('a', 'completed', [{'path': f'/a{i}', 'status': 404 - i, 'size': i}
+                                      for i in range(8)], {}, 0.0),
+        ScanResult('b', 'completed', [{'path': '/b', 'status': 200, 'size': 10},
+                                      {'path': '/c', 'status': 200, 'size': 50},
+                                      {'path': '/d'}, {'path': '/e', 'status': 200}], {}, 0.0),
+    ]
+
+    summary = coordinator.get_scan_summary(results)
+
+    assert summary['total_findings'] == 12
+    assert [f['path'] for f in summary['top_findings']] == [
+        '/c', '/b', '/e', '/a7', '/a6', '/a5', '/a4', '/a3', '/a2', '/a1']
+    assert summary['top_findings'][0] == {'task_id': 'b', 'path': '/c', 'status': 200, 'size': 50}
+
+
+@pytest.mark.parametrize('server, throttled', [
+    ('CloudFlare', True),
+    ('AkamaiGHost', True),
+    ('nginx/1.18.0', False),
+    (None, False),
+])
+def test_local_optimization_throttles_waf_fronted_targets(server, throttled):
+    coordinator = MCPCoordinator(config=None)
+    target = TargetInfo(url='http://example.com', domain='example.com', server_type=server)
+
+    params = coordinator._apply_local_optimization(
+        target, {'threads': 20, 'timeout': 10, 'delay': 0, 'user_agent': 'test'})
+
+    assert (params['threads'] == 5 and params['delay'] == 0.5) is throttled
+
+
+@pytest.mark.asyncio
+async def test_ai_is_asked_again_for_a_profile_until_a_plan_arrives():
+    coordinator = MCPCoordinator(config=None)
+    coordinator.intelligence_mode = 'AI_AGENT'
+    target = TargetInfo(url='http://a.example', domain='a.example', server_type='nginx')
+    replies = [None, [ScanTask('ai', 'directory_enumeration', 90, {})]]
+    asked = []
+
+    async def get_ai_scan_plan(target_info):
+        asked.append(target_info.url)
+        return replies.pop(0) if replies else None
+
+    coordinator._get_ai_scan_plan = get_ai_scan_plan
+
+    await coordinator.generate_scan_plan(target)
+    plan = await coordinator.generate_scan_plan(target)
+    await coordinator.generate_scan_plan(TargetInfo(url='http://b.example', domain='b.example',
+                                                    server_type='nginx'))
+
+    assert [task.task_id for task in plan] == ['ai']
+    assert asked == ['http://a.example', 'http://a.example']
+
+
+@pytest.mark.asyncio
+async def test_unplanned_ai_plans_are_bounded_and_released_on_close():
+    coordinator = MCPCoordinator(config=None)
+    limit = coordinator._ai_plans.max_size
+    for i in range(limit + 10):
+        coordinator._ai_plans[f'http://{i}.example'] = [ScanTask(f'ai_{i}', 'directory_enumeration', 90, {})]
+
+    assert len(coordinator._ai_plans) == limit
+    assert coordinator._ai_plans.pop('http://0.example') is None
+    assert coordinator._ai_plans.pop(f'http://{limit + 9}.example')[0].task_id == f'ai_{limit + 9}'
+
+    await coordinator.close()
+
+    assert len(coordinator._ai_plans) == 0
@@ -0,0 +1,91 @@
+import json
+
+import pytest
+
+from src.core import intelligent_scanner
+from src.core.intelligent_scanner import IntelligentScanner
+
+
+@pytest.fixture
+def scanner():
+    return IntelligentScanner()
+
+
+class TestRuleMatching:
+
+    @pytest.mark.parametrize("path,expected", [
+        ('/admin/login', 'admin'),
+        ('/API/v2/users', 'api'),
+        ('/wp-admin/', 'cms'),
+        ('/vendor/composer.json', 'packages'),
+    ])
+    def test_highest_priority_rule_first(self, scanner, path, expected):
+        rules = scanner.analyze_path(path, 200)
+        assert rules[0][0] == expected
+        priorities = [rule.priority for _, rule in rules]
+        assert priorities == sorted(priorities, reverse=True)
+
+    def test_overlapping_rules_all_reported(self, scanner):
+        names = {name for name, _ in scanner.analyze_path('/graphql', 200)}
+        assert {'api', 'graphql'} <= names
+
+    def test_no_match(self, scanner):
+        assert scanner.analyze_path('/images/logo.png', 200) == []
+
+    def test_priority_paths_order(self, scanner):
+        paths = ['/images/a', '/static/b', '/admin', '/foo']
+        assert scanner.get_priority_paths(paths) == ['/admin', '/static/b', '/images/a', '/foo']
+
+    def test_dotfile_rules(self, scanner):
+        assert [name for name, _ in scanner.analyze_path('/.git/HEAD', 200)] == ['vcs', 'hidden']
+        assert [name for name, _ in scanner.analyze_path('/.env', 200)] == ['hidden']
+
+
+    def test_export_import_roundtrip(self, scanner, tmp_path):
+        rules_file = tmp_path / "rules.json"
+        scanner.export_rules(str(rules_file))
+
+        imported = IntelligentScanner()
+        imported.rules = {}
+        imported.import_rules(str(rules_file))
+
+        assert imported.rules == scanner.rules
+        assert imported.analyze_path('/admin/x', 200) == scanner.analyze_path('/admin/x', 200)
+
+    def test_scan_strategy_deduplicates_paths(self, scanner):
+        discovered = [{'path': '/admin', 'status': 200}, {'path': '/admin', 'status': 403},
+                      {'path': '/admin/users', 'status': 200}]
+        strategy = scanner.get_scan_strategy('https://example.com', discovered)
+
+        assert strategy['priority_paths'] == ['/admin', '/admin/users']
+        admin_words = strategy['custom_wordlists']['admin']
+        assert admin_words == list(dict.fromkeys(scanner.rules['admin'].keywords))
+
+
+    @pytest.mark.parametrize("pattern", ['^/secret', '/secret$', r'\A/secret', r'(?<=\w)/secret'])
+    def test_batched_priorities_keep_per_path_semantics(self, monkeypatch, tmp_path, pattern):
+        # Without pyahocorasick all paths are prioritized in one pass over the joined paths
+        monkeypatch.setattr(intelligent_scanner, 'ahocorasick', None)
+        rules_file = tmp_path / "rules.json"
+        rules_file.write_text(json.dumps({
+            'a': {'pattern': pattern, 'priority': 90, 'keywords': []},
+            'b': {'pattern': '/zzz', 'priority': 10, 'keywords': []},
+        }))
+        scanner = IntelligentScanner()
+        scanner.import_rules(str(rules_file))
+
+        secret = 'x/secret' if pattern.startswith('(?<=') else '/secret'
+        assert scanner.analyze_path(secret, 200)[0][0] == 'a'
+        assert scanner.get_priority_paths(['/other', secret, '/zzz']) == [secret, '/zzz', '/other']
+
+
+class TestPriorityQueue:
+
+    def test_bands_and_fifo(self, scanner):
+        for path in ['/foo', '/static/x', '/admin', '/bar', '/admin/users']:
+            scanner.enqueue_path(path)
+        scanner.enqueue_path('/custom', 250)
+
+        order = [scanner.dequeue_path() for _ in range(6)]
+        assert order == ['/admin', '/admin/users', '/custom', '/static/x', '/foo', '/bar']
+        assert scanner.dequeue_path() is None
@@ -0,0 +1,129 @@
+import pytest
+
+from src.integration.data_formats import TargetData
+from src.integration.plugins import wappalyzer_plugin
+from src.integration.plugins.wappalyzer_plugin import WappalyzerPlugin
+
+
+PAGE = (
+    '<html><head><meta name="generator" content="WordPress 6.4">'
+    '<link href="/css/bootstrap.min.css"><script src="/js/jquery-3.7.1.js"></script>'
+    '</head><body><div data-reactroot></div></body></html>'
+)
+
+
+class FakeResponse:
+    def __init__(self, html, headers):
+        self._html = html
+        self.headers = headers
+
+    async def read(self):
+        return self._html.encode('utf-8') if isinstance(self._html, str) else self._html
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+
+class FakeSession:
+    def __init__(self, html, headers, pages=None):
+        self.response = FakeResponse(html, headers)
+        self.pages = pages or {}
+        self.urls = []
+
+    def get(self, url, **kwargs):
+        self.urls.append(url)
+        page = self.pages.get(url, self.response)
+        if isinstance(page, Exception):
+            raise page
+        return page
+
+
+async def make_plugin(html=PAGE, headers=None, probe_paths=()):
+    plugin = WappalyzerPlugin({'probe_paths': list(probe_paths)})
+    await plugin._load_technologies_db()
+    plugin.session = FakeSession(html, headers or {'Server': 'nginx/1.25'})
+    return plugin
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize('use_automaton', [True, False])
+async def test_detect_technologies_matches_each_pattern_kind(monkeypatch, use_automaton):
+    if use_automaton:
+        pytest.importorskip('ahocorasick')
+    else:
+        monkeypatch.setattr(wappalyzer_plugin, 'ahocorasick', None)
+    plugin = await make_plugin()
+
+    detected = await plugin._detect_technologies(TargetData(url='http://example.com', domain='example.com'))
+
+    assert detected == ['WordPress', 'PHP', 'MySQL', 'React', 'jQuery', 'Bootstrap', 'Nginx']
+
+
+@pytest.mark.asyncio
+async def test_meta_rule_needs_name_and_content():
+    plugin = await make_plugin()
+
+    matched = plugin._match_technologies('<p>Powered by WordPress</p>', {}, TargetData(url='', domain=''))
+
+    assert matched == set()
+
+
+@pytest.mark.asyncio
+async def test_repeat_analysis_of_a_domain_is_served_from_cache():
+    plugin = await make_plugin()
+    first = TargetData(url='http://example.com/a', domain='example.com')
+    second = TargetData(url='http://example.com/b', domain='example.com')
+
+    await plugin.on_target_analyzed(first)
+    await plugin.on_target_analyzed(second)
+
+    assert plugin.session.urls == ['http://example.com/a']
+    assert second.technology_stack == first.technology_stack
+    assert second.detected_cms == 'WordPress'
+
+
+@pytest.mark.asyncio
+async def test_session_uses_pooled_connector_closed_on_cleanup():
+    plugin = WappalyzerPlugin()
+    await plugin.initialize()
+    connector = plugin.session.connector
+
+    assert connector.limit_per_host == 8
+    await plugin.cleanup()
+    assert connector.closed and plugin.session is None
+
+
+@pytest.mark.asyncio
+async def test_probe_pages_are_fetched_and_merged():
+    plugin = await make_plugin(html='<html></html>', headers={'Server': 'nginx'},
+                               probe_paths=['/robots.txt', '/missing'])
+    plugin.session.pages = {
+        'http://example.com/robots.txt': FakeResponse('Disallow: /wp-content/', {'Server': 'Apache'}),
+        'http://example.com/missing': OSError('connection reset'),
+    }
+
+    detected = await plugin._detect_technologies(TargetData(url='http://example.com/app/', domain='example.com'))
+
+    assert plugin.session.urls == ['http://example.com/app/', 'http://example.com/robots.txt',
+                                   'http://example.com/missing']
+    assert detected == ['WordPress', 'PHP', 'MySQL', 'Nginx']
+
+
+def test_default_probes_include_robots_and_a_fixed_missing_page():
+    plugin = WappalyzerPlugin()
+
+    assert plugin.probe_paths[0] == '/robots.txt'
+    assert plugin.probe_paths[1].startswith('/nonexistent-')
+
+
+@pytest.mark.asyncio
+async def test_undecodable_bodies_are_matched_as_bytes():
+    body = '<p>Café</p><script src="/wp-content/x.js"></script>'.encode('latin-1')
+    plugin = await make_plugin(html=body, headers={'X-Powered-By': 'PHP/8.2'})
+
+    detected = await plugin._detect_technologies(TargetData(url='http://example.com', domain='example.com'))
+
+    assert detected == ['WordPress', 'PHP', 'MySQL']